@@ -10,25 +10,57 @@ Fitur utama yang telah diperbarui:
 - Pindahkan Objek: Klik dan tahan pada objek terpilih untuk menggesernya.
 - Copy/Paste: Gunakan Ctrl+C dan Ctrl+V untuk duplikasi objek. (BUGFIXED)
 - Manajemen Objek: Pilih Semua (Ctrl+A) dan Hapus Objek Terpilih (Delete).
-
-
-Versi: 1.7.1
+- Baris Perintah: Scene (.json), transformasi awal, clipping window, dan skrip
+  interaksi dapat diberikan saat menjalankan program (lihat --help).
+- Rekam & Replay: Input dapat direkam (--record) dan diputar ulang (--replay),
+  juga tanpa window (--headless), dengan laporan latensi handler dan waktu frame.
+- Engine Terpisah: State scene dan seluruh logika geometri ada di kelas Canvas
+  (engine_2d.py) yang tidak bergantung pada OpenGL; modul ini hanya adaptor GLUT.
+- Penjadwal Frame: Input hanya menandai area yang berubah; frame digambar paling
+  banyak sekali per interval (--fps) dan hanya area rusak yang digambar ulang.
+- Export Vektor: Objek diekspor ke SVG/PDF (X) dengan transformasi diterapkan,
+  tidak terbatas pada resolusi window (lihat vector_export.py).
+- Render Resolusi Tinggi: Canvas dirender per tile ke PNG selebar apa pun
+  (--render, perintah skrip `render`), lihat tiled_render.py.
+- Penyimpanan Kolom: Objek disimpan sebagai kolom NumPy (object_store.py);
+  culling, warna clipping window, seleksi marquee, dan geser objek terpilih
+  dihitung sebagai operasi array untuk seluruh scene.
+- Clipping GPU: Dengan --clip-mode gpu (atau tombol K) clipping window menjadi
+  clip plane OpenGL; geometri dikirim utuh dan dipotong oleh rasterizer.
+- Startup Cepat: PyOpenGL baru dimuat saat main() membuat window (gl_loader.py);
+  --headless tidak memuatnya sama sekali.
+- Transformasi Grup: Rotasi dan skala (Q/A/W/S) memutar seluruh seleksi di
+  sekitar satu pivot bersama dengan satu operasi matriks untuk semua objek
+  (O beralih ke pivot per objek). Transformasi dapat dilipat ke data vertex (B).
+
+
+Versi: 2.0
 """
 
 # Import library yang diperlukan
+import os
 import sys
-import copy
-from math import sin, cos, pi, sqrt, radians, degrees
+import argparse
+from math import sin, cos, pi, floor, ceil
 
 try:
-    from OpenGL.GL import *
-    from OpenGL.GLUT import *
-    from OpenGL.GLU import *
+    import numpy as np
 except ImportError:
-    print("Error: PyOpenGL tidak terinstal.")
-    print("Silakan instal dengan perintah: pip install PyOpenGL PyOpenGL_accelerate")
+    print("Error: NumPy tidak terinstal.")
+    print("Silakan instal dengan perintah: pip install numpy")
     sys.exit(1)
 
+import gl_loader
+import input_events
+import frame_scheduler
+import vector_export
+import tiled_render
+from engine_2d import Canvas, stroke_margin
+from object_store import TYPE_CODES
+
+# Nama GL/GLU/GLUT diikat saat main() memuat PyOpenGL (lihat gl_loader.py)
+gl_loader.bind(globals())
+
 # =============================================================================
 # 1. PENGELOLAAN STATE DAN VARIABEL GLOBAL
 # =============================================================================
@@ -37,10 +69,8 @@ except ImportError:
 window_width = 1280
 window_height = 720
 
-# List untuk menyimpan semua objek yang digambar
-objects = []
-selected_indices = []
-clipboard = []
+# Engine canvas: menyimpan objek, seleksi, clipboard, dan clipping window
+canvas = Canvas()
 
 # State aplikasi
 current_mode = 'select'
@@ -48,6 +78,10 @@ is_drawing = False
 is_dragging_selection = False
 drag_last_pos = {'x': 0, 'y': 0}
 
+# Rotasi/skala seleksi: True = satu grup di sekitar pivot bersama
+# (Canvas.selection_pivot), False = setiap objek di sekitar pusatnya sendiri
+group_pivot = True
+
 # Atribut objek baru
 current_color = (0.0, 0.0, 0.0)
 current_thickness = 1.0
@@ -57,15 +91,27 @@ temp_vertex = None
 ghost_object = None
 selection_box = None
 
-# Definisi clipping window
-clipping_window = {
-    'xmin': 100, 'ymin': 100, 'xmax': 500, 'ymax': 400,
-    'active': False,
-    'color': (1.0, 0.0, 0.0),
-}
+# True saat skrip/rekaman diputar tanpa window (tidak ada konteks GLUT)
+headless = False
 
-# Konstanta Cohen-Sutherland
-C_INSIDE, C_LEFT, C_RIGHT, C_BOTTOM, C_TOP = 0, 1, 2, 4, 8
+# Lapisan objek: framebuffer offscreen yang menyimpan gambar semua objek, sehingga
+# frame berikutnya cukup menggambar ulang area yang rusak lalu menyalinnya ke layar.
+# fbo = 0 berarti FBO tidak didukung dan semua objek digambar ulang setiap frame.
+object_layer = {'fbo': None, 'rbo': None, 'size': None}
+
+# Pengali ukuran titik dan ketebalan garis saat render resolusi tinggi
+render_scale = 1.0
+
+# Cara memotong objek dengan clipping window:
+# 'cpu' = Cohen-Sutherland dan pemecahan goresan di Python setiap frame,
+# 'gpu' = window menjadi 4 clip plane (glClipPlane) dan geometri dikirim utuh.
+CLIP_MODES = ('cpu', 'gpu')
+clip_mode = 'cpu'
+
+# Titik lingkaran satuan untuk elips (cos, sin), dipakai saat elips dikirim sebagai vertex array
+ELLIPSE_SEGMENTS = 100
+UNIT_CIRCLE = np.column_stack([np.cos(2.0 * pi * np.arange(ELLIPSE_SEGMENTS) / ELLIPSE_SEGMENTS),
+                               np.sin(2.0 * pi * np.arange(ELLIPSE_SEGMENTS) / ELLIPSE_SEGMENTS)])
 
 
 # =============================================================================
@@ -75,7 +121,7 @@ C_INSIDE, C_LEFT, C_RIGHT, C_BOTTOM, C_TOP = 0, 1, 2, 4, 8
 def print_instructions():
     """Mencetak panduan penggunaan ke konsol."""
     print("=" * 60)
-    print("      Aplikasi Grafika 2D Interaktif - PyOpenGL v1.7.1")
+    print("      Aplikasi Grafika 2D Interaktif - PyOpenGL v2.0")
     print("=" * 60)
     print("--- MODE ---")
     print("  [P] Titik | [L] Garis | [R] Persegi | [E] Elips | [F] Freehand")
@@ -87,17 +133,20 @@ def print_instructions():
     print("  [Shift+Klik] atau [Shift+Seret] untuk menambah/mengurangi objek.")
     print("  [Ctrl+A] untuk memilih semua objek.")
     print("  Gunakan Panah untuk Translasi, [Q/A] untuk Rotasi, [W/S] untuk Skala.")
+    print("  [O] Pivot grup / pivot per objek | [B] Lipat transformasi ke vertex (bake)")
     print("\n--- MANAJEMEN OBJEK ---")
     print("  [Ctrl+C] : Copy objek terpilih.")
     print("  [Ctrl+V] : Paste objek dari clipboard.")
     print("  [DELETE] / [BACKSPACE] : Hapus objek yang dipilih.")
     print("  [Shift+DELETE] : Hapus SEMUA objek (Clear All).")
+    print("  [X] : Export ke export_NNN.svg (dipotong clipping window jika aktif).")
     print("\n--- WARNA & KETEBALAN ---")
     print("  [1] Hitam | [2] Merah | [3] Hijau | [4] Biru")
     print("  [+/-] Ubah Ketebalan Garis")
     print("\n--- WINDOWING & CLIPPING ---")
     print("  [C] Buat Window (Klik & Seret) | [D] Nonaktifkan Window")
     print("  [G] Masuk mode Geser/Resize Window (Gunakan Panah / Shift+Panah)")
+    print("  [K] Ganti clipping CPU (Cohen-Sutherland) / GPU (clip plane)")
     print("=" * 60)
 
 
@@ -105,215 +154,178 @@ def print_instructions():
 # 3. FUNGSI HELPER, MATEMATIKA, DAN ALGORITMA
 # =============================================================================
 
-def create_object(obj_type, vertices, color, thickness):
-    """Membuat dictionary objek baru dan menambahkannya ke list."""
-    global objects, selected_indices
-    new_obj = {
-        'type': obj_type,
-        'vertices': vertices,
-        'color': color,
-        'thickness': thickness,
-        'transform': {'translate': [0, 0], 'rotate': 0.0, 'scale': [1.0, 1.0]}
-    }
-    objects.append(new_obj)
-    selected_indices = [len(objects) - 1]
+def request_redisplay(damage=None, overlay_only=False):
+    """Meminta frame baru lewat penjadwal frame; diabaikan saat berjalan headless.
+
+    Tanpa argumen seluruh lapisan objek digambar ulang. `damage` membatasi
+    penggambaran ulang pada persegi (xmin, ymin, xmax, ymax), sedangkan
+    `overlay_only` hanya menggambar ulang ghost, clipping window, dan kotak seleksi.
+    """
+    if headless: return
+    if damage is not None or overlay_only:
+        frame_scheduler.request_redraw(damage)
+    else:
+        frame_scheduler.request_redraw(full=True)
+
+
+def transform_selected(operation, *args):
+    """Menjalankan transformasi canvas pada objek terpilih dan menandai area lama + barunya."""
+    before = canvas.get_bounds(canvas.selected_indices)
+    operation(*args)
+    after = canvas.get_bounds(canvas.selected_indices)
+    if before is not None and after is not None:
+        request_redisplay(damage=frame_scheduler.union_rect(before, after))
+    else:
+        request_redisplay()
+
+
+def request_selection_redisplay(before, object_count):
+    """Menandai area objek yang status seleksinya berubah dari `before`, ditambah objek baru sejak `object_count`.
+
+    Mengembalikan False jika tidak ada yang berubah (tidak ada frame yang diminta).
+    """
+    changed = set(before).symmetric_difference(canvas.selected_indices)
+    changed.update(range(object_count, len(canvas.objects)))
+    if not changed: return False
+    bounds = canvas.get_bounds(changed)
+    if bounds is not None:
+        request_redisplay(damage=bounds)
+    else:
+        request_redisplay()
+    return True
+
+
+def toggle_group_pivot():
+    """Beralih antara rotasi/skala seleksi sebagai grup dan per objek."""
+    global group_pivot
+    group_pivot = not group_pivot
+    print(f"Pivot rotasi/skala: {'grup (pusat seleksi)' if group_pivot else 'per objek'}.")
+
+
+def bake_selected_objects():
+    """Melipat transformasi objek terpilih ke data vertex-nya (tampilan tidak berubah)."""
+    if not canvas.selected_indices:
+        print("Tidak ada objek yang dipilih untuk di-bake.")
+        return
+    print(f"Transformasi {canvas.bake_selected()} objek dilipat ke vertex.")
+    request_redisplay()
 
 
 def copy_selected_objects():
     """Menyalin objek terpilih ke clipboard."""
-    global clipboard
-    if not selected_indices:
+    count = canvas.copy_selected()
+    if not count:
         print("Tidak ada objek yang dipilih untuk di-copy.")
         return
-    clipboard.clear()
-    for index in selected_indices:
-        clipboard.append(copy.deepcopy(objects[index]))
-    print(f"{len(clipboard)} objek di-copy ke clipboard.")
+    print(f"{count} objek di-copy ke clipboard.")
 
 
 def paste_objects():
     """Menempelkan objek dari clipboard."""
-    global objects, selected_indices
-    if not clipboard:
+    if not canvas.clipboard:
         print("Clipboard kosong.")
         return
-    new_indices = []
-    for obj_to_paste in clipboard:
-        new_obj = copy.deepcopy(obj_to_paste)
-        new_obj['transform']['translate'][0] += 15
-        new_obj['transform']['translate'][1] += 15
-        objects.append(new_obj)
-        new_indices.append(len(objects) - 1)
-    selected_indices = new_indices
-    print(f"{len(new_indices)} objek di-paste.")
-    glutPostRedisplay()
+    print(f"{canvas.paste()} objek di-paste.")
+    request_redisplay()
 
 
 def delete_selected_objects():
     """Menghapus semua objek yang sedang dipilih."""
-    global objects, selected_indices
-    if not selected_indices: return
-    print(f"Menghapus {len(selected_indices)} objek terpilih...")
-    objects = [obj for i, obj in enumerate(objects) if i not in selected_indices]
-    selected_indices.clear()
-    glutPostRedisplay()
+    if not canvas.selected_indices: return
+    print(f"Menghapus {len(canvas.selected_indices)} objek terpilih...")
+    canvas.delete_selected()
+    request_redisplay()
 
 
 def clear_all():
     """Menghapus semua objek dari canvas."""
-    global objects, selected_indices
     print("Menghapus semua objek...");
-    objects.clear();
-    selected_indices.clear();
-    glutPostRedisplay()
+    canvas.clear();
+    request_redisplay()
 
 
 def select_all():
     """Memilih semua objek di canvas."""
-    global selected_indices
-    selected_indices = list(range(len(objects)))
-    print(f"Memilih semua ({len(selected_indices)}) objek.");
-    glutPostRedisplay()
-
-
-def get_object_center(obj):
-    if not obj['vertices']: return (0, 0)
-    if obj['type'] in ['point', 'ellipse', 'freehand']: return obj['vertices'][0]
-    x_coords = [v[0] for v in obj['vertices']];
-    y_coords = [v[1] for v in obj['vertices']]
-    return (sum(x_coords) / len(x_coords), sum(y_coords) / len(y_coords))
-
-
-def get_transformed_vertex(vertex, obj):
-    center = get_object_center(obj);
-    tr = obj['transform']
-    vx, vy = vertex[0] - center[0], vertex[1] - center[1]
-    vx, vy = vx * tr['scale'][0], vy * tr['scale'][1]
-    angle_rad = radians(tr['rotate']);
-    cos_a, sin_a = cos(angle_rad), sin(angle_rad)
-    rvx = vx * cos_a - vy * sin_a;
-    rvy = vx * sin_a + vy * cos_a
-    final_x = rvx + center[0] + tr['translate'][0];
-    final_y = rvy + center[1] + tr['translate'][1]
-    return (final_x, final_y)
-
-
-def get_object_aabb(obj):
-    if not obj['vertices']: return None
-    if obj['type'] == 'ellipse':
-        center_x, center_y = obj['vertices'][0]
-        rx = abs(obj['vertices'][1][0] - center_x);
-        ry = abs(obj['vertices'][1][1] - center_y)
-        verts_to_check = [(center_x + rx, center_y), (center_x - rx, center_y), (center_x, center_y + ry),
-                          (center_x, center_y - ry)]
-    else:
-        verts_to_check = obj['vertices']
-    transformed_verts = [get_transformed_vertex(v, obj) for v in verts_to_check]
-    min_x = min(v[0] for v in transformed_verts);
-    max_x = max(v[0] for v in transformed_verts)
-    min_y = min(v[1] for v in transformed_verts);
-    max_y = max(v[1] for v in transformed_verts)
-    return (min_x, min_y, max_x, max_y)
-
-
-def get_inverse_transformed_point(x, y, obj):
-    center = get_object_center(obj);
-    tr = obj['transform']
-    px, py = x - tr['translate'][0], y - tr['translate'][1]
-    px, py = px - center[0], py - center[1]
-    angle_rad = radians(-tr['rotate']);
-    cos_a, sin_a = cos(angle_rad), sin(angle_rad)
-    rpx = px * cos_a - py * sin_a;
-    rpy = px * sin_a + py * cos_a
-    px, py = rpx, rpy
-    sx = tr['scale'][0] if tr['scale'][0] != 0 else 1.0;
-    sy = tr['scale'][1] if tr['scale'][1] != 0 else 1.0
-    px, py = px / sx, py / sy
-    final_px, final_py = px + center[0], py + center[1]
-    return final_px, final_py
-
-
-def dist_sq(p1, p2):
-    return (p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2
-
-
-def is_point_on_object(x, y, obj):
-    ix, iy = get_inverse_transformed_point(x, y, obj)
-    tolerance_sq = (obj['thickness'] * 3 + 3) ** 2
-    obj_type, verts = obj['type'], obj['vertices']
-    if obj_type == 'point':
-        return dist_sq((ix, iy), verts[0]) < tolerance_sq * 2
-    elif obj_type == 'line':
-        p, v, w = (ix, iy), verts[0], verts[1];
-        l2 = dist_sq(v, w)
-        if l2 == 0: return dist_sq(p, v) < tolerance_sq
-        t = max(0, min(1, ((p[0] - v[0]) * (w[0] - v[0]) + (p[1] - v[1]) * (w[1] - v[1])) / l2))
-        proj = (v[0] + t * (w[0] - v[0]), v[1] + t * (w[1] - v[1]))
-        return dist_sq(p, proj) < tolerance_sq
-    elif obj_type == 'rectangle':
-        x_coords = sorted([verts[0][0], verts[1][0]]);
-        y_coords = sorted([verts[0][1], verts[1][1]])
-        return (x_coords[0] <= ix <= x_coords[1] and y_coords[0] <= iy <= y_coords[1])
-    elif obj_type == 'ellipse':
-        center = verts[0];
-        rx, ry = abs(verts[1][0] - center[0]), abs(verts[1][1] - center[1])
-        if rx == 0 or ry == 0: return False
-        val = ((ix - center[0]) ** 2 / rx ** 2) + ((iy - center[1]) ** 2 / ry ** 2)
-        return val <= 1.1
-    elif obj_type == 'freehand':
-        for i in range(len(verts) - 1):
-            if is_point_on_object(x, y,
-                                  {'type': 'line', 'vertices': [verts[i], verts[i + 1]], 'thickness': obj['thickness'],
-                                   'transform': obj['transform']}):
-                return True
-    return False
-
-
-def is_object_fully_inside_window(obj):
-    if not obj['vertices']: return False
-    aabb = get_object_aabb(obj)
-    if not aabb: return False
-    return (clipping_window['xmin'] <= aabb[0] and aabb[2] <= clipping_window['xmax'] and
-            clipping_window['ymin'] <= aabb[1] and aabb[3] <= clipping_window['ymax'])
-
-
-def compute_outcode(x, y):
-    code = C_INSIDE
-    if x < clipping_window['xmin']:
-        code |= C_LEFT
-    elif x > clipping_window['xmax']:
-        code |= C_RIGHT
-    if y < clipping_window['ymin']:
-        code |= C_BOTTOM
-    elif y > clipping_window['ymax']:
-        code |= C_TOP
-    return code
-
-
-def cohen_sutherland_clip(x1, y1, x2, y2):
-    outcode1, outcode2 = compute_outcode(x1, y1), compute_outcode(x2, y2)
-    accept = False
-    while True:
-        if not (outcode1 | outcode2):
-            accept = True; break
-        elif (outcode1 & outcode2):
-            break
-        else:
-            x, y = 0, 0
-            outcode_out = outcode1 if outcode1 else outcode2
-            if outcode_out & C_TOP:
-                x = x1 + (x2 - x1) * (clipping_window['ymax'] - y1) / (y2 - y1); y = clipping_window['ymax']
-            elif outcode_out & C_BOTTOM:
-                x = x1 + (x2 - x1) * (clipping_window['ymin'] - y1) / (y2 - y1); y = clipping_window['ymin']
-            elif outcode_out & C_RIGHT:
-                y = y1 + (y2 - y1) * (clipping_window['xmax'] - x1) / (x2 - x1); x = clipping_window['xmax']
-            elif outcode_out & C_LEFT:
-                y = y1 + (y2 - y1) * (clipping_window['xmin'] - x1) / (x2 - x1); x = clipping_window['xmin']
-            if outcode_out == outcode1:
-                x1, y1 = x, y; outcode1 = compute_outcode(x1, y1)
-            else:
-                x2, y2 = x, y; outcode2 = compute_outcode(x2, y2)
-    return (True, x1, y1, x2, y2) if accept else (False, 0, 0, 0, 0)
+    print(f"Memilih semua ({canvas.select_all()}) objek.");
+    request_redisplay()
+
+
+def save_scene(filename):
+    """Menyimpan semua objek dan clipping window ke file scene .json."""
+    canvas.save_scene(filename)
+    print(f"Scene ({len(canvas.objects)} objek) disimpan ke '{filename}'.")
+
+
+def export_vector(filename, clip=False):
+    """Mengekspor objek ke file .svg/.pdf dengan transformasi diterapkan."""
+    try:
+        vector_export.export_vector(canvas, filename, window_width, window_height, clip)
+    except (OSError, ValueError) as e:
+        print(f"Error: Gagal mengekspor '{filename}': {e}")
+        return
+    print(f"{len(canvas.objects)} objek diekspor ke '{filename}'.")
+
+
+def render_image(filename, width=None):
+    """Merender objek per tile ke file .png/.ppm; lebar default 4x lebar window."""
+    global render_scale
+    if headless:
+        print("Error: Render membutuhkan window OpenGL (tidak tersedia saat --headless).")
+        return
+    width = int(width) if width else window_width * 4
+    height = max(1, round(width * window_height / window_width))
+    scale = width / window_width
+
+    def render_tile(x0, y0, x1, y1, width, height):
+        glMatrixMode(GL_PROJECTION);
+        glLoadIdentity()
+        gluOrtho2D(x0 / scale, x1 / scale, y0 / scale, y1 / scale)
+        glMatrixMode(GL_MODELVIEW)
+        draw_objects()
+
+    # Titik terbesar menentukan seberapa jauh tile perlu diperluas di tepinya
+    thickness = canvas.objects.column('thickness')
+    thickest = thickness.max() if len(thickness) else 1.0
+    margin = int(stroke_margin(thickest) * scale) + 1
+    # Sorotan seleksi tidak ikut dirender
+    selected, canvas.selected_indices = canvas.selected_indices, []
+    render_scale = scale
+    try:
+        tiled_render.render_tiled(filename, width, height, render_tile, margin=margin)
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"Error: Gagal merender '{filename}': {e}")
+        return
+    finally:
+        render_scale = 1.0
+        canvas.selected_indices = selected
+        reshape(window_width, window_height)
+    print(f"Gambar {width}x{height} dirender ke '{filename}'.")
+
+
+def set_clip_mode(mode):
+    """Memilih clipping CPU atau GPU (lihat CLIP_MODES)."""
+    global clip_mode
+    clip_mode = mode
+    print(f"Clipping: {mode.upper()}")
+    if canvas.clipping_window['active']: request_redisplay()
+
+
+def next_export_path(extension=".svg"):
+    """Membuat nama file export berikutnya yang belum dipakai di folder kerja."""
+    index = 1
+    while os.path.exists(f"export_{index:03d}{extension}"):
+        index += 1
+    return f"export_{index:03d}{extension}"
+
+
+def load_scene(filename):
+    """Menambahkan objek dari file scene .json ke canvas."""
+    try:
+        count = canvas.load_scene(filename)
+    except (OSError, ValueError) as e:
+        print(f"Error: Gagal membaca scene '{filename}': {e}")
+        return
+    print(f"Scene '{filename}' dimuat: {count} objek.")
 
 
 # =============================================================================
@@ -321,7 +333,7 @@ def cohen_sutherland_clip(x1, y1, x2, y2):
 # =============================================================================
 
 def draw_point(vertices, color, thickness):
-    glPointSize(thickness * 5);
+    glPointSize(thickness * 5 * render_scale);
     glColor3fv(color);
     glBegin(GL_POINTS);
     glVertex2fv(vertices[0]);
@@ -331,11 +343,11 @@ def draw_point(vertices, color, thickness):
 def draw_line(vertices, color, thickness, clip=False):
     x1, y1 = vertices[0];
     x2, y2 = vertices[1]
-    if clip and clipping_window['active']:
-        visible, nx1, ny1, nx2, ny2 = cohen_sutherland_clip(x1, y1, x2, y2)
+    if clip and canvas.clipping_window['active']:
+        visible, nx1, ny1, nx2, ny2 = canvas.clip_line(x1, y1, x2, y2)
         if not visible: return
         x1, y1, x2, y2 = nx1, ny1, nx2, ny2
-    glLineWidth(thickness);
+    glLineWidth(thickness * render_scale);
     glColor3fv(color);
     glBegin(GL_LINES);
     glVertex2f(x1, y1);
@@ -354,17 +366,18 @@ def draw_ellipse(vertices, color, thickness, clip=False):
     center_x, center_y = vertices[0];
     rx = abs(vertices[1][0] - center_x);
     ry = abs(vertices[1][1] - center_y)
-    num_segments = 100
-    glLineWidth(thickness);
+    glLineWidth(thickness * render_scale);
     glColor3fv(color);
+    if not (clip and canvas.clipping_window['active']):
+        draw_vertex_array(GL_LINE_LOOP, UNIT_CIRCLE * (rx, ry) + (center_x, center_y))
+        return
+    num_segments = ELLIPSE_SEGMENTS
     glBegin(GL_LINE_LOOP)
     for i in range(num_segments):
         theta = 2.0 * pi * i / num_segments
         x = rx * cos(theta) + center_x;
         y = ry * sin(theta) + center_y
-        if clip and clipping_window['active'] and not (
-                clipping_window['xmin'] <= x <= clipping_window['xmax'] and clipping_window['ymin'] <= y <=
-                clipping_window['ymax']):
+        if not canvas.point_in_window(x, y):
             glEnd();
             glBegin(GL_LINE_LOOP);
             continue
@@ -373,21 +386,47 @@ def draw_ellipse(vertices, color, thickness, clip=False):
 
 
 def draw_freehand(vertices, color, thickness, clip=False):
-    glLineWidth(thickness);
+    glLineWidth(thickness * render_scale);
     glColor3fv(color);
+    if not (clip and canvas.clipping_window['active']):
+        draw_vertex_array(GL_LINE_STRIP, vertices)
+        return
     glBegin(GL_LINE_STRIP)
-    for v in vertices:
-        if clip and clipping_window['active'] and not (
-                clipping_window['xmin'] <= v[0] <= clipping_window['xmax'] and clipping_window['ymin'] <= v[1] <=
-                clipping_window['ymax']):
+    for x, y in np.asarray(vertices).tolist():
+        if not canvas.point_in_window(x, y):
             glEnd();
             glBegin(GL_LINE_STRIP);
             continue
-        glVertex2fv(v)
+        glVertex2f(x, y)
     glEnd()
 
 
+def draw_vertex_array(mode, vertices):
+    """Mengirim vertex (k, 2) sekaligus dengan satu glDrawArrays, tanpa glVertex per titik."""
+    vertices = np.ascontiguousarray(vertices, dtype=np.float64)
+    glEnableClientState(GL_VERTEX_ARRAY);
+    glVertexPointer(2, GL_DOUBLE, 0, vertices)
+    glDrawArrays(mode, 0, len(vertices))
+    glDisableClientState(GL_VERTEX_ARRAY)
+
+
+def set_clip_planes(enabled):
+    """Mengaktifkan/mematikan 4 clip plane clipping window (dalam koordinat dunia)."""
+    planes = (GL_CLIP_PLANE0, GL_CLIP_PLANE1, GL_CLIP_PLANE2, GL_CLIP_PLANE3)
+    if not enabled:
+        for plane in planes: glDisable(plane)
+        return
+    cw = canvas.clipping_window
+    # Persamaan plane ditransformasi dengan model-view saat ditetapkan; pemanggil memastikan identitas
+    equations = ((1.0, 0.0, 0.0, -cw['xmin']), (-1.0, 0.0, 0.0, cw['xmax']),
+                 (0.0, 1.0, 0.0, -cw['ymin']), (0.0, -1.0, 0.0, cw['ymax']))
+    for plane, equation in zip(planes, equations):
+        glClipPlane(plane, equation);
+        glEnable(plane)
+
+
 def draw_clipping_window():
+    clipping_window = canvas.clipping_window
     if clipping_window['active']:
         glEnable(GL_LINE_STIPPLE);
         glLineStipple(4, 0xAAAA);
@@ -429,32 +468,108 @@ def draw_selection_box():
 # 5. FUNGSI CALLBACK UTAMA OPENGL/GLUT
 # =============================================================================
 
-def display():
+def ensure_object_layer():
+    """Menyiapkan FBO lapisan objek seukuran window. True jika lapisan baru dibuat."""
+    size = (window_width, max(window_height, 1))
+    if object_layer['size'] == size: return False
+    if object_layer['fbo']:
+        glDeleteFramebuffers(1, [object_layer['fbo']]);
+        glDeleteRenderbuffers(1, [object_layer['rbo']])
+    object_layer.update({'fbo': 0, 'rbo': None, 'size': size})
+    if not bool(glGenFramebuffers): return True
+    rbo = glGenRenderbuffers(1);
+    glBindRenderbuffer(GL_RENDERBUFFER, rbo)
+    glRenderbufferStorage(GL_RENDERBUFFER, GL_RGBA8, size[0], size[1])
+    fbo = glGenFramebuffers(1);
+    glBindFramebuffer(GL_FRAMEBUFFER, fbo)
+    glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_RENDERBUFFER, rbo)
+    complete = glCheckFramebufferStatus(GL_FRAMEBUFFER) == GL_FRAMEBUFFER_COMPLETE
+    glBindFramebuffer(GL_FRAMEBUFFER, 0)
+    if complete:
+        object_layer.update({'fbo': fbo, 'rbo': rbo})
+    else:
+        glDeleteFramebuffers(1, [fbo]);
+        glDeleteRenderbuffers(1, [rbo])
+    return True
+
+
+def draw_objects(damage=None):
+    """Menggambar semua objek; dengan `damage` hanya area itu (scissor) yang digambar ulang."""
+    if damage:
+        x0, y0 = max(0, int(floor(damage[0]))), max(0, int(floor(damage[1])))
+        x1, y1 = min(window_width, int(ceil(damage[2]))), min(window_height, int(ceil(damage[3])))
+        if x1 <= x0 or y1 <= y0: return
+        glEnable(GL_SCISSOR_TEST);
+        glScissor(x0, y0, x1 - x0, y1 - y0)
     glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT);
     glLoadIdentity()
-    for i, obj in enumerate(objects):
-        display_color = obj['color']
-        if i in selected_indices: display_color = (0.9, 0.5, 0.0)
-        if clipping_window['active'] and is_object_fully_inside_window(obj): display_color = (0.1, 0.8, 0.2)
+    store = canvas.objects
+    types = store.column('type')
+    if damage:
+        # Objek di luar area rusak tidak berubah di lapisan objek
+        visible = store.in_box(x0, y0, x1, y1, bounds=True)
+    else:
+        visible = np.arange(len(store))
+    gpu_clip = canvas.clipping_window['active'] and clip_mode == 'gpu'
+    if gpu_clip:
+        # Objek yang seluruhnya di luar window akan habis terpotong clip plane; titik tidak dipotong
+        cw = canvas.clipping_window
+        in_window = store.in_box(cw['xmin'], cw['ymin'], cw['xmax'], cw['ymax'], bounds=True)
+        visible = np.intersect1d(visible, np.union1d(in_window, np.flatnonzero(types == TYPE_CODES['point'])))
+    selected = set(canvas.selected_indices)
+    inside = canvas.objects_inside_window() if canvas.clipping_window['active'] else None
+    # Kolom objek yang terlihat diambil sekaligus sebagai list Python (lebih murah bagi PyOpenGL daripada skalar NumPy)
+    rows = zip(visible.tolist(), types[visible].tolist(), store.column('color')[visible].tolist(),
+               store.column('thickness')[visible].tolist(), store.centers()[visible].tolist(),
+               store.column('translate')[visible].tolist(), store.column('rotate')[visible].tolist(),
+               store.column('scale')[visible].tolist())
+    planes_enabled = False
+    cpu_clip = not gpu_clip
+    for i, obj_type, display_color, width, center, translate, rotate, scale in rows:
+        if i in selected: display_color = (0.9, 0.5, 0.0)
+        if inside is not None and inside[i]: display_color = (0.1, 0.8, 0.2)
+        if gpu_clip and planes_enabled != (obj_type != TYPE_CODES['point']):
+            planes_enabled = not planes_enabled
+            set_clip_planes(planes_enabled)
         glPushMatrix()
-        center = get_object_center(obj)
-        glTranslatef(obj['transform']['translate'][0], obj['transform']['translate'][1], 0)
+        glTranslatef(translate[0], translate[1], 0)
         glTranslatef(center[0], center[1], 0)
-        glRotatef(obj['transform']['rotate'], 0, 0, 1)
-        glScalef(obj['transform']['scale'][0], obj['transform']['scale'][1], 1)
+        glRotatef(rotate, 0, 0, 1)
+        glScalef(scale[0], scale[1], 1)
         glTranslatef(-center[0], -center[1], 0)
-        obj_type = obj['type']
-        if obj_type == 'point':
-            draw_point(obj['vertices'], display_color, obj['thickness'])
-        elif obj_type == 'line':
-            draw_line(obj['vertices'], display_color, obj['thickness'], clip=True)
-        elif obj_type == 'rectangle':
-            draw_rectangle(obj['vertices'], display_color, obj['thickness'], clip=True)
-        elif obj_type == 'ellipse':
-            draw_ellipse(obj['vertices'], display_color, obj['thickness'], clip=True)
-        elif obj_type == 'freehand':
-            draw_freehand(obj['vertices'], display_color, obj['thickness'], clip=True)
+        if obj_type == TYPE_CODES['freehand']:
+            draw_freehand(store.vertices(i), display_color, width, clip=cpu_clip)
+            glPopMatrix()
+            continue
+        vertices = store.vertices(i).tolist()
+        if obj_type == TYPE_CODES['point']:
+            draw_point(vertices, display_color, width)
+        elif obj_type == TYPE_CODES['line']:
+            draw_line(vertices, display_color, width, clip=cpu_clip)
+        elif obj_type == TYPE_CODES['rectangle']:
+            draw_rectangle(vertices, display_color, width, clip=cpu_clip)
+        elif obj_type == TYPE_CODES['ellipse']:
+            draw_ellipse(vertices, display_color, width, clip=cpu_clip)
         glPopMatrix()
+    if planes_enabled: set_clip_planes(False)
+    if damage: glDisable(GL_SCISSOR_TEST)
+
+
+def display():
+    full, damage = frame_scheduler.begin_frame()
+    if ensure_object_layer(): full = True
+    fbo = object_layer['fbo']
+    if fbo:
+        # Lapisan objek diperbarui seperlunya lalu disalin utuh ke back buffer
+        glBindFramebuffer(GL_FRAMEBUFFER, fbo)
+        if full or damage: draw_objects(None if full else damage)
+        w, h = object_layer['size']
+        glBindFramebuffer(GL_DRAW_FRAMEBUFFER, 0)
+        glBlitFramebuffer(0, 0, w, h, 0, 0, w, h, GL_COLOR_BUFFER_BIT, GL_NEAREST)
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+    else:
+        draw_objects()
+    glLoadIdentity()
 
     if is_drawing and ghost_object:
         obj = ghost_object;
@@ -466,7 +581,7 @@ def display():
         elif obj['type'] == 'draw_ellipse':
             draw_ellipse(obj['vertices'], color, obj['thickness'])
         elif obj['type'] == 'define_window':
-            draw_rectangle(obj['vertices'], clipping_window['color'], 1.5)
+            draw_rectangle(obj['vertices'], canvas.clipping_window['color'], 1.5)
 
     draw_clipping_window()
     draw_selection_box()
@@ -489,7 +604,8 @@ def init():
     glEnable(GL_BLEND);
     glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
     glEnable(GL_LINE_SMOOTH);
-    print_instructions()
+    # Panduan dicetak setelah frame pertama agar tidak menunda tampilnya window
+    input_events.after_first_frame(print_instructions)
 
 
 # =============================================================================
@@ -497,105 +613,99 @@ def init():
 # =============================================================================
 
 def mouse_click(button, state, x, y):
-    global current_mode, is_drawing, temp_vertex, ghost_object, selected_indices, selection_box
+    global current_mode, is_drawing, temp_vertex, ghost_object, selection_box
     global is_dragging_selection, drag_last_pos
     y = window_height - y
+    selected, object_count = list(canvas.selected_indices), len(canvas.objects)
+    # Ghost/kotak seleksi muncul atau hilang; tombol kanan, tengah, dan wheel tidak mengubah apa pun
+    overlay_changed = window_defined = False
 
     if button == GLUT_LEFT_BUTTON:
         if state == GLUT_DOWN:
-            mods = glutGetModifiers()
+            mods = input_events.get_modifiers()
             if current_mode == 'select':
-                clicked_on_object = False
-                for i in selected_indices:
-                    if is_point_on_object(x, y, objects[i]):
-                        is_dragging_selection = True
-                        drag_last_pos = {'x': x, 'y': y}
-                        clicked_on_object = True
-                        break
-                if not is_dragging_selection:
-                    for i in range(len(objects) - 1, -1, -1):
-                        if is_point_on_object(x, y, objects[i]):
-                            if mods == GLUT_ACTIVE_SHIFT:
-                                if i in selected_indices:
-                                    selected_indices.remove(i)
-                                else:
-                                    selected_indices.append(i)
-                            else:
-                                selected_indices = [i]
-                            clicked_on_object = True
-                            break
-                if not clicked_on_object:
+                if canvas.hit_test(x, y, canvas.selected_indices) is not None:
+                    is_dragging_selection = True
+                    drag_last_pos = {'x': x, 'y': y}
+                elif canvas.select_at(x, y, toggle=mods == GLUT_ACTIVE_SHIFT) is None:
                     is_drawing = True
                     selection_box = (x, y, x, y)
                     if mods != GLUT_ACTIVE_SHIFT:
-                        selected_indices.clear()
+                        canvas.selected_indices.clear()
             else:
                 is_drawing = True;
                 temp_vertex = (x, y)
                 if current_mode == 'draw_point':
-                    create_object('point', [(x, y)], current_color, current_thickness); is_drawing = False
+                    canvas.create_object('point', [(x, y)], current_color, current_thickness); is_drawing = False
                 elif current_mode == 'draw_freehand':
-                    create_object('freehand', [temp_vertex], current_color, current_thickness)
+                    canvas.create_object('freehand', [temp_vertex], current_color, current_thickness)
                 elif current_mode in ['draw_line', 'draw_rectangle', 'draw_ellipse', 'define_window']:
                     ghost_object = {'type': current_mode, 'vertices': [temp_vertex, temp_vertex],
                                     'color': current_color, 'thickness': current_thickness}
+            overlay_changed = bool(selection_box or ghost_object)
         elif state == GLUT_UP:
+            # Geseran seleksi dan goresan freehand sudah ditandai oleh mouse_motion
+            overlay_changed = bool(selection_box or (is_drawing and ghost_object))
             is_dragging_selection = False
             if selection_box:
-                x1, y1, x2, y2 = selection_box
-                sel_xmin, sel_xmax = min(x1, x2), max(x1, x2)
-                sel_ymin, sel_ymax = min(y1, y2), max(y1, y2)
-                newly_selected = set(selected_indices)
-                for i, obj in enumerate(objects):
-                    aabb = get_object_aabb(obj)
-                    if aabb and not (
-                            sel_xmax < aabb[0] or sel_xmin > aabb[2] or sel_ymax < aabb[1] or sel_ymin > aabb[3]):
-                        newly_selected.add(i)
-                selected_indices = list(newly_selected)
-                print(f"{len(selected_indices)} objek terpilih.")
+                print(f"{canvas.select_in_box(*selection_box)} objek terpilih.")
             if is_drawing and ghost_object:
                 if current_mode in ['draw_line', 'draw_rectangle', 'draw_ellipse']:
-                    create_object(ghost_object['type'].replace('draw_', ''), ghost_object['vertices'], current_color,
-                                  current_thickness)
+                    canvas.create_object(ghost_object['type'].replace('draw_', ''), ghost_object['vertices'],
+                                         current_color, current_thickness)
                 elif current_mode == 'define_window':
                     vx = sorted([ghost_object['vertices'][0][0], ghost_object['vertices'][1][0]])
                     vy = sorted([ghost_object['vertices'][0][1], ghost_object['vertices'][1][1]])
-                    clipping_window.update({'xmin': vx[0], 'ymin': vy[0], 'xmax': vx[1], 'ymax': vy[1], 'active': True})
+                    canvas.set_clipping_window(vx[0], vy[0], vx[1], vy[1])
                     print("Clipping window didefinisikan.");
                     current_mode = 'select'
+                    window_defined = True
             is_drawing = False;
             ghost_object = None;
             temp_vertex = None;
             selection_box = None
-    glutPostRedisplay()
+
+    # Clipping window baru mengubah warna semua objek; selain itu cukup area objek
+    # baru / yang seleksinya berubah, atau hanya overlay
+    if window_defined:
+        request_redisplay()
+    elif not request_selection_redisplay(selected, object_count) and overlay_changed:
+        request_redisplay(overlay_only=True)
 
 
 def mouse_motion(x, y):
     global selection_box, drag_last_pos
     y = window_height - y
     if is_dragging_selection:
-        dx = x - drag_last_pos['x'];
-        dy = y - drag_last_pos['y']
-        for index in selected_indices:
-            objects[index]['transform']['translate'][0] += dx
-            objects[index]['transform']['translate'][1] += dy
+        transform_selected(canvas.translate_selected, x - drag_last_pos['x'], y - drag_last_pos['y'])
         drag_last_pos = {'x': x, 'y': y}
-        glutPostRedisplay()
         return
     if not is_drawing: return
     if selection_box:
         x1, y1, _, _ = selection_box
         selection_box = (x1, y1, x, y)
+        request_redisplay(overlay_only=True)
     elif current_mode == 'draw_freehand':
-        if objects and objects[-1]['type'] == 'freehand': objects[-1]['vertices'].append((x, y))
+        if canvas.objects and canvas.objects[-1]['type'] == 'freehand':
+            index = len(canvas.objects) - 1
+            (px, py) = canvas.objects.vertices(index)[-1].tolist()
+            margin = stroke_margin(canvas.objects[index]['thickness'])
+            canvas.append_vertex(index, (x, y))
+            if canvas.clipping_window['active']:
+                # Warna seluruh goresan bisa berubah saat keluar/masuk clipping window
+                request_redisplay()
+            else:
+                # Hanya segmen baru yang perlu digambar (objek freehand baru belum bertransformasi)
+                request_redisplay(damage=(min(px, x) - margin, min(py, y) - margin,
+                                          max(px, x) + margin, max(py, y) + margin))
     elif ghost_object and temp_vertex:
         ghost_object['vertices'][1] = (x, y)
-    glutPostRedisplay()
+        request_redisplay(overlay_only=True)
 
 
 def keyboard(key, x, y):
     global current_mode, current_color, current_thickness
-    mods = glutGetModifiers()
+    mods = input_events.get_modifiers()
 
     # --- PERBAIKAN: Cek byte code untuk shortcut Ctrl ---
     # Kode ini mendeteksi karakter kontrol ASCII yang dikirim saat Ctrl+key ditekan.
@@ -632,7 +742,16 @@ def keyboard(key, x, y):
     elif key == b'\x1b':
         current_mode = 'select'; print("Mode: Select")
     elif key_char == 'd':
-        clipping_window['active'] = False; print("Clipping window dinonaktifkan.")
+        canvas.disable_clipping_window(); print("Clipping window dinonaktifkan.")
+        request_redisplay()
+    elif key_char == 'x':
+        export_vector(next_export_path(), clip=canvas.clipping_window['active'])
+    elif key_char == 'k':
+        set_clip_mode(CLIP_MODES[1 - CLIP_MODES.index(clip_mode)])
+    elif key_char == 'o':
+        toggle_group_pivot()
+    elif key_char == 'b':
+        bake_selected_objects()
     elif key_char == '1':
         current_color = (0.0, 0.0, 0.0); print("Warna: Hitam")
     elif key_char == '2':
@@ -646,73 +765,115 @@ def keyboard(key, x, y):
     elif key_char == '-':
         current_thickness = max(1.0, current_thickness - 0.5); print(f"Ketebalan: {current_thickness}")
 
-    if selected_indices:
-        for index in selected_indices:
-            obj = objects[index]
-            if key_char == 'q':
-                obj['transform']['rotate'] += 5.0
-            elif key_char == 'a':
-                obj['transform']['rotate'] -= 5.0
-            elif key_char == 'w':
-                obj['transform']['scale'][0] *= 1.1; obj['transform']['scale'][1] *= 1.1
-            elif key_char == 's':
-                obj['transform']['scale'][0] *= 0.9; obj['transform']['scale'][1] *= 0.9
-    glutPostRedisplay()
+    # Ganti mode, warna, atau ketebalan tidak mengubah gambar: tidak perlu frame baru
+    if canvas.selected_indices:
+        rotate = canvas.rotate_selected_group if group_pivot else canvas.rotate_selected
+        scale = canvas.scale_selected_group if group_pivot else canvas.scale_selected
+        if key_char == 'q':
+            transform_selected(rotate, 5.0)
+        elif key_char == 'a':
+            transform_selected(rotate, -5.0)
+        elif key_char == 'w':
+            transform_selected(scale, 1.1)
+        elif key_char == 's':
+            transform_selected(scale, 0.9)
 
 
 def special_keys(key, x, y):
     step = 5.0;
-    mods = glutGetModifiers()
-    if current_mode == 'select' and selected_indices:
-        for index in selected_indices:
-            transform = objects[index]['transform']['translate']
-            if key == GLUT_KEY_UP:
-                transform[1] += step
-            elif key == GLUT_KEY_DOWN:
-                transform[1] -= step
-            elif key == GLUT_KEY_LEFT:
-                transform[0] -= step
-            elif key == GLUT_KEY_RIGHT:
-                transform[0] += step
-    elif current_mode == 'move_window' and clipping_window['active']:
+    mods = input_events.get_modifiers()
+    directions = {GLUT_KEY_UP: (0, step), GLUT_KEY_DOWN: (0, -step),
+                  GLUT_KEY_LEFT: (-step, 0), GLUT_KEY_RIGHT: (step, 0)}
+    if key not in directions: return
+    dx, dy = directions[key]
+    if current_mode == 'select' and canvas.selected_indices:
+        transform_selected(canvas.translate_selected, dx, dy)
+    elif current_mode == 'move_window' and canvas.clipping_window['active']:
         if mods == GLUT_ACTIVE_SHIFT:
-            if key == GLUT_KEY_UP:
-                clipping_window['ymax'] += step
-            elif key == GLUT_KEY_DOWN:
-                clipping_window['ymax'] -= step
+            # Shift+Panah mengubah ukuran: atas/bawah menggeser ymax,
+            # kiri menggeser xmin, kanan menggeser xmax
+            if key in (GLUT_KEY_UP, GLUT_KEY_DOWN):
+                canvas.resize_clipping_window(dymax=dy)
             elif key == GLUT_KEY_LEFT:
-                clipping_window['xmin'] -= step
+                canvas.resize_clipping_window(dxmin=dx)
             elif key == GLUT_KEY_RIGHT:
-                clipping_window['xmax'] += step
+                canvas.resize_clipping_window(dxmax=dx)
         else:
-            if key == GLUT_KEY_UP:
-                clipping_window['ymin'] += step; clipping_window['ymax'] += step
-            elif key == GLUT_KEY_DOWN:
-                clipping_window['ymin'] -= step; clipping_window['ymax'] -= step
-            elif key == GLUT_KEY_LEFT:
-                clipping_window['xmin'] -= step; clipping_window['xmax'] -= step
-            elif key == GLUT_KEY_RIGHT:
-                clipping_window['xmin'] += step; clipping_window['xmax'] += step
-    glutPostRedisplay()
+            canvas.move_clipping_window(dx, dy)
+        # Warna dan clipping semua objek bergantung pada posisi window
+        request_redisplay()
 
 
 # =============================================================================
 # 7. FUNGSI MAIN
 # =============================================================================
 
-def main():
-    glutInit(sys.argv)
+def parse_args(argv):
+    """Membaca argumen baris perintah."""
+    parser = argparse.ArgumentParser(description="Aplikasi Grafika 2D Interaktif")
+    parser.add_argument("scenes", nargs="*", help="file scene .json yang dimuat saat mulai")
+    parser.add_argument("--translate", nargs=2, type=float, metavar=("DX", "DY"),
+                        help="translasi awal untuk semua objek yang dimuat")
+    parser.add_argument("--rotate", type=float, metavar="DERAJAT", help="rotasi awal untuk semua objek yang dimuat")
+    parser.add_argument("--scale", nargs=2, type=float, metavar=("SX", "SY"),
+                        help="skala awal untuk semua objek yang dimuat")
+    parser.add_argument("--clip", nargs=4, type=float, metavar=("XMIN", "YMIN", "XMAX", "YMAX"),
+                        help="aktifkan clipping window")
+    parser.add_argument("--fps", type=float, default=frame_scheduler.DEFAULT_FPS,
+                        help="batas frame per detik (0 = tanpa batas, default 60)")
+    parser.add_argument("--clip-mode", choices=CLIP_MODES, default=clip_mode,
+                        help="clipping di CPU (Cohen-Sutherland) atau GPU (clip plane), default cpu")
+    parser.add_argument("--render", metavar="FILE", help="render canvas ke .png/.ppm resolusi tinggi lalu keluar")
+    parser.add_argument("--render-width", type=int, metavar="PIKSEL", help="lebar gambar --render (default 4x window)")
+    input_events.add_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    global headless, clip_mode
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    events = input_events.load_events(args)
+
+    for filename in args.scenes:
+        load_scene(filename)
+    for obj in canvas.objects:
+        tr = obj['transform']
+        if args.translate: tr['translate'] = list(args.translate)
+        if args.rotate is not None: tr['rotate'] = args.rotate
+        if args.scale: tr['scale'] = list(args.scale)
+    if args.clip:
+        canvas.set_clipping_window(*args.clip)
+    clip_mode = args.clip_mode
+
+    callbacks = {'keyboard': keyboard, 'special_keys': special_keys,
+                 'mouse_click': mouse_click, 'mouse_motion': mouse_motion}
+    commands = {'load': load_scene, 'save': save_scene,
+                'export': lambda filename, *options: export_vector(filename, clip='clip' in options),
+                'render': render_image}
+    if args.render:
+        events = events + [(0.0, 'command', ('render', args.render, args.render_width), 0),
+                           (0.0, 'command', ('quit',), 0)]
+    if args.headless:
+        headless = True
+        input_events.run_headless(args, events, callbacks, commands)
+        return
+
+    # PyOpenGL hanya dimuat jika ada window; --headless cukup memakai konstanta input GLUT
+    gl_loader.load()
+    frame_scheduler.set_rate(args.fps)
+    glutInit(sys.argv[:1])
     glutInitDisplayMode(GLUT_RGBA | GLUT_DOUBLE | GLUT_DEPTH)
     glutInitWindowSize(window_width, window_height)
     glutInitWindowPosition(100, 100)
-    glutCreateWindow(b"Aplikasi Grafika 2D Interaktif - OpenGL v1.7.1")
-    glutDisplayFunc(display);
-    glutReshapeFunc(reshape);
-    glutKeyboardFunc(keyboard)
-    glutSpecialFunc(special_keys);
-    glutMouseFunc(mouse_click);
-    glutMotionFunc(mouse_motion)
+    glutCreateWindow(b"Aplikasi Grafika 2D Interaktif - OpenGL v2.0")
     init()
+    callbacks = input_events.start_session(args, events, callbacks, commands)
+    glutDisplayFunc(input_events.timed_display(display));
+    glutReshapeFunc(reshape);
+    glutKeyboardFunc(callbacks['keyboard'])
+    glutSpecialFunc(callbacks['special_keys']);
+    glutMouseFunc(callbacks['mouse_click']);
+    glutMotionFunc(callbacks['mouse_motion'])
     glutMainLoop()
 
 
@@ -8,31 +8,80 @@ kemampuan untuk mengimpor dan mengekspor model dari/ke format file .obj.
 Versi ini memperbaiki masalah pivot rotasi dan shading pada model yang diimpor.
 
 Fitur Utama:
-- Import/Export: Memuat model .obj (I) dan menyimpan model .obj (O).
+- Scene Multi-Model: Setiap file yang dimuat menjadi instance baru dengan
+  transformasi dan warnanya sendiri. File yang sama berbagi satu buffer
+  geometri, dan instance dari model yang sama digambar secara batch.
+- Import/Export: Memuat model .obj (I), menyimpan model .obj (O), dan
+  menyimpannya setelah transformasi diterapkan (P).
+- Picking: Klik kanan memilih instance di bawah kursor (uji sinar-segitiga
+  pada vertex dunia yang di-cache per versi transformasi).
+- Baris Perintah: Model, scene (.json), transformasi awal, dan skrip
+  interaksi dapat diberikan saat menjalankan program (lihat --help).
+- Rekam & Replay: Input dapat direkam (--record) dan diputar ulang (--replay),
+  juga tanpa window (--headless), dengan laporan latensi handler dan waktu frame.
+- Validasi Mesh: File .obj diperiksa setelah diparse (mesh_validate.py); face
+  dengan indeks rusak dibuang dan --compact membuang data tak terpakai.
+- Pemuatan Asinkron: File diparse di thread latar belakang sehingga window
+  tidak membeku. Progres tampil di judul window dan pemuatan dapat
+  dibatalkan (C).
 - Transformasi Akurat: Rotasi terjadi pada pusat geometris objek.
 - Shading Akurat: Pencahayaan halus (smooth shading) dengan data normal
   yang dipertahankan saat import/export.
 - Transformasi Interaktif: Rotasi, Translasi, Zoom/Skala.
 - Pemilihan Warna: Tombol angka 1-5.
 - Kamera Perspektif: Menggunakan gluPerspective dan gluLookAt.
-
-Versi: 1.5
+- Penjadwal Frame: Input beruntun (mis. drag mouse) digabung menjadi paling
+  banyak satu frame per interval (--fps); tombol tanpa efek tidak memicu frame.
+- Render Resolusi Tinggi: Scene dirender per tile ke PNG selebar apa pun
+  (--render, perintah skrip `render`), lihat tiled_render.py.
+- Render Progresif: Model besar langsung tampil kasar lalu disempurnakan
+  di idle callback dalam anggaran waktu per frame (--frame-budget).
+- Shader Opsional: Pencahayaan per piksel dengan GLSL (--shader); matriks
+  normal dihitung di CPU dan warna instance dikirim sebagai uniform.
+- Startup Cepat: PyOpenGL baru dimuat saat main() membuat window (gl_loader.py),
+  sehingga parser dan geometri dapat diimpor alat lain tanpa GL.
+- Material & Tekstur: File .mtl (Kd, map_Kd) dan koordinat tekstur (vt) dibaca
+  dari .obj. Gambar tekstur didekode sekali per isi file dan dipakai bersama
+  (mesh_materials.py); segitiga diurutkan per material sehingga setiap
+  material cukup satu draw call per instance. Warna material menggantikan
+  warna instance pada face yang memakai material.
+
+Versi: 1.7
 """
 
 # Import library yang diperlukan
 import sys
 import os
-from math import sin, cos, radians
+import copy
+import itertools
+import ctypes
+import json
+import argparse
+import queue
+import threading
+import time
+from math import sin, cos, tan, radians
+
+import gl_loader
+import input_events
+import frame_scheduler
+import tiled_render
+import mesh_chunks
+import mesh_codec
+import mesh_validate
+import mesh_materials
 
 try:
-    from OpenGL.GL import *
-    from OpenGL.GLUT import *
-    from OpenGL.GLU import *
+    import numpy as np
 except ImportError:
-    print("Error: PyOpenGL tidak terinstal.")
-    print("Silakan instal dengan perintah: pip install PyOpenGL PyOpenGL_accelerate")
+    print("Error: NumPy tidak terinstal.")
+    print("Silakan instal dengan perintah: pip install numpy")
     sys.exit(1)
 
+# Nama GL/GLU/GLUT dan `shaders` diikat saat main() memuat PyOpenGL, sehingga
+# parser, export, dan perhitungan geometri modul ini dapat diimpor tanpa GL
+gl_loader.bind(globals())
+
 # =============================================================================
 # 1. PENGELOLAAN STATE DAN VARIABEL GLOBAL
 # =============================================================================
@@ -41,81 +90,188 @@ except ImportError:
 window_width = 1280
 window_height = 720
 
-# Variabel untuk transformasi objek
-rotation_x = 0.0
-rotation_y = 0.0
-translate_x = 0.0
-translate_y = 0.0
-translate_z = 0.0  # Direset setiap load model
-scale_factor = 1.0
-object_color = [0.6, 0.7, 1.0]
+# Warna default untuk instance baru
+DEFAULT_COLOR = [0.6, 0.7, 1.0]
 
 # Variabel untuk interaksi mouse
 mouse_down = False
 last_mouse_x = 0
 last_mouse_y = 0
 
-# Struktur data untuk menyimpan model 3D yang dimuat
-model = {
-    "vertices": [],
-    "normals": [],
-    "faces": [],
-    "center": (0.0, 0.0, 0.0)  # Pusat geometris model
+# Cache geometri: kunci (path file absolut) -> dictionary model.
+# File yang sama hanya diparse sekali dan semua instance-nya berbagi satu
+# buffer geometri di GPU.
+model_cache = {}
+
+# Scene: daftar instance. Setiap instance menunjuk ke satu model di cache dan
+# memiliki transformasi serta warnanya sendiri.
+scene = []
+active_index = -1
+
+# True saat skrip/rekaman diputar tanpa window (tidak ada konteks GL)
+headless = False
+
+# Kunci cache untuk kubus bawaan
+DEFAULT_CUBE_KEY = "<kubus>"
+
+# Judul window dan interval polling hasil pemuatan asinkron (ms)
+WINDOW_TITLE = "Aplikasi Grafika 3D Interaktif - OpenGL"
+LOAD_POLL_MS = 30
+
+# Parameter proyeksi perspektif (dipakai reshape dan render per tile)
+CAMERA_FOVY = 45.0
+CAMERA_NEAR = 0.1
+CAMERA_FAR = 500.0  # Perbesar zFar
+CAMERA_EYE = (0.0, 0.0, 5.0)  # gluLookAt: melihat ke origin, arah -z, sumbu y ke atas
+
+# Posisi lampu GL_LIGHT0 dalam koordinat dunia (setelah gluLookAt)
+LIGHT_POSITION = [2.0, 3.0, 4.0, 1.0]
+
+# Jalur shader GLSL (opsional, --shader): pencahayaan per piksel. Matriks
+# model-view dan matriks normal setiap instance dihitung di CPU sekali per
+# frame, dan warna instance dikirim sebagai uniform. Jika shader tidak dapat
+# dikompilasi, aplikasi memakai pencahayaan fixed-function.
+shading = {"requested": False, "program": None, "uniforms": {}}
+
+# Render progresif: model besar disimpan dengan urutan segitiga LOD (kasar ke
+# halus) sehingga setiap prefiks buffer tersebar merata di seluruh model.
+# Frame pertama hanya menggambar prefiks sesuai anggaran waktu ke lapisan
+# offscreen, lalu idle callback menambahkan potongan berikutnya sampai lengkap.
+PROGRESSIVE_MIN_TRIANGLES = 200000
+LOD_MAX_GRID = 256
+progressive = {
+    "enabled": True, "budget_ms": 30.0, "tris_per_ms": 2000.0,
+    "done": 1.0, "idle": False, "fbo": None, "rbos": None, "size": None,
 }
 
+# Model out-of-core (.mchk): hanya chunk yang terlihat yang dibaca dari file
+# (memmap) dan diunggah ke VBO. VBO chunk disimpan di cache LRU berbatas byte
+# (dibuat saat pertama dipakai); unggahan per frame dibatasi agar frame tetap lancar.
+chunk_cache_mb = 256
+chunk_cache = None
+CHUNK_UPLOAD_BYTES_PER_FRAME = 32 * 1024 * 1024
+chunk_upload = {"budget": CHUNK_UPLOAD_BYTES_PER_FRAME, "pending": False}
+
+# Tekstur material: gambar didekode (beserta mipmap-nya) sekali per isi file di
+# thread pemuatan dan disimpan di texture_cache dengan kunci hash isinya, lalu
+# diunggah sekali ke GPU dan dipakai bersama oleh semua model yang merujuk isi
+# yang sama. texture_objects: digest -> {"id": tekstur GL, "users": jumlah model}.
+TEXTURE_CACHE_MB = 256
+texture_cache = mesh_materials.TextureCache(TEXTURE_CACHE_MB * 1024 * 1024)
+texture_objects = {}
+
+# Ukuran byte satu vertex di VBO: posisi + normal, ditambah uv untuk model bertekstur
+VERTEX_STRIDE = 6 * 4
+TEXTURED_VERTEX_STRIDE = 8 * 4
+
+# Vertex dan normal instance dalam koordinat dunia untuk operasi di CPU
+# (export dengan transformasi, bounding box, picking). Dihitung malas dengan
+# satu perkalian matriks untuk seluruh array dan disimpan bersama penanda
+# versinya (nilai rotate/translate/scale saat dihitung), sehingga hanya
+# dihitung ulang setelah transformasi instance berubah. id(instance) -> entri.
+world_cache = {}
+PICK_BLOCK = 1 << 20  # segitiga per blok uji sinar (membatasi memori sementara)
+
+# Pemuatan asinkron: thread worker mengambil path dari load_queue, memparse
+# file, lalu menaruh hasilnya di ready_queue. Thread GL (callback timer)
+# mengunggah buffer dan menukar scene. load_generation dinaikkan saat
+# pemuatan dibatalkan sehingga hasil yang sudah usang dibuang.
+load_queue = queue.Queue()
+ready_queue = queue.Queue()
+load_status = {"file": None, "progress": 0.0, "pending": 0, "title": None}
+load_generation = 0
+load_lock = threading.Lock()
+loader_thread = None
+
+# Daftar file yang dimuat bergiliran dengan tombol I, dan folder tujuan
+# export tombol O (nama file dibuat otomatis, tanpa prompt konsol)
+file_list = []
+file_list_index = 0
+export_dir = "."
+
+# File .obj diperiksa (mesh_validate) setelah diparse: face dengan indeks di
+# luar jangkauan selalu dibuang; dengan --compact, face degenerate/duplikat
+# serta vertex dan normal yang tidak terpakai juga dibuang.
+compact_models = False
+
 
 # =============================================================================
 # 2. FUNGSI IMPORT, EXPORT, DAN MANIPULASI MODEL
 # =============================================================================
 
-def center_model_and_reset_transform():
-    """Menghitung pusat model, memindahkannya ke origin, dan mereset transformasi."""
-    global model, rotation_x, rotation_y, translate_x, translate_y, translate_z, scale_factor
-    if not model["vertices"]:
+def request_redisplay():
+    """Meminta frame baru lewat penjadwal frame; diabaikan saat berjalan headless."""
+    if not headless:
+        frame_scheduler.request_redraw(full=True)
+
+
+def center_model_and_reset_transform(model, instance=None):
+    """Menghitung pusat model, memindahkannya ke origin, dan mereset transformasi instance."""
+    if not model["vertices"] and "extent" not in model:
         return
 
-    # Hitung bounding box
-    min_x = min(v[0] for v in model["vertices"])
-    max_x = max(v[0] for v in model["vertices"])
-    min_y = min(v[1] for v in model["vertices"])
-    max_y = max(v[1] for v in model["vertices"])
-    min_z = min(v[2] for v in model["vertices"])
-    max_z = max(v[2] for v in model["vertices"])
-
-    # Hitung pusat geometris
-    center_x = (min_x + max_x) / 2.0
-    center_y = (min_y + max_y) / 2.0
-    center_z = (min_z + max_z) / 2.0
-    model["center"] = (center_x, center_y, center_z)
-
-    # Pindahkan semua vertex sehingga pusatnya ada di (0,0,0)
-    new_vertices = []
-    for v in model["vertices"]:
-        new_vertices.append((v[0] - center_x, v[1] - center_y, v[2] - center_z))
-    model["vertices"] = new_vertices
-
-    # Hitung jarak terjauh dari origin untuk menentukan posisi kamera awal
-    max_dist = max(max(abs(v[i]) for v in model["vertices"]) for i in range(3)) if model["vertices"] else 1
-
-    # Reset transformasi
-    rotation_x, rotation_y = 0.0, 0.0
-    translate_x, translate_y = 0.0, 0.0
-    # Atur translate_z agar objek terlihat sepenuhnya
-    translate_z = -max_dist * 2.5
-    scale_factor = 1.0
-    print(f"Model dipusatkan di {model['center']}. Transformasi direset.")
+    if "extent" not in model:
+        # Hitung bounding box
+        min_x = min(v[0] for v in model["vertices"])
+        max_x = max(v[0] for v in model["vertices"])
+        min_y = min(v[1] for v in model["vertices"])
+        max_y = max(v[1] for v in model["vertices"])
+        min_z = min(v[2] for v in model["vertices"])
+        max_z = max(v[2] for v in model["vertices"])
+
+        # Hitung pusat geometris
+        center_x = (min_x + max_x) / 2.0
+        center_y = (min_y + max_y) / 2.0
+        center_z = (min_z + max_z) / 2.0
+        model["center"] = (center_x, center_y, center_z)
+        # AABB setelah dipusatkan (dipakai untuk kuantisasi posisi di format .qmsh)
+        model["aabb"] = ((min_x - center_x, min_y - center_y, min_z - center_z),
+                         (max_x - center_x, max_y - center_y, max_z - center_z))
+
+        # Pindahkan semua vertex sehingga pusatnya ada di (0,0,0)
+        new_vertices = []
+        for v in model["vertices"]:
+            new_vertices.append((v[0] - center_x, v[1] - center_y, v[2] - center_z))
+        model["vertices"] = new_vertices
 
+        # Hitung jarak terjauh dari origin untuk menentukan posisi kamera awal
+        model["extent"] = max(max(abs(v[i]) for v in model["vertices"]) for i in range(3)) or 1.0
+        print(f"Model dipusatkan di {model['center']}.")
+
+    if instance is not None:
+        # Reset transformasi. Atur translate z agar objek terlihat sepenuhnya.
+        instance["transform"] = {
+            "rotate": [0.0, 0.0],
+            "translate": [0.0, 0.0, -model["extent"] * 2.5],
+            "scale": 1.0,
+        }
+        print("Transformasi direset.")
 
-def load_obj(filename):
-    """Memuat model 3D dari sebuah file .obj."""
-    global model
-    if not os.path.exists(filename):
-        print(f"Error: File '{filename}' tidak ditemukan.")
-        return
 
+class LoadCancelled(Exception):
+    """Dilempar oleh callback progres untuk menghentikan parsing file."""
+
+
+def parse_obj(filename, progress=None):
+    """Membaca file .obj dan mengembalikan dictionary model (tanpa GL).
+
+    Jika `progress` diberikan, fungsi ini dipanggil berkala dengan fraksi
+    (0.0 - 1.0) file yang sudah dibaca. Koordinat tekstur (vt) dan material
+    (mtllib/usemtl) disimpan di kunci tambahan model (lihat
+    mesh_materials.MODEL_KEYS) hanya jika file memakainya.
+    """
     temp_vertices, temp_normals, temp_faces = [], [], []
+    temp_texcoords, corner_t = [], None
+    library, materials, material_ids, material_runs = {}, [], {}, []
+    base_dir = os.path.dirname(os.path.abspath(filename))
+    total_size = max(os.path.getsize(filename), 1)
+    bytes_read = 0
     with open(filename, 'r') as f:
-        for line in f:
+        for line_no, line in enumerate(f):
+            if progress is not None:
+                bytes_read += len(line)
+                if line_no % 65536 == 0:
+                    progress(bytes_read / total_size)
             parts = line.strip().split()
             if not parts: continue
 
@@ -123,6 +279,8 @@ def load_obj(filename):
                 temp_vertices.append(tuple(map(float, parts[1:4])))
             elif parts[0] == 'vn':
                 temp_normals.append(tuple(map(float, parts[1:4])))
+            elif parts[0] == 'vt':
+                temp_texcoords.append((float(parts[1]), float(parts[2]) if len(parts) > 2 else 0.0))
             elif parts[0] == 'f':
                 face = []
                 for part in parts[1:]:
@@ -130,67 +288,673 @@ def load_obj(filename):
                     v_idx = int(indices[0]) - 1
                     vn_idx = int(indices[2]) - 1 if len(indices) > 2 and indices[2] else -1
                     face.append((v_idx, vn_idx))
+                if temp_texcoords:
+                    if corner_t is None:
+                        # Sudut face sebelum vt pertama tidak punya koordinat tekstur
+                        corner_t = [-1] * sum(map(len, temp_faces))
+                    corner_t.extend(int(part.split('/')[1] or 0) - 1 if part.count('/') else -1
+                                    for part in parts[1:])
                 temp_faces.append(tuple(face))
+            elif parts[0] == 'mtllib':
+                for name in parts[1:]:
+                    try:
+                        library.update(mesh_materials.parse_mtl(os.path.join(base_dir, name)))
+                    except (OSError, ValueError) as e:
+                        print(f"Peringatan: Library material '{name}' tidak dapat dibaca: {e}")
+            elif parts[0] == 'usemtl':
+                name = " ".join(parts[1:])
+                if name not in material_ids:
+                    if name in library:
+                        material_ids[name] = len(materials)
+                        materials.append(dict(library[name]))
+                    else:
+                        print(f"Peringatan: Material '{name}' tidak ditemukan; face-nya memakai warna instance.")
+                        material_ids[name] = -1
+                # Material dicatat per rentang face, bukan per face
+                material_runs.append((len(temp_faces), material_ids[name]))
 
     model = {"vertices": temp_vertices, "normals": temp_normals, "faces": temp_faces}
-    center_model_and_reset_transform()  # Pusatkan model setelah dimuat
-    print(f"Model '{filename}' berhasil dimuat: {len(model['vertices'])} vertices, {len(model['faces'])} faces.")
-    glutPostRedisplay()
+    if corner_t is not None:
+        model["texcoords"] = np.asarray(temp_texcoords, dtype=np.float64).reshape(-1, 2)
+        model["corner_t"] = np.asarray(corner_t, dtype=np.int64)
+    if materials:
+        starts = [start for start, _ in material_runs] + [len(temp_faces)]
+        model["face_materials"] = np.repeat(np.array([-1] + [index for _, index in material_runs], dtype=np.int64),
+                                            np.diff([0] + starts))
+        model["materials"] = materials
+    return model
+
+
+def build_vertex_array(model):
+    """Mentriangulasi face model menjadi array interleaved (posisi, normal[, uv]) float32.
+
+    Segitiga diurutkan per material sehingga setiap material menjadi satu
+    rentang berurutan; rentang tersebut disimpan di model["batches"] sebagai
+    (indeks material atau -1, vertex pertama, jumlah vertex).
+    """
+    arrays = model.pop("arrays", None)
+    if arrays is not None:
+        # Model hasil decode .qmsh sudah berupa array dan sudah ditriangulasi
+        vertices, normals, v_ids, n_ids = arrays
+    else:
+        vertices = np.asarray(model["vertices"], dtype=np.float32).reshape(-1, 3)
+        normals = np.asarray(model["normals"], dtype=np.float32).reshape(-1, 3)
+
+        # Triangulasi fan: polygon (v0, v1, ..., vn) -> (v0, vi, vi+1), untuk semua face sekaligus
+        sizes, corner_v, corner_n = mesh_codec.face_arrays(model["faces"])
+        v_ids, n_ids = mesh_codec.triangulate(sizes, corner_v, corner_n)
+    if not len(v_ids):
+        model["batches"] = []
+        return np.zeros((0, 6), dtype=np.float32)
+
+    v_ids = np.asarray(v_ids, dtype=np.int64)
+    n_ids = np.asarray(n_ids, dtype=np.int64)
+    positions = vertices[v_ids]
+
+    # Face tanpa normal memakai normal datar hasil cross product segitiganya
+    data = mesh_chunks.interleave_with_normals(positions, normals, n_ids)
+    if "corner_t" in model:
+        texcoords = np.asarray(model["texcoords"], dtype=np.float32).reshape(-1, 2)
+        t_ids = mesh_codec.triangulate(sizes, corner_v, np.asarray(model["corner_t"], dtype=np.int64))[1]
+        # Sudut tanpa vt (atau dengan indeks di luar jangkauan) mendapat uv (0, 0)
+        valid = (t_ids >= 0) & (t_ids < len(texcoords))
+        uv = np.zeros((len(t_ids), 2), dtype=np.float32)
+        uv[valid] = texcoords[t_ids[valid]]
+        data = np.hstack([data, uv])
+    data = data.reshape(-1, 3, data.shape[1])
+
+    batches = [(-1, 0, len(data))]
+    if "face_materials" in model:
+        face_materials = np.asarray(model["face_materials"], dtype=np.int64)
+        triangle_materials = np.repeat(face_materials, np.maximum(sizes - 2, 0))
+        order = np.argsort(triangle_materials, kind='stable')
+        data, triangle_materials = data[order], triangle_materials[order]
+        starts = np.flatnonzero(np.diff(triangle_materials, prepend=-2))
+        ends = np.append(starts[1:], len(data))
+        batches = list(zip(triangle_materials[starts].tolist(), starts.tolist(), ends.tolist()))
+    if len(data) >= PROGRESSIVE_MIN_TRIANGLES:
+        # Urutan LOD diterapkan di dalam setiap material agar rentangnya tetap berurutan
+        for _, start, end in batches:
+            data[start:end] = data[start:end][lod_order(data[start:end, :, :3].reshape(-1, 3))]
+    model["batches"] = [(material, start * 3, (end - start) * 3) for material, start, end in batches]
+    return np.ascontiguousarray(data.reshape(-1, data.shape[2]), dtype=np.float32)
+
+
+def lod_order(positions):
+    """Urutan segitiga kasar-ke-halus untuk render progresif.
+
+    Pusat segitiga dimasukkan ke grid 4^3, 8^3, ... LOD_MAX_GRID^3; di setiap
+    level satu segitiga per sel yang belum terwakili diambil lebih dulu.
+    Sisanya menyusul dalam urutan file.
+    """
+    centroids = positions.reshape(-1, 3, 3).mean(axis=1)
+    low = centroids.min(axis=0)
+    unit = (centroids - low) / np.maximum(centroids.max(axis=0) - low, 1e-12)
+    remaining = np.arange(len(centroids))
+    order = []
+    res = 4
+    while len(remaining) and res <= LOD_MAX_GRID:
+        cells = np.minimum((unit[remaining] * res).astype(np.int64), res - 1)
+        _, first = np.unique((cells[:, 0] * res + cells[:, 1]) * res + cells[:, 2], return_index=True)
+        order.append(remaining[first])
+        keep = np.ones(len(remaining), dtype=bool)
+        keep[first] = False
+        remaining = remaining[keep]
+        res *= 2
+    order.append(remaining)
+    return np.concatenate(order)
+
+
+def open_chunked_model(filename):
+    """Membuka mesh out-of-core .mchk sebagai model; geometrinya tetap di file (memmap)."""
+    mesh = mesh_chunks.ChunkedMesh(filename)
+    # Posisi di file .mchk sudah dipusatkan saat konversi
+    return {"vertices": [], "normals": [], "faces": [], "center": mesh.center, "extent": mesh.extent,
+            "chunked": mesh}
+
+
+def is_chunked_file(filename):
+    return filename.lower().endswith(mesh_chunks.EXTENSION)
+
+
+def is_model_file(filename):
+    return filename.lower().endswith((".obj", mesh_codec.EXTENSION, mesh_chunks.EXTENSION))
+
+
+def read_model(filename, progress=None):
+    """Membaca file model (.obj, .qmsh ringkas, atau .mchk out-of-core) menjadi dictionary model."""
+    if is_chunked_file(filename):
+        return open_chunked_model(filename)
+    if filename.lower().endswith(mesh_codec.EXTENSION):
+        return mesh_codec.load_compact(filename)
+    return load_textures(check_model(filename, parse_obj(filename, progress)))
+
+
+def load_textures(model):
+    """Mendekode tekstur material model lewat texture_cache; isi file yang sama hanya didekode sekali."""
+    textures = {}
+    for material in model.get("materials", ()):
+        path = material["texture_path"]
+        if not path: continue
+        try:
+            digest, levels = texture_cache.load(path)
+        except (OSError, ValueError) as e:
+            print(f"Peringatan: Tekstur '{os.path.basename(path)}' tidak dapat dimuat: {e}")
+            continue
+        material["texture"] = digest
+        textures[digest] = levels
+    if textures:
+        # Diunggah ke GPU oleh get_model_buffer di thread GL
+        model["textures"] = textures
+    return model
+
+
+def check_model(filename, model):
+    """Memvalidasi model hasil parse, melaporkan masalahnya, dan membuang face yang tidak dapat digambar."""
+    arrays = mesh_validate.mesh_arrays(model)
+    report, mask = mesh_validate.analyze(*arrays)
+    issues = mesh_validate.summarize(report)
+    if issues:
+        print(f"Peringatan: '{os.path.basename(filename)}': {issues}.")
+    if not report["valid"] or compact_models:
+        model = mesh_validate.clean_model(model, compact_models, mask, arrays)
+        print(f"Model '{os.path.basename(filename)}' dibersihkan: {len(model['faces'])} dari {report['faces']} face "
+              f"dan {len(model['vertices'])} dari {report['vertices']} vertex dipertahankan.")
+    else:
+        # Face yang sudah menjadi array dipakai ulang (build_vertex_array, export) tanpa tuple per face
+        model["faces"] = mesh_codec.FaceRows(*arrays[2:])
+    return model
+
+
+def describe_model(model):
+    """Ringkasan ukuran model untuk pesan konsol."""
+    if "chunked" in model:
+        mesh = model["chunked"]
+        return f"{mesh.triangle_count} segitiga dalam {mesh.chunk_count} chunk (out-of-core)"
+    return f"{len(model['vertices'])} vertices, {len(model['faces'])} faces"
+
+
+def add_model(key, model):
+    """Mendaftarkan model ke cache geometri dan memusatkannya sekali."""
+    model_cache[key] = model
+    center_model_and_reset_transform(model)
+    return model
+
+
+def add_instance(key, transform=None, color=None):
+    """Menambahkan instance baru dari model di cache ke scene dan menjadikannya aktif."""
+    global active_index
+    instance = {"model": key, "color": list(color or DEFAULT_COLOR)}
+    center_model_and_reset_transform(model_cache[key], instance)
+    if transform is not None:
+        instance["transform"].update(copy.deepcopy(transform))
+    scene.append(instance)
+    active_index = len(scene) - 1
+    return instance
+
+
+def get_active_instance():
+    """Mengembalikan instance yang sedang aktif, atau None jika scene kosong."""
+    if 0 <= active_index < len(scene):
+        return scene[active_index]
+    return None
 
 
-def export_obj(filename):
-    """Mengekspor model saat ini (dengan transformasi) ke file .obj."""
-    if not model["vertices"]:
+def load_obj(filename):
+    """Memuat model 3D dari sebuah file model sebagai instance baru di scene."""
+    if not os.path.exists(filename):
+        print(f"Error: File '{filename}' tidak ditemukan.")
+        return
+
+    key = os.path.abspath(filename)
+    if key in model_cache:
+        print(f"Model '{filename}' sudah ada di cache, memakai geometri bersama.")
+    else:
+        add_model(key, read_model(filename))
+    add_instance(key)
+    model = model_cache[key]
+    print(f"Model '{filename}' berhasil dimuat: {describe_model(model)}. Instance di scene: {len(scene)}.")
+    request_redisplay()
+
+
+def export_obj(filename, model=None, world=False):
+    """Mengekspor model instance aktif ke file .obj atau .qmsh (ringkas).
+
+    Secara default vertex ditulis di koordinat file aslinya (tanpa
+    transformasi). Dengan `world=True`, vertex dan normal ditulis setelah
+    transformasi instance aktif diterapkan (lihat world_arrays). Koordinat
+    tekstur dan material ikut ditulis ke .obj (beserta file .mtl dengan nama
+    yang sama); format ringkas hanya menyimpan posisi dan normal.
+    """
+    instance = get_active_instance()
+    if model is None:
+        model = model_cache[instance["model"]] if instance else None
+    if model and "chunked" in model:
+        print("Model out-of-core (.mchk) tidak dapat diekspor.")
+        return
+    if not model or not len(model["vertices"]):
         print("Tidak ada model untuk diekspor.")
         return
+    if world:
+        vertices, normals = world_arrays(instance)
+        model = dict({key: model[key] for key in mesh_materials.MODEL_KEYS if key in model},
+                     vertices=vertices, normals=normals, faces=model["faces"], center=(0.0, 0.0, 0.0))
+    if filename.lower().endswith(mesh_codec.EXTENSION):
+        if any(key in model for key in mesh_materials.MODEL_KEYS):
+            print("Peringatan: Format ringkas tidak menyimpan koordinat tekstur dan material.")
+        mesh_codec.save_compact(model, filename)
+        print(f"Model berhasil diekspor ke '{filename}' (format ringkas).")
+        return
+
+    materials = model.get("materials")
+    if materials:
+        library = os.path.splitext(os.path.basename(filename))[0] + ".mtl"
+        mesh_materials.write_mtl(os.path.join(os.path.dirname(filename), library), materials)
 
     with open(filename, 'w') as f:
         f.write("# Diekspor oleh Aplikasi Grafika 3D \n")
         f.write(f"# Vertices: {len(model['vertices'])}\n")
         f.write(f"# Normals: {len(model['normals'])}\n")
         f.write(f"# Faces: {len(model['faces'])}\n\n")
+        if materials:
+            f.write(f"mtllib {library}\n\n")
 
-        # Tulis semua vertex asli (sebelum transformasi)
-        for v in model["vertices"]:
-            # Tambahkan kembali offset pusat sebelum menulis
-            orig_v = (v[0] + model['center'][0], v[1] + model['center'][1], v[2] + model['center'][2])
-            f.write(f"v {orig_v[0]:.6f} {orig_v[1]:.6f} {orig_v[2]:.6f}\n")
+        # Tulis semua vertex; offset pusat ditambahkan kembali agar koordinatnya sama dengan file asli
+        vertices, normals = model_arrays(model)
+        np.savetxt(f, vertices + model["center"], fmt="v %.6f %.6f %.6f")
         f.write("\n")
 
-        # Tulis semua normal asli
-        for n in model["normals"]:
-            f.write(f"vn {n[0]:.6f} {n[1]:.6f} {n[2]:.6f}\n")
+        # Tulis semua normal
+        np.savetxt(f, normals, fmt="vn %.6f %.6f %.6f")
         f.write("\n")
 
-        # Tulis semua face dengan format v//vn
-        for face in model["faces"]:
-            face_str = "f " + " ".join([f"{v_idx + 1}//{vn_idx + 1}" for v_idx, vn_idx in face])
-            f.write(face_str + "\n")
+        faces = model["faces"]
+        if "corner_t" in model:
+            np.savetxt(f, model["texcoords"], fmt="vt %.6f %.6f")
+            f.write("\n")
+            corner_t = np.asarray(model["corner_t"]).tolist()
+            starts = list(itertools.accumulate(map(len, faces), initial=0))
+        else:
+            corner_t = None
+
+        # Face tanpa material ditulis lebih dulu, sebelum usemtl pertama: OBJ tidak punya
+        # cara kembali ke "tanpa material" setelah usemtl, dan nama yang tidak ada di .mtl tidak valid
+        face_materials = model.get("face_materials")
+        if face_materials is None:
+            order = range(len(faces))
+        else:
+            face_materials = np.asarray(face_materials)
+            order = np.concatenate([np.flatnonzero(face_materials < 0), np.flatnonzero(face_materials >= 0)]).tolist()
+
+        # Tulis semua face sebagai v/vt/vn; indeks yang tidak ada tidak ditulis (v//vn, v/vt, atau v),
+        # dengan usemtl setiap kali materialnya berganti
+        current = -1
+        for index in order:
+            if face_materials is not None and face_materials[index] != current:
+                current = int(face_materials[index])
+                f.write(f"usemtl {materials[current]['name']}\n")
+            face_t = corner_t[starts[index]:starts[index + 1]] if corner_t else itertools.repeat(-1)
+            corners = []
+            for (v_idx, vn_idx), vt_idx in zip(faces[index], face_t):
+                if vn_idx >= 0:
+                    corners.append(f"{v_idx + 1}/{vt_idx + 1 if vt_idx >= 0 else ''}/{vn_idx + 1}")
+                elif vt_idx >= 0:
+                    corners.append(f"{v_idx + 1}/{vt_idx + 1}")
+                else:
+                    corners.append(f"{v_idx + 1}")
+            f.write("f " + " ".join(corners) + "\n")
 
     print(f"Model berhasil diekspor ke '{filename}' dengan data normal.")
 
 
+def loader_worker():
+    """Thread worker: memparse file dari load_queue dan menyiapkan array vertex-nya."""
+    while True:
+        generation, filename, transform, color = load_queue.get()
+        key = os.path.abspath(filename)
+        with load_lock:
+            stale = generation != load_generation
+            if not stale:
+                load_status["file"] = os.path.basename(filename)
+                load_status["progress"] = 0.0
+
+        def report(fraction):
+            if generation != load_generation:
+                raise LoadCancelled()
+            load_status["progress"] = fraction
+
+        model = None
+        try:
+            if not stale and key not in model_cache:
+                if not os.path.exists(filename):
+                    print(f"Error: File '{filename}' tidak ditemukan.")
+                else:
+                    model = read_model(filename, report)
+                if model is not None and "chunked" not in model:
+                    center_model_and_reset_transform(model)
+                    # Triangulasi di worker agar thread GL cukup mengunggah buffer
+                    model["vertex_array"] = build_vertex_array(model)
+            elif not stale:
+                model = model_cache[key]
+        except LoadCancelled:
+            print(f"Pemuatan '{filename}' dibatalkan.")
+        except (OSError, ValueError, IndexError) as e:
+            print(f"Error: Gagal memuat '{filename}': {e}")
+
+        with load_lock:
+            load_status["pending"] -= 1
+            load_status["file"] = None
+        ready_queue.put((generation, key, filename, model, transform, color))
+
+
+def request_load(filename, transform=None, color=None):
+    """Mengantrekan file .obj untuk dimuat di latar belakang.
+
+    `transform` (sebagian atau lengkap) dan `color` diterapkan ke instance
+    baru setelah model selesai dimuat.
+    """
+    global loader_thread
+    if loader_thread is None:
+        loader_thread = threading.Thread(target=loader_worker, daemon=True)
+        loader_thread.start()
+    with load_lock:
+        load_status["pending"] += 1
+        load_queue.put((load_generation, filename, transform, color))
+    print(f"'{filename}' masuk antrean pemuatan.")
+
+
+def loads_finished():
+    """True jika tidak ada file yang sedang diparse atau menunggu diunggah."""
+    with load_lock:
+        return not load_status["pending"] and ready_queue.empty()
+
+
+def load_scene(filename):
+    """Mengantrekan semua instance dari file scene .json.
+
+    Format: {"instances": [{"file": "kubus.obj", "translate": [x, y, z],
+    "rotate": [rx, ry], "scale": s, "color": [r, g, b]}, ...]}.
+    Path file relatif terhadap folder file scene.
+    """
+    try:
+        with open(filename, 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Error: Gagal membaca scene '{filename}': {e}")
+        return
+    base_dir = os.path.dirname(os.path.abspath(filename))
+    for entry in data.get("instances", []):
+        transform = {k: entry[k] for k in ("translate", "rotate", "scale") if k in entry}
+        request_load(os.path.join(base_dir, entry["file"]), transform or None, entry.get("color"))
+
+
+def load_next_file():
+    """Memuat file berikutnya dari daftar file (argumen atau file model di folder kerja)."""
+    global file_list_index
+    candidates = file_list or sorted(f for f in os.listdir(".") if is_model_file(f))
+    if not candidates:
+        print("Tidak ada file .obj/.qmsh/.mchk di daftar file maupun di folder kerja.")
+        return
+    filename = candidates[file_list_index % len(candidates)]
+    file_list_index += 1
+    request_load(filename)
+
+
+def next_export_path():
+    """Membuat nama file export berikutnya yang belum dipakai di export_dir."""
+    index = 1
+    while os.path.exists(os.path.join(export_dir, f"export_{index:03d}.obj")):
+        index += 1
+    return os.path.join(export_dir, f"export_{index:03d}.obj")
+
+
+def cancel_loads():
+    """Membatalkan file yang sedang diparse dan semua file di antrean."""
+    global load_generation
+    with load_lock:
+        if not load_status["pending"]:
+            return
+        load_generation += 1
+    print("Semua pemuatan dibatalkan.")
+
+
+def apply_ready_load():
+    """Menukar satu model yang sudah selesai diparse ke scene (di thread GL)."""
+    try:
+        generation, key, filename, model, transform, color = ready_queue.get_nowait()
+    except queue.Empty:
+        return
+    if generation == load_generation and model is not None:
+        if key not in model_cache:
+            model_cache[key] = model
+        if not headless:
+            get_model_buffer(model_cache[key])
+        add_instance(key, transform, color)
+        print(f"Model '{filename}' berhasil dimuat: {describe_model(model)}. Instance di scene: {len(scene)}.")
+        request_redisplay()
+
+
+def poll_loads(value):
+    """Callback timer GLUT: menukar model yang sudah siap ke scene di thread GL."""
+    # Hanya satu model diunggah per tick agar frame tetap mengalir selama
+    # worker memparse file berikutnya.
+    apply_ready_load()
+
+    with load_lock:
+        if load_status["pending"]:
+            name = load_status["file"] or "..."
+            title = f"{WINDOW_TITLE} - Memuat {name} {load_status['progress'] * 100:.0f}% " \
+                    f"({load_status['pending']} dalam antrean)"
+        else:
+            title = WINDOW_TITLE
+    if title != load_status["title"]:
+        load_status["title"] = title
+        glutSetWindowTitle(title.encode("utf-8"))
+    glutTimerFunc(LOAD_POLL_MS, poll_loads, 0)
+
+
 def load_default_cube():
-    """Memuat data kubus default ke dalam struktur model."""
-    global model
-    model = {
-        "vertices": [
-            (1, -1, -1), (1, 1, -1), (-1, 1, -1), (-1, -1, -1),
-            (1, -1, 1), (1, 1, 1), (-1, -1, 1), (-1, 1, 1)
-        ],
-        "normals": [
-            (0, 0, -1), (0, 0, 1), (1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0)
-        ],
-        "faces": [
-            ((0, 0), (1, 0), (2, 0), (3, 0)),  # Belakang
-            ((4, 1), (5, 1), (7, 1), (6, 1)),  # Depan
-            ((0, 2), (4, 2), (6, 2), (3, 2)),  # Kanan
-            ((1, 3), (5, 3), (7, 3), (2, 3)),  # Kiri
-            ((1, 4), (5, 4), (4, 4), (0, 4)),  # Atas
-            ((3, 5), (2, 5), (7, 5), (6, 5))  # Bawah
-        ]
+    """Memuat data kubus default ke cache dan menambahkannya ke scene."""
+    if DEFAULT_CUBE_KEY not in model_cache:
+        add_model(DEFAULT_CUBE_KEY, {
+            "vertices": [
+                (1, -1, -1), (1, 1, -1), (-1, 1, -1), (-1, -1, -1),
+                (1, -1, 1), (1, 1, 1), (-1, -1, 1), (-1, 1, 1)
+            ],
+            "normals": [
+                (0, 0, -1), (0, 0, 1), (1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0)
+            ],
+            "faces": [
+                ((0, 0), (1, 0), (2, 0), (3, 0)),  # Belakang
+                ((4, 1), (5, 1), (7, 1), (6, 1)),  # Depan
+                ((0, 2), (4, 2), (6, 2), (3, 2)),  # Kanan
+                ((1, 3), (5, 3), (7, 3), (2, 3)),  # Kiri
+                ((1, 4), (5, 4), (4, 4), (0, 4)),  # Atas
+                ((3, 5), (2, 5), (7, 5), (6, 5))  # Bawah
+            ]
+        })
+    add_instance(DEFAULT_CUBE_KEY)
+
+
+def duplicate_active_instance():
+    """Membuat salinan instance aktif yang berbagi geometri yang sama."""
+    instance = get_active_instance()
+    if instance is None: return
+    transform = {
+        "rotate": list(instance["transform"]["rotate"]),
+        "translate": list(instance["transform"]["translate"]),
+        "scale": instance["transform"]["scale"],
     }
-    center_model_and_reset_transform()  # Pusatkan kubus juga
+    transform["translate"][0] += model_cache[instance["model"]]["extent"] * 0.5
+    add_instance(instance["model"], transform, instance["color"])
+    print(f"Instance diduplikasi. Instance di scene: {len(scene)}.")
+
+
+def remove_active_instance():
+    """Menghapus instance aktif dan membebaskan geometri yang tidak lagi dipakai."""
+    global active_index
+    instance = get_active_instance()
+    if instance is None: return
+    scene.pop(active_index)
+    world_cache.pop(id(instance), None)
+    active_index = min(active_index, len(scene) - 1)
+    key = instance["model"]
+    if not any(inst["model"] == key for inst in scene):
+        model = model_cache.pop(key)
+        if "buffer" in model and model["buffer"]["vbo"]:
+            glDeleteBuffers(1, [model["buffer"]["vbo"]])
+            release_textures(model)
+        if "chunked" in model and chunk_cache is not None:
+            chunk_cache.drop_mesh(model["chunked"])
+    print(f"Instance dihapus. Instance di scene: {len(scene)}.")
+
+
+def select_next_instance():
+    """Menjadikan instance berikutnya di scene sebagai instance aktif."""
+    global active_index
+    if not scene: return
+    active_index = (active_index + 1) % len(scene)
+    print(f"Instance aktif: {active_index + 1}/{len(scene)} ({os.path.basename(scene[active_index]['model'])})")
+
+
+def model_arrays(model):
+    """Posisi (n, 3) dan normal (m, 3) model sebagai array float64, dibuat sekali per model."""
+    if "local_arrays" not in model:
+        model["local_arrays"] = (np.asarray(model["vertices"], dtype=np.float64).reshape(-1, 3),
+                                 np.asarray(model["normals"], dtype=np.float64).reshape(-1, 3))
+    return model["local_arrays"]
+
+
+def model_triangles(model):
+    """Indeks vertex segitiga (t, 3) hasil triangulasi fan semua face, dibuat sekali per model."""
+    if "triangle_ids" not in model:
+        sizes, corner_v, corner_n = mesh_codec.face_arrays(model["faces"])
+        v_ids, _ = mesh_codec.triangulate(sizes, corner_v, corner_n)
+        model["triangle_ids"] = v_ids.reshape(-1, 3)
+    return model["triangle_ids"]
+
+
+def transform_stamp(instance):
+    """Penanda versi world_arrays: berubah jika rotate, translate, scale, atau model instance berubah."""
+    tr = instance["transform"]
+    return id(model_cache[instance["model"]]), tuple(tr["rotate"]), tuple(tr["translate"]), tr["scale"]
+
+
+def world_entry(instance):
+    """Entri world_cache instance; dihitung ulang hanya jika penanda versinya berbeda."""
+    stamp = transform_stamp(instance)
+    entry = world_cache.get(id(instance))
+    if entry is None or entry["instance"] is not instance or entry["stamp"] != stamp:
+        positions, normals = model_arrays(model_cache[instance["model"]])
+        matrix = instance_matrix(instance)
+        # Bagian affine matriks 4x4 instance, diterapkan ke seluruh array sekaligus
+        vertices = positions @ matrix[:3, :3].T + matrix[:3, 3]
+        # Normal memakai invers-transpos 3x3 (sebagai vektor baris: n @ M^-1), lalu dinormalkan
+        normals = normals @ np.linalg.inv(matrix[:3, :3])
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        normals /= np.where(lengths > 0.0, lengths, 1.0)
+        # Dipakai bersama oleh semua pemanggil, jadi dibuat read-only
+        vertices.flags.writeable = False
+        normals.flags.writeable = False
+        entry = {"instance": instance, "stamp": stamp, "vertices": vertices, "normals": normals}
+        world_cache[id(instance)] = entry
+    return entry
+
+
+def world_arrays(instance):
+    """Vertex dan normal instance dalam koordinat dunia (read-only, float64)."""
+    entry = world_entry(instance)
+    return entry["vertices"], entry["normals"]
+
+
+def instance_bounds(instance):
+    """AABB (min, max) instance dalam koordinat dunia, atau None jika modelnya kosong."""
+    entry = world_entry(instance)
+    if "bounds" not in entry:
+        model = model_cache[instance["model"]]
+        if "chunked" in model:
+            # Geometri out-of-core tidak dibaca; cukup transformasikan 8 sudut AABB file .mchk
+            mesh = model["chunked"]
+            points = np.array([[(mesh.low, mesh.high)[(corner >> axis) & 1][axis] for axis in range(3)]
+                               for corner in range(8)])
+            matrix = instance_matrix(instance)
+            points = points @ matrix[:3, :3].T + matrix[:3, 3]
+        else:
+            points = entry["vertices"]
+        entry["bounds"] = (points.min(axis=0), points.max(axis=0)) if len(points) else None
+    return entry["bounds"]
+
+
+def pick_ray(x, y):
+    """Sinar (asal, arah satuan) dalam koordinat dunia melalui piksel window (x, y), asal kiri atas."""
+    height = max(window_height, 1)
+    half = tan(radians(CAMERA_FOVY) / 2.0)
+    ndc_x = 2.0 * (x + 0.5) / window_width - 1.0
+    ndc_y = 1.0 - 2.0 * (y + 0.5) / height
+    # Kamera di CAMERA_EYE melihat ke arah -z dengan sumbu y ke atas (lihat render_scene)
+    direction = np.array([ndc_x * half * window_width / height, ndc_y * half, -1.0])
+    return np.array(CAMERA_EYE), direction / np.linalg.norm(direction)
+
+
+def ray_box_distance(origin, direction, low, high):
+    """Jarak sepanjang sinar ke titik masuk AABB (0 jika asal di dalam), atau None jika tidak kena."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t0 = (low - origin) / direction
+        t1 = (high - origin) / direction
+    near = np.nanmax(np.minimum(t0, t1))
+    far = np.nanmin(np.maximum(t0, t1))
+    if near > far or far < 0.0:
+        return None
+    return max(float(near), 0.0)
+
+
+def ray_triangle_distance(origin, direction, vertices, triangles):
+    """Jarak terdekat sepanjang sinar ke salah satu segitiga (Moller-Trumbore), atau None."""
+    best = np.inf
+    for start in range(0, len(triangles), PICK_BLOCK):
+        corners = vertices[triangles[start:start + PICK_BLOCK]]
+        v0 = corners[:, 0]
+        edge1, edge2 = corners[:, 1] - v0, corners[:, 2] - v0
+        p = np.cross(direction, edge2)
+        det = np.einsum('ij,ij->i', edge1, p)
+        valid = np.abs(det) > 1e-12
+        inv_det = 1.0 / np.where(valid, det, 1.0)
+        s = origin - v0
+        u = np.einsum('ij,ij->i', s, p) * inv_det
+        q = np.cross(s, edge1)
+        v = (q @ direction) * inv_det
+        t = np.einsum('ij,ij->i', edge2, q) * inv_det
+        hit = valid & (u >= 0.0) & (v >= 0.0) & (u + v <= 1.0) & (t > 0.0)
+        if hit.any():
+            best = min(best, float(t[hit].min()))
+    return best if best < np.inf else None
+
+
+def pick_instance(x, y):
+    """Menjadikan instance terdekat di bawah piksel window (x, y) sebagai instance aktif.
+
+    AABB dunia dipakai sebagai uji kasar; segitiga hanya diuji untuk instance
+    yang AABB-nya terkena sinar. Model out-of-core dipilih dari AABB-nya saja.
+    """
+    global active_index
+    origin, direction = pick_ray(x, y)
+    best, best_index = np.inf, -1
+    for index, instance in enumerate(scene):
+        bounds = instance_bounds(instance)
+        if bounds is None: continue
+        distance = ray_box_distance(origin, direction, *bounds)
+        if distance is None or distance >= best: continue
+        model = model_cache[instance["model"]]
+        if "chunked" not in model:
+            distance = ray_triangle_distance(origin, direction, world_arrays(instance)[0], model_triangles(model))
+        if distance is not None and distance < best:
+            best, best_index = distance, index
+    if best_index < 0:
+        print("Tidak ada instance di posisi kursor.")
+        return False
+    active_index = best_index
+    print(f"Instance aktif: {active_index + 1}/{len(scene)} ({os.path.basename(scene[active_index]['model'])})")
+    return True
 
 
 # =============================================================================
@@ -200,12 +964,19 @@ def load_default_cube():
 def print_instructions():
     """Mencetak panduan penggunaan ke konsol."""
     print("=" * 60)
-    print("      Aplikasi Grafika 3D Interaktif - PyOpenGL v1.5")
+    print("      Aplikasi Grafika 3D Interaktif - PyOpenGL v1.7")
     print("=" * 60)
     print("--- FILE ---")
-    print("  [I] Import File .obj (Ketik nama file di konsol)")
-    print("  [O] Export File .obj (Ketik nama file di konsol)")
-    print("\n--- KONTROL OBJEK ---")
+    print("  [I] Import file .obj berikutnya dari daftar file sebagai instance baru")
+    print("  [C] Batalkan pemuatan yang sedang berjalan")
+    print("  [O] Export File .obj instance aktif (export_NNN.obj)")
+    print("  [P] Export File .obj instance aktif dengan transformasinya (koordinat dunia)")
+    print("\n--- SCENE ---")
+    print("  [TAB] Pilih instance berikutnya")
+    print("  Klik kanan: Pilih instance di bawah kursor")
+    print("  [N] Duplikat instance aktif (berbagi geometri)")
+    print("  [DELETE] / [BACKSPACE] Hapus instance aktif")
+    print("\n--- KONTROL OBJEK (instance aktif) ---")
     print("  Rotasi    : Klik kiri dan seret mouse")
     print("  Zoom      : Scroll mouse wheel")
     print("  Translasi : W, A, S, D")
@@ -220,25 +991,399 @@ def print_instructions():
 # 4. FUNGSI MENGGAMBAR OBJEK
 # =============================================================================
 
-def draw_model():
-    """Menggambar model yang saat ini dimuat dengan shading yang benar."""
-    if not model["faces"]: return
+# GLSL 1.20 agar berjalan di konteks kompatibilitas (termasuk Mesa llvmpipe).
+# Posisi, normal, dan uv tetap dibaca dari array klien (glVertexPointer, dst.).
+VERTEX_SHADER = """
+#version 120
+uniform mat4 modelview;
+uniform mat4 projection;
+uniform mat3 normal_matrix;
+varying vec3 eye_position;
+varying vec3 eye_normal;
+
+void main() {
+    vec4 position = modelview * gl_Vertex;
+    eye_position = position.xyz;
+    eye_normal = normal_matrix * gl_Normal;
+    gl_TexCoord[0] = gl_MultiTexCoord0;
+    gl_Position = projection * position;
+}
+"""
+
+# Konstanta pencahayaan sama dengan init_fixed_lighting: ambient = (0.2 ambient
+# global + 0.2 ambient lampu) * 0.7 ambient material, diffuse = warna instance,
+# specular putih dengan shininess 100 (viewer di tak hingga seperti fixed-function).
+# Pada batch material bertekstur, warna diffuse dikalikan dengan warna tekstur.
+FRAGMENT_SHADER = """
+#version 120
+uniform vec3 color;
+uniform vec3 light_position;
+uniform bool textured;
+uniform sampler2D diffuse_map;
+varying vec3 eye_position;
+varying vec3 eye_normal;
+
+const float AMBIENT = 0.28;
+const float SHININESS = 100.0;
+
+void main() {
+    vec3 normal = normalize(eye_normal);
+    vec3 light = normalize(light_position - eye_position);
+    float diffuse = max(dot(normal, light), 0.0);
+    float specular = 0.0;
+    if (diffuse > 0.0)
+        specular = pow(max(dot(normal, normalize(light + vec3(0.0, 0.0, 1.0))), 0.0), SHININESS);
+    vec3 base = textured ? color * texture2D(diffuse_map, gl_TexCoord[0].st).rgb : color;
+    gl_FragColor = vec4(min(vec3(AMBIENT) + base * diffuse + vec3(specular), 1.0), 1.0);
+}
+"""
+
+
+def init_shader_program():
+    """Mengompilasi program shader pencahayaan per piksel. Mengembalikan False jika gagal."""
+    try:
+        program = shaders.compileProgram(shaders.compileShader(VERTEX_SHADER, GL_VERTEX_SHADER),
+                                         shaders.compileShader(FRAGMENT_SHADER, GL_FRAGMENT_SHADER))
+    except (RuntimeError, GLError) as e:
+        print(f"Shader tidak dapat dipakai, kembali ke pencahayaan fixed-function: {e}")
+        return False
+    shading["program"] = program
+    shading["uniforms"] = {name: glGetUniformLocation(program, name)
+                           for name in ("modelview", "projection", "normal_matrix", "color", "light_position",
+                                        "textured", "diffuse_map")}
+    print("Pencahayaan per piksel (shader GLSL) aktif.")
+    return True
+
+
+def begin_shader_frame(view, projection):
+    """Memasang program shader dan uniform yang sama untuk seluruh frame (proyeksi, posisi lampu)."""
+    uniforms = shading["uniforms"]
+    glUseProgram(shading["program"])
+    glUniformMatrix4fv(uniforms["projection"], 1, GL_TRUE, projection.astype(np.float32))
+    glUniform1i(uniforms["diffuse_map"], 0)
+    glUniform1i(uniforms["textured"], 0)
+    light = view @ np.array(LIGHT_POSITION)
+    glUniform3f(uniforms["light_position"], *light[:3])
+
+
+def get_model_buffer(model):
+    """Mengembalikan buffer geometri (VBO) model, mengunggahnya sekali jika belum ada."""
+    if "chunked" in model:
+        # Geometri out-of-core digambar per chunk (draw_chunked_instance)
+        model.setdefault("buffer", {"vbo": None, "count": 0, "stride": VERTEX_STRIDE, "batches": []})
+    if "buffer" not in model:
+        data = model.pop("vertex_array", None)
+        if data is None:
+            data = build_vertex_array(model)
+        vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        model["buffer"] = {"vbo": vbo, "count": len(data), "stride": data.shape[1] * 4,
+                           "batches": model.pop("batches")}
+        upload_textures(model)
+    return model["buffer"]
+
+
+def upload_textures(model):
+    """Mengunggah tekstur material model beserta seluruh level mipmap-nya, kecuali yang sudah ada di GPU."""
+    for digest, levels in model.pop("textures", {}).items():
+        entry = texture_objects.get(digest)
+        if entry is None:
+            texture = glGenTextures(1)
+            glBindTexture(GL_TEXTURE_2D, texture)
+            glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+            for level, image in enumerate(levels):
+                glTexImage2D(GL_TEXTURE_2D, level, GL_RGBA8, image.shape[1], image.shape[0], 0,
+                             GL_RGBA, GL_UNSIGNED_BYTE, image)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
+            glBindTexture(GL_TEXTURE_2D, 0)
+            entry = texture_objects[digest] = {"id": texture, "users": 0}
+        entry["users"] += 1
+
+
+def release_textures(model):
+    """Melepas tekstur yang dipakai model; tekstur GL dihapus jika tidak ada model lain yang memakainya."""
+    for digest in {material.get("texture") for material in model.get("materials", ())} - {None}:
+        entry = texture_objects.get(digest)
+        if entry is None: continue
+        entry["users"] -= 1
+        if not entry["users"]:
+            glDeleteTextures(1, [entry["id"]])
+            del texture_objects[digest]
+
+
+def material_state(model, material):
+    """Warna (None = warna instance) dan tekstur GL (atau None) untuk satu batch material."""
+    if material < 0:
+        return None, None
+    material = model["materials"][material]
+    entry = texture_objects.get(material.get("texture"))
+    return material["diffuse"], entry["id"] if entry else None
+
+
+def bind_texture(texture):
+    """Memasang tekstur diffuse (id GL), atau melepasnya jika None."""
+    glBindTexture(GL_TEXTURE_2D, texture or 0)
+    if shading["program"]:
+        glUniform1i(shading["uniforms"]["textured"], texture is not None)
+    elif texture is not None:
+        glEnable(GL_TEXTURE_2D)
+    else:
+        glDisable(GL_TEXTURE_2D)
+
+
+def draw_scene(start=0.0, end=1.0):
+    """Menggambar semua instance, dikelompokkan per model agar buffer hanya di-bind sekali.
+
+    Di dalam setiap model, segitiga sudah berurutan per material: tekstur dan
+    warna satu material dipasang sekali, lalu semua instance menggambar
+    rentangnya dengan satu glDrawArrays. `start` dan `end` adalah fraksi
+    segitiga setiap batch yang digambar (untuk render progresif); default
+    seluruh model.
+    """
+    groups = {}
+    for instance in scene:
+        groups.setdefault(instance["model"], []).append(instance)
+
+    # Matriks kamera dan proyeksi (window atau tile) dibaca sekali per frame
+    view = get_gl_matrix(GL_MODELVIEW_MATRIX)
+    projection = get_gl_matrix(GL_PROJECTION_MATRIX)
+    if shading["program"]:
+        begin_shader_frame(view, projection)
+
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glEnableClientState(GL_NORMAL_ARRAY)
+    for key, instances in groups.items():
+        model = model_cache[key]
+        if "chunked" in model:
+            # Model out-of-core sudah memilih LOD per chunk; digambar utuh di potongan pertama
+            if start == 0.0:
+                for instance in instances:
+                    draw_chunked_instance(model["chunked"], instance, VERTEX_STRIDE, view, projection)
+            continue
+        buffer = get_model_buffer(model)
+        stride = buffer["stride"]
+        textured = stride == TEXTURED_VERTEX_STRIDE
+        glBindBuffer(GL_ARRAY_BUFFER, buffer["vbo"])
+        glVertexPointer(3, GL_FLOAT, stride, ctypes.c_void_p(0))
+        glNormalPointer(GL_FLOAT, stride, ctypes.c_void_p(12))
+        if textured:
+            glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+            glTexCoordPointer(2, GL_FLOAT, stride, ctypes.c_void_p(24))
+
+        ranges = []
+        for material, offset, count in buffer["batches"]:
+            triangles = count // 3
+            first, last = offset + int(start * triangles) * 3, offset + int(end * triangles) * 3
+            if last > first:
+                ranges.append((first, last - first) + material_state(model, material))
+
+        # Transformasi (dan matriks normalnya) dipasang sekali per instance, bukan per batch;
+        # di dalamnya setiap batch hanya mengganti warna dan tekstur material
+        bound = False
+        for instance in instances:
+            begin_instance(view, instance)
+            current = instance["color"]
+            for first, count, color, texture in ranges:
+                color = color or instance["color"]
+                if color != current:
+                    set_instance_color(color)
+                    current = color
+                if textured and (not bound or texture != bound_texture):
+                    bind_texture(texture)
+                    bound, bound_texture = True, texture
+                glDrawArrays(GL_TRIANGLES, first, count)
+            end_instance()
+
+        if textured:
+            bind_texture(None)
+            glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+    glDisableClientState(GL_NORMAL_ARRAY)
+    glDisableClientState(GL_VERTEX_ARRAY)
+    if shading["program"]:
+        glUseProgram(0)
+
+
+def get_gl_matrix(name):
+    """Matriks OpenGL (mis. GL_MODELVIEW_MATRIX) sebagai array 4x4 NumPy dengan konvensi matematis."""
+    # glGetFloatv mengembalikan matriks kolom-mayor (transpos dari bentuk matematisnya)
+    return np.asarray(glGetFloatv(name), dtype=np.float64).reshape(4, 4).T
+
+
+def instance_matrix(instance):
+    """Matriks model 4x4 instance, sama dengan urutan glTranslatef, glRotatef (x lalu y), glScalef."""
+    tr = instance["transform"]
+    ax, ay = radians(tr["rotate"][0]), radians(tr["rotate"][1])
+    translate = np.identity(4)
+    translate[:3, 3] = tr["translate"]
+    rotate_x = np.array([[1, 0, 0, 0], [0, cos(ax), -sin(ax), 0], [0, sin(ax), cos(ax), 0], [0, 0, 0, 1]])
+    rotate_y = np.array([[cos(ay), 0, sin(ay), 0], [0, 1, 0, 0], [-sin(ay), 0, cos(ay), 0], [0, 0, 0, 1]])
+    scale = np.diag([tr["scale"], tr["scale"], tr["scale"], 1.0])
+    return translate @ rotate_x @ rotate_y @ scale
+
+
+def apply_instance_transform(instance):
+    """Menerapkan transformasi dan warna instance ke matriks model-view yang aktif."""
+    # Rotasi terjadi di sekitar (0,0,0) karena modelnya sudah dipusatkan.
+    tr = instance["transform"]
+    glTranslatef(*tr["translate"])
+    glRotatef(tr["rotate"][0], 1, 0, 0)
+    glRotatef(tr["rotate"][1], 0, 1, 0)
+    glScalef(tr["scale"], tr["scale"], tr["scale"])
+    glColor3fv(instance["color"])
+
+
+def begin_instance(view, instance):
+    """Memasang transformasi dan warna instance: sebagai uniform shader, atau di stack matriks fixed-function.
+
+    Dipanggil sekali per instance per frame; batch material di dalamnya hanya
+    mengganti warna lewat set_instance_color.
+    """
+    if not shading["program"]:
+        glPushMatrix()
+        apply_instance_transform(instance)
+        return
+    uniforms = shading["uniforms"]
+    modelview = view @ instance_matrix(instance)
+    # Matriks normal = invers-transpos 3x3 model-view; menggantikan GL_NORMALIZE untuk skala
+    normal_matrix = np.linalg.inv(modelview[:3, :3]).T
+    glUniformMatrix4fv(uniforms["modelview"], 1, GL_TRUE, modelview.astype(np.float32))
+    glUniformMatrix3fv(uniforms["normal_matrix"], 1, GL_TRUE, normal_matrix.astype(np.float32))
+    glUniform3f(uniforms["color"], *instance["color"])
+
+
+def set_instance_color(color):
+    """Mengganti warna gambar instance yang aktif (mis. warna diffuse material) tanpa menyentuh transformasinya."""
+    if shading["program"]:
+        glUniform3f(shading["uniforms"]["color"], *color)
+    else:
+        glColor3fv(color)
+
+
+def end_instance():
+    if not shading["program"]:
+        glPopMatrix()
+
+
+def upload_chunk(mesh, index, level):
+    """Membaca chunk pada level LOD `level` dari file (memmap) dan mengunggahnya ke VBO baru."""
+    data = mesh.chunk_data(index, level)
+    vbo = glGenBuffers(1)
+    glBindBuffer(GL_ARRAY_BUFFER, vbo)
+    glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
+    return vbo
+
+
+def draw_chunked_instance(mesh, instance, stride, view, projection):
+    """Menggambar chunk model out-of-core yang terlihat dengan LOD sesuai ukurannya di layar.
+
+    Chunk yang belum ada di cache dimuat selama anggaran unggahan frame masih
+    ada; sisanya memakai level yang sudah dimuat (atau dilewati) dan frame
+    berikutnya diminta agar pemuatan berlanjut.
+    """
+    global chunk_cache
+    if chunk_cache is None:
+        chunk_cache = mesh_chunks.ChunkCache(chunk_cache_mb * 1024 * 1024, load=upload_chunk,
+                                             release=lambda vbo: glDeleteBuffers(1, [vbo]))
+    begin_instance(view, instance)
+    viewport = glGetIntegerv(GL_VIEWPORT)
+    mvp = projection @ view @ instance_matrix(instance)
+    for index, level in mesh.select_chunks(mvp, viewport[2:4]):
+        loaded = chunk_cache.loaded_bytes
+        entry = chunk_cache.get(mesh, index, level, allow_load=chunk_upload["budget"] > 0)
+        chunk_upload["budget"] -= chunk_cache.loaded_bytes - loaded
+        if entry is None or entry[1] > level:
+            chunk_upload["pending"] = True
+        if entry is None: continue
+        vbo, loaded_level = entry
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glVertexPointer(3, GL_FLOAT, stride, ctypes.c_void_p(0))
+        glNormalPointer(GL_FLOAT, stride, ctypes.c_void_p(12))
+        glDrawArrays(GL_TRIANGLES, 0, mesh.chunk_triangles(index, loaded_level) * 3)
+    end_instance()
+
+
+def scene_triangle_count():
+    """Jumlah segitiga seluruh instance di scene."""
+    return sum(get_model_buffer(model_cache[instance["model"]])["count"] // 3 for instance in scene)
+
+
+def ensure_progressive_layer():
+    """Menyiapkan FBO (warna + depth) seukuran window untuk render progresif. False jika tidak didukung."""
+    size = (window_width, max(window_height, 1))
+    if progressive["size"] == size:
+        return bool(progressive["fbo"])
+    if progressive["fbo"]:
+        glDeleteFramebuffers(1, [progressive["fbo"]])
+        glDeleteRenderbuffers(2, progressive["rbos"])
+    progressive.update({"fbo": 0, "rbos": None, "size": size})
+    if not bool(glGenFramebuffers):
+        return False
+    rbos = glGenRenderbuffers(2)
+    glBindRenderbuffer(GL_RENDERBUFFER, rbos[0])
+    glRenderbufferStorage(GL_RENDERBUFFER, GL_RGBA8, size[0], size[1])
+    glBindRenderbuffer(GL_RENDERBUFFER, rbos[1])
+    glRenderbufferStorage(GL_RENDERBUFFER, GL_DEPTH_COMPONENT24, size[0], size[1])
+    fbo = glGenFramebuffers(1)
+    glBindFramebuffer(GL_FRAMEBUFFER, fbo)
+    glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_RENDERBUFFER, rbos[0])
+    glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_DEPTH_ATTACHMENT, GL_RENDERBUFFER, rbos[1])
+    complete = glCheckFramebufferStatus(GL_FRAMEBUFFER) == GL_FRAMEBUFFER_COMPLETE
+    glBindFramebuffer(GL_FRAMEBUFFER, 0)
+    if not complete:
+        glDeleteFramebuffers(1, [fbo])
+        glDeleteRenderbuffers(2, rbos)
+        return False
+    progressive.update({"fbo": fbo, "rbos": rbos})
+    return True
+
+
+def set_refine_idle(active):
+    """Memasang/melepas idle callback penyempurnaan progresif."""
+    if active != progressive["idle"]:
+        progressive["idle"] = active
+        glutIdleFunc(refine_idle if active else None)
+
+
+def refine_step():
+    """Menggambar potongan LOD berikutnya ke lapisan progresif dalam anggaran waktu, lalu menampilkannya."""
+    total = scene_triangle_count()
+    start = progressive["done"]
+    end = min(1.0, start + progressive["tris_per_ms"] * progressive["budget_ms"] / max(total, 1))
+    glBindFramebuffer(GL_FRAMEBUFFER, progressive["fbo"])
+    began = time.perf_counter()
+    render_scene(start, end)
+    glFinish()
+    elapsed_ms = (time.perf_counter() - began) * 1000.0
+    # Laju segitiga per ms diperbarui agar potongan berikutnya pas dengan anggaran
+    if elapsed_ms > 0:
+        progressive["tris_per_ms"] = max(100.0, (end - start) * total / elapsed_ms)
+    progressive["done"] = end
+
+    w, h = progressive["size"]
+    glBindFramebuffer(GL_DRAW_FRAMEBUFFER, 0)
+    glBlitFramebuffer(0, 0, w, h, 0, 0, w, h, GL_COLOR_BUFFER_BIT, GL_NEAREST)
+    glBindFramebuffer(GL_FRAMEBUFFER, 0)
+    glutSwapBuffers()
+    set_refine_idle(end < 1.0)
+    # Chunk out-of-core yang tertahan anggaran unggahan dimuat di frame berikutnya,
+    # setelah penyempurnaan selesai agar tidak memulai ulang dari prefiks kasar
+    if end >= 1.0 and chunk_upload["pending"]:
+        request_redisplay()
 
-    for face in model["faces"]:
-        # Gambar sebagai triangles atau quads tergantung jumlah vertex
-        if len(face) == 3:
-            glBegin(GL_TRIANGLES)
-        elif len(face) == 4:
-            glBegin(GL_QUADS)
-        else:
-            glBegin(GL_POLYGON)
 
-        for v_idx, vn_idx in face:
-            # Terapkan normal untuk SETIAP vertex untuk smooth shading
-            if model["normals"] and vn_idx != -1:
-                glNormal3fv(model["normals"][vn_idx])
-            glVertex3fv(model["vertices"][v_idx])
-        glEnd()
+def refine_idle():
+    """Idle callback GLUT: menambah detail sampai seluruh segitiga tergambar."""
+    if progressive["done"] < 1.0:
+        refine_step()
+    else:
+        set_refine_idle(False)
 
 
 # =============================================================================
@@ -247,26 +1392,37 @@ def draw_model():
 
 def display():
     """Fungsi display utama, dipanggil setiap kali layar perlu digambar ulang."""
-    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-    glLoadIdentity()
-    gluLookAt(0, 0, 5, 0, 0, 0, 0, 1, 0)
+    frame_scheduler.begin_frame()
+    chunk_upload.update({"budget": CHUNK_UPLOAD_BYTES_PER_FRAME, "pending": False})
+    # Scene besar: mulai ulang dari prefiks kasar, sisanya lewat idle callback
+    if (progressive["enabled"] and scene_triangle_count() >= PROGRESSIVE_MIN_TRIANGLES
+            and ensure_progressive_layer()):
+        progressive["done"] = 0.0
+        refine_step()
+        return
+    set_refine_idle(False)
+    render_scene()
+    glutSwapBuffers()
+    if chunk_upload["pending"]:
+        request_redisplay()
 
-    light_position = [2.0, 3.0, 4.0, 1.0]
-    glLightfv(GL_LIGHT0, GL_POSITION, light_position)
 
-    # Terapkan transformasi interaktif. Rotasi kini terjadi di sekitar (0,0,0)
-    # karena modelnya sudah dipusatkan.
-    glPushMatrix()  # Simpan matriks saat ini
-    glTranslatef(translate_x, translate_y, translate_z)
-    glRotatef(rotation_x, 1, 0, 0)
-    glRotatef(rotation_y, 0, 1, 0)
-    glScalef(scale_factor, scale_factor, scale_factor)
+def render_scene(start=0.0, end=1.0):
+    """Menggambar scene dengan proyeksi yang sedang terpasang (window atau tile).
 
-    glColor3fv(object_color)
-    draw_model()
-    glPopMatrix()  # Kembalikan matriks
+    Buffer hanya dibersihkan jika `start` 0; potongan berikutnya ditambahkan
+    di atas gambar sebelumnya (lihat draw_scene).
+    """
+    if start == 0.0:
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+    glLoadIdentity()
+    gluLookAt(*CAMERA_EYE, 0, 0, 0, 0, 1, 0)
 
-    glutSwapBuffers()
+    if not shading["program"]:
+        glLightfv(GL_LIGHT0, GL_POSITION, LIGHT_POSITION)
+
+    # Terapkan transformasi interaktif per instance
+    draw_scene(start, end)
 
 
 def reshape(w, h):
@@ -277,15 +1433,53 @@ def reshape(w, h):
     glViewport(0, 0, w, h)
     glMatrixMode(GL_PROJECTION)
     glLoadIdentity()
-    gluPerspective(45.0, float(w) / float(h), 0.1, 500.0)  # Perbesar zFar
+    gluPerspective(CAMERA_FOVY, float(w) / float(h), CAMERA_NEAR, CAMERA_FAR)
     glMatrixMode(GL_MODELVIEW)
     glLoadIdentity()
 
 
-def init():
+def render_image(filename, width=None):
+    """Merender scene per tile ke file .png/.ppm; lebar default 4x lebar window."""
+    if headless:
+        print("Error: Render membutuhkan window OpenGL (tidak tersedia saat --headless).")
+        return
+    width = int(width) if width else window_width * 4
+    height = max(1, round(width * window_height / window_width))
+
+    def render_tile(x0, y0, x1, y1, width, height):
+        glMatrixMode(GL_PROJECTION)
+        glLoadIdentity()
+        tiled_render.tile_frustum(CAMERA_FOVY, CAMERA_NEAR, CAMERA_FAR, x0, y0, x1, y1, width, height)
+        glMatrixMode(GL_MODELVIEW)
+        # Chunk out-of-core tile ini dimuat semuanya (tanpa batas unggahan per frame)
+        chunk_upload["budget"] = float("inf")
+        render_scene()
+
+    try:
+        tiled_render.render_tiled(filename, width, height, render_tile)
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"Error: Gagal merender '{filename}': {e}")
+        return
+    finally:
+        reshape(window_width, window_height)
+    print(f"Gambar {width}x{height} dirender ke '{filename}'.")
+
+
+def init(default_cube=True):
     """Inisialisasi state OpenGL."""
     glClearColor(1.0, 1.0, 1.0, 1.0)
     glEnable(GL_DEPTH_TEST)
+    if not (shading["requested"] and init_shader_program()):
+        init_fixed_lighting()
+
+    if default_cube:
+        load_default_cube()
+    # Panduan dicetak setelah frame pertama agar tidak menunda tampilnya window
+    input_events.after_first_frame(print_instructions)
+
+
+def init_fixed_lighting():
+    """Mengatur lampu dan material fixed-function (dipakai jika shader tidak aktif)."""
     glEnable(GL_LIGHTING)
     glEnable(GL_LIGHT0)
     glShadeModel(GL_SMOOTH)
@@ -313,9 +1507,6 @@ def init():
     glEnable(GL_COLOR_MATERIAL)
     glColorMaterial(GL_FRONT, GL_DIFFUSE)
 
-    load_default_cube()
-    print_instructions()
-
 
 # =============================================================================
 # 6. FUNGSI CALLBACK INPUT (MOUSE DAN KEYBOARD)
@@ -323,7 +1514,21 @@ def init():
 
 def keyboard(key, x, y):
     """Callback untuk input keyboard."""
-    global translate_x, translate_y, scale_factor, object_color
+    instance = get_active_instance()
+
+    if key == b'\x1b':
+        print("Keluar dari aplikasi.")
+        if not headless:
+            glutLeaveMainLoop()
+        return
+    if key == b'\t':
+        select_next_instance()
+        request_redisplay()
+        return
+    if key == b'\x08' or key == b'\x7f':  # Backspace atau Delete
+        remove_active_instance()
+        request_redisplay()
+        return
 
     try:
         key_char = key.decode("utf-8").lower()
@@ -333,44 +1538,53 @@ def keyboard(key, x, y):
     step = 0.2
     scale_step = 1.1
 
-    if key == b'\x1b':
-        print("Keluar dari aplikasi.")
-        glutLeaveMainLoop()
-    elif key_char == 'i':
-        filename = input(">>> Masukkan nama file .obj untuk diimpor: ")
-        load_obj(filename)
+    # Muat, batal, dan export tidak langsung mengubah gambar; model yang
+    # selesai dimuat meminta frame sendiri dari apply_ready_load().
+    if key_char == 'i':
+        load_next_file(); return
+    elif key_char == 'c':
+        cancel_loads(); return
     elif key_char == 'o':
-        filename = input(">>> Masukkan nama file .obj untuk diekspor: ")
-        export_obj(filename)
-    elif key_char == 'w':
-        translate_y += step
-    elif key_char == 's':
-        translate_y -= step
-    elif key_char == 'a':
-        translate_x -= step
-    elif key_char == 'd':
-        translate_x += step
-    elif key_char in ['=', '+']:
-        scale_factor *= scale_step
-    elif key_char == '-':
-        scale_factor /= scale_step
-    elif key_char == '1':
-        object_color = [1.0, 0.3, 0.3]; print("Warna: Merah")
-    elif key_char == '2':
-        object_color = [0.3, 1.0, 0.3]; print("Warna: Hijau")
-    elif key_char == '3':
-        object_color = [0.3, 0.3, 1.0]; print("Warna: Biru")
-    elif key_char == '4':
-        object_color = [1.0, 1.0, 0.3]; print("Warna: Kuning")
-    elif key_char == '5':
-        object_color = [1.0, 0.3, 1.0]; print("Warna: Jingga")
-    elif key_char == '6':
-        object_color = [0.6, 0.7, 1.0]; print("Warna: Biru Muda (Default)")
-    glutPostRedisplay()
+        export_obj(next_export_path()); return
+    elif key_char == 'p':
+        export_obj(next_export_path(), world=True); return
+    elif key_char == 'n':
+        duplicate_active_instance()
+    elif instance is not None:
+        tr = instance["transform"]
+        if key_char == 'w':
+            tr["translate"][1] += step
+        elif key_char == 's':
+            tr["translate"][1] -= step
+        elif key_char == 'a':
+            tr["translate"][0] -= step
+        elif key_char == 'd':
+            tr["translate"][0] += step
+        elif key_char in ['=', '+']:
+            tr["scale"] *= scale_step
+        elif key_char == '-':
+            tr["scale"] /= scale_step
+        elif key_char == '1':
+            instance["color"] = [1.0, 0.3, 0.3]; print("Warna: Merah")
+        elif key_char == '2':
+            instance["color"] = [0.3, 1.0, 0.3]; print("Warna: Hijau")
+        elif key_char == '3':
+            instance["color"] = [0.3, 0.3, 1.0]; print("Warna: Biru")
+        elif key_char == '4':
+            instance["color"] = [1.0, 1.0, 0.3]; print("Warna: Kuning")
+        elif key_char == '5':
+            instance["color"] = [1.0, 0.3, 1.0]; print("Warna: Jingga")
+        elif key_char == '6':
+            instance["color"] = list(DEFAULT_COLOR); print("Warna: Biru Muda (Default)")
+        else:
+            return
+    else:
+        return
+    request_redisplay()
 
 
 def mouse_click(button, state, x, y):
-    """Callback untuk klik mouse (rotasi)."""
+    """Callback untuk klik mouse (kiri: rotasi, kanan: pilih instance)."""
     global mouse_down, last_mouse_x, last_mouse_y
     if button == GLUT_LEFT_BUTTON:
         if state == GLUT_DOWN:
@@ -378,50 +1592,134 @@ def mouse_click(button, state, x, y):
             last_mouse_x, last_mouse_y = x, y
         elif state == GLUT_UP:
             mouse_down = False
+    elif button == GLUT_RIGHT_BUTTON and state == GLUT_DOWN:
+        if pick_instance(x, y):
+            request_redisplay()
 
 
 def mouse_motion(x, y):
-    """Callback untuk gerakan mouse (rotasi)."""
-    global rotation_x, rotation_y, last_mouse_x, last_mouse_y
-    if mouse_down:
+    """Callback untuk gerakan mouse (rotasi instance aktif)."""
+    global last_mouse_x, last_mouse_y
+    instance = get_active_instance()
+    if mouse_down and instance is not None:
         dx, dy = x - last_mouse_x, y - last_mouse_y
-        rotation_y += dx * 0.5
-        rotation_x += dy * 0.5
+        instance["transform"]["rotate"][1] += dx * 0.5
+        instance["transform"]["rotate"][0] += dy * 0.5
         last_mouse_x, last_mouse_y = x, y
-        glutPostRedisplay()
+        request_redisplay()
 
 
 def mouse_wheel(wheel, direction, x, y):
-    """Callback untuk scroll mouse (zoom/skala)."""
-    global scale_factor
+    """Callback untuk scroll mouse (zoom/skala instance aktif)."""
+    instance = get_active_instance()
+    if instance is None: return
     scale_step = 1.1
     if direction > 0:
-        scale_factor *= scale_step
+        instance["transform"]["scale"] *= scale_step
     elif direction < 0:
-        scale_factor /= scale_step
-    glutPostRedisplay()
+        instance["transform"]["scale"] /= scale_step
+    request_redisplay()
 
 
 # =============================================================================
 # 7. FUNGSI MAIN
 # =============================================================================
 
-def main():
+def parse_args(argv):
+    """Membaca argumen baris perintah."""
+    parser = argparse.ArgumentParser(description="Aplikasi Grafika 3D Interaktif")
+    parser.add_argument("models", nargs="*", help="file .obj/.qmsh/.mchk yang dimuat saat mulai (juga daftar file tombol I)")
+    parser.add_argument("--scene", action="append", default=[], help="file scene .json yang dimuat saat mulai")
+    parser.add_argument("--translate", nargs=3, type=float, metavar=("X", "Y", "Z"),
+                        help="translasi awal untuk model dari argumen")
+    parser.add_argument("--rotate", nargs=2, type=float, metavar=("RX", "RY"),
+                        help="rotasi awal (derajat) untuk model dari argumen")
+    parser.add_argument("--scale", type=float, help="skala awal untuk model dari argumen")
+    parser.add_argument("--color", nargs=3, type=float, metavar=("R", "G", "B"),
+                        help="warna awal untuk model dari argumen")
+    parser.add_argument("--export-dir", default=".", help="folder tujuan export tombol O")
+    parser.add_argument("--compact", action="store_true",
+                        help="buang face degenerate/duplikat serta vertex dan normal tak terpakai saat memuat .obj")
+    parser.add_argument("--fps", type=float, default=frame_scheduler.DEFAULT_FPS,
+                        help="batas frame per detik (0 = tanpa batas, default 60)")
+    parser.add_argument("--no-progressive", action="store_true",
+                        help="selalu gambar seluruh model dalam satu frame (nonaktifkan render progresif)")
+    parser.add_argument("--frame-budget", type=float, default=progressive["budget_ms"], metavar="MS",
+                        help="anggaran waktu per frame render progresif (default 30 ms)")
+    parser.add_argument("--shader", action="store_true",
+                        help="pencahayaan per piksel dengan shader GLSL (bukan fixed-function)")
+    parser.add_argument("--chunk-cache-mb", type=float, default=chunk_cache_mb, metavar="MB",
+                        help="batas memori VBO chunk model .mchk (default 256)")
+    parser.add_argument("--render", metavar="FILE", help="render scene ke .png/.ppm resolusi tinggi lalu keluar")
+    parser.add_argument("--render-width", type=int, metavar="PIKSEL", help="lebar gambar --render (default 4x window)")
+    input_events.add_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Fungsi utama untuk menginisialisasi GLUT dan memulai loop."""
-    glutInit(sys.argv)
-    glutInitDisplayMode(GLUT_RGBA | GLUT_DOUBLE | GLUT_DEPTH)
-    glutInitWindowSize(window_width, window_height)
-    glutInitWindowPosition(100, 100)
-    glutCreateWindow(b"Aplikasi Grafika 3D Interaktif - OpenGL")
+    global export_dir, headless, chunk_cache_mb, compact_models
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    events = input_events.load_events(args)
+    if args.render:
+        events = events + [(0.0, "command", ("render", args.render, args.render_width), 0),
+                           (0.0, "command", ("quit",), 0)]
+    if events and (args.models or args.scene):
+        # Tunggu model awal selesai dimuat agar setiap pemutaran dimulai dari state yang sama
+        events = [(0.0, "command", ("waitload",), 0)] + events
+
+    callbacks = {"keyboard": keyboard, "mouse_click": mouse_click,
+                 "mouse_motion": mouse_motion, "mouse_wheel": mouse_wheel}
+    commands = {
+        "load": lambda filename: request_load(filename),
+        "scene": load_scene,
+        "export": export_obj,
+        "exportworld": lambda filename: export_obj(filename, world=True),
+        "waitload": loads_finished,
+        "render": render_image,
+    }
 
-    glutDisplayFunc(display)
-    glutReshapeFunc(reshape)
-    glutKeyboardFunc(keyboard)
-    glutMouseFunc(mouse_click)
-    glutMotionFunc(mouse_motion)
-    glutMouseWheelFunc(mouse_wheel)
+    headless = args.headless
+    progressive.update({"enabled": not args.no_progressive, "budget_ms": args.frame_budget})
+    chunk_cache_mb = args.chunk_cache_mb
+    compact_models = args.compact
+    shading["requested"] = args.shader
+    if not headless:
+        # PyOpenGL hanya dimuat jika ada window; --headless cukup memakai konstanta input GLUT
+        gl_loader.load()
+        frame_scheduler.set_rate(args.fps)
+        glutInit(sys.argv[:1])
+        glutInitDisplayMode(GLUT_RGBA | GLUT_DOUBLE | GLUT_DEPTH)
+        glutInitWindowSize(window_width, window_height)
+        glutInitWindowPosition(100, 100)
+        glutCreateWindow(WINDOW_TITLE.encode("utf-8"))
+        init(default_cube=not (args.models or args.scene))
+        glutTimerFunc(LOAD_POLL_MS, poll_loads, 0)
+    elif not (args.models or args.scene):
+        load_default_cube()
+
+    file_list.extend(args.models)
+    export_dir = args.export_dir
+    transform = {}
+    if args.translate: transform["translate"] = list(args.translate)
+    if args.rotate: transform["rotate"] = list(args.rotate)
+    if args.scale: transform["scale"] = args.scale
+    for filename in args.models:
+        request_load(filename, dict(transform) or None, args.color)
+    for filename in args.scene:
+        load_scene(filename)
+
+    if headless:
+        input_events.run_headless(args, events, callbacks, commands, idle=apply_ready_load)
+        return
 
-    init()
+    callbacks = input_events.start_session(args, events, callbacks, commands)
+    glutDisplayFunc(input_events.timed_display(display))
+    glutReshapeFunc(reshape)
+    glutKeyboardFunc(callbacks["keyboard"])
+    glutMouseFunc(callbacks["mouse_click"])
+    glutMotionFunc(callbacks["mouse_motion"])
+    glutMouseWheelFunc(callbacks["mouse_wheel"])
     glutMainLoop()
 
 
@@ -0,0 +1,447 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark Fungsi Inti Aplikasi Grafika 2D dan 3D
+
+Deskripsi:
+Mengukur waktu fungsi-fungsi yang paling sering dipakai pada data sintetis
+berukuran realistis (lihat synthetic_data.py), lalu menyimpan hasilnya ke
+JSON agar regresi performa dapat dilacak antar versi.
+
+Yang diukur:
+- 3D: load_obj, load_qmsh (format ringkas), export_obj, center_model_and_reset_transform,
+  validate_mesh
+- 2D: is_point_on_object, hit_test canvas, seleksi marquee, cohen_sutherland_clip,
+  get_object_aabb, refresh AABB seluruh store, klasifikasi clipping window,
+  translasi seleksi
+- Render 2D (hanya dengan --gl, butuh konteks OpenGL): menggambar seluruh scene
+  dengan clipping window aktif, clipping CPU dibandingkan clipping GPU
+- Startup (proses Python baru per pengulangan): impor hingga siap untuk alat
+  tanpa window, aplikasi 3D --headless, dan (dengan --gl, butuh display)
+  impor hingga frame pertama kedua aplikasi (--exit-after-first-frame)
+
+Contoh:
+    python benchmark.py --size medium --output hasil_baru.json
+    python benchmark.py --size medium --compare hasil_lama.json
+    python benchmark.py --size large --gl --only draw_clip_cpu,draw_clip_gpu
+    python benchmark.py --only startup_tools_ready,startup_headless_3d --repeats 5
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import platform
+import argparse
+import tempfile
+import subprocess
+
+import gl_loader
+import synthetic_data
+import engine_2d
+import Modul_B_3D
+import Modul_A_2D
+import mesh_codec
+import mesh_validate
+
+# Nama GL diikat oleh create_gl_context(); tanpa --gl PyOpenGL tidak dimuat
+gl_loader.bind(globals())
+
+# Folder aplikasi, tempat proses startup dijalankan
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Modul yang diimpor alat tanpa window (konversi, validasi, export vektor)
+TOOL_MODULES = ['Modul_B_3D', 'mesh_codec', 'mesh_validate', 'mesh_chunks', 'Modul_A_2D', 'vector_export']
+
+# Ukuran beban kerja: jumlah objek 2D, jumlah face minimum mesh cube-sphere,
+# jumlah titik uji hit-test, kotak marquee, dan segmen garis untuk clipping.
+SIZES = {
+    'small': {'objects': 2000, 'faces': 9_600, 'hit_points': 20, 'boxes': 20, 'segments': 20000},
+    'medium': {'objects': 20000, 'faces': 135_000, 'hit_points': 20, 'boxes': 20, 'segments': 200000},
+    'large': {'objects': 200000, 'faces': 2_160_000, 'hit_points': 10, 'boxes': 10, 'segments': 2000000},
+}
+
+# Registry benchmark: nama -> fungsi yang mengembalikan (setup, run, ukuran beban)
+BENCHMARKS = {}
+# Benchmark yang membutuhkan konteks OpenGL (hanya dijalankan dengan --gl)
+GL_BENCHMARKS = set()
+
+# Canvas 2D yang dipakai semua benchmark 2D; benchmark yang mengubah scene
+# mengisinya ulang (fill_canvas) di setup agar benchmark lain tidak terpengaruh
+canvas = engine_2d.Canvas()
+
+
+def benchmark(name, gl=False):
+    """Dekorator untuk mendaftarkan fungsi pembuat benchmark."""
+    def register(func):
+        BENCHMARKS[name] = func
+        if gl: GL_BENCHMARKS.add(name)
+        return func
+    return register
+
+
+def measure(setup, run, repeats):
+    """Menjalankan `run(setup())` beberapa kali; hanya `run` yang diukur."""
+    times = []
+    for _ in range(repeats):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return {'min_s': times[0], 'median_s': times[len(times) // 2], 'mean_s': sum(times) / len(times),
+            'repeats': repeats}
+
+
+# =============================================================================
+# 1. BENCHMARK 3D
+# =============================================================================
+
+@benchmark('load_obj')
+def bench_load_obj(data):
+    def setup():
+        Modul_B_3D.model_cache.clear()
+        Modul_B_3D.scene.clear()
+    return setup, lambda _: Modul_B_3D.load_obj(data['obj_path']), data['faces']
+
+
+@benchmark('load_qmsh')
+def bench_load_qmsh(data):
+    def setup():
+        Modul_B_3D.model_cache.clear()
+        Modul_B_3D.scene.clear()
+    return setup, lambda _: Modul_B_3D.load_obj(data['qmsh_path']), data['faces']
+
+
+@benchmark('export_obj')
+def bench_export_obj(data):
+    path = os.path.join(data['tmp_dir'], 'export.obj')
+    return lambda: None, lambda _: Modul_B_3D.export_obj(path, data['model']), data['faces']
+
+
+@benchmark('center_model_and_reset_transform')
+def bench_center_model(data):
+    model = data['model']
+    def setup():
+        # Salinan tanpa "extent" agar pusat model dihitung ulang
+        return {'vertices': list(model['vertices']), 'normals': model['normals'], 'faces': model['faces']}
+    return setup, lambda fresh: Modul_B_3D.center_model_and_reset_transform(fresh, {}), len(model['vertices'])
+
+
+@benchmark('validate_mesh')
+def bench_validate_mesh(data):
+    arrays = mesh_validate.mesh_arrays(data['model'])
+    return lambda: None, lambda _: mesh_validate.analyze(*arrays), data['faces']
+
+
+# =============================================================================
+# 2. BENCHMARK 2D
+# =============================================================================
+
+@benchmark('is_point_on_object')
+def bench_hit_test(data):
+    rng = random.Random(1)
+    points = [(rng.uniform(0, 1280), rng.uniform(0, 720)) for _ in range(data['size']['hit_points'])]
+    objects = data['objects_2d']
+    def run(_):
+        for x, y in points:
+            for obj in objects:
+                engine_2d.is_point_on_object(x, y, obj)
+    return lambda: None, run, len(points) * len(objects)
+
+
+@benchmark('canvas_hit_test')
+def bench_canvas_hit_test(data):
+    rng = random.Random(1)
+    points = [(rng.uniform(0, 1280), rng.uniform(0, 720)) for _ in range(data['size']['hit_points'])]
+    def run(_):
+        for x, y in points:
+            canvas.hit_test(x, y)
+    return lambda: None, run, len(points) * len(canvas.objects)
+
+
+@benchmark('marquee_selection')
+def bench_marquee(data):
+    rng = random.Random(2)
+    boxes = []
+    for _ in range(data['size']['boxes']):
+        x, y = rng.uniform(0, 1280), rng.uniform(0, 720)
+        boxes.append((x, y, x + rng.uniform(50, 400), y + rng.uniform(50, 300)))
+    def run(_):
+        for box in boxes:
+            canvas.get_objects_in_box(*box)
+    return lambda: None, run, len(boxes) * len(canvas.objects)
+
+
+@benchmark('cohen_sutherland_clip')
+def bench_clip(data):
+    rng = random.Random(3)
+    segments = [(rng.uniform(-200, 1480), rng.uniform(-200, 920), rng.uniform(-200, 1480), rng.uniform(-200, 920))
+                for _ in range(data['size']['segments'])]
+    def run(_):
+        for seg in segments:
+            canvas.clip_line(*seg)
+    return lambda: None, run, len(segments)
+
+
+@benchmark('get_object_aabb')
+def bench_aabb(data):
+    objects = data['objects_2d']
+    def run(_):
+        for obj in objects:
+            engine_2d.get_object_aabb(obj)
+    return lambda: None, run, len(objects)
+
+
+@benchmark('aabb_refresh')
+def bench_aabb_refresh(data):
+    everything = range(len(canvas.objects))
+    def setup():
+        canvas.objects.rotate(everything, 0.0)  # menandai semua baris untuk dihitung ulang
+    def run(_):
+        canvas.objects.refresh()
+    return setup, run, len(canvas.objects)
+
+
+@benchmark('inside_window')
+def bench_inside_window(data):
+    def run(_):
+        canvas.objects_inside_window()
+    return lambda: None, run, len(canvas.objects)
+
+
+@benchmark('translate_selection')
+def bench_translate_selection(data):
+    def setup():
+        fill_canvas(data)
+        canvas.select_all()
+        canvas.objects.refresh()
+    def run(_):
+        for _ in range(10):
+            canvas.translate_selected(1.0, -1.0)
+        canvas.translate_selected(-10.0, 10.0)
+    return setup, run, 11 * len(canvas.objects)
+
+
+@benchmark('group_rotate_selection')
+def bench_group_rotate_selection(data):
+    def setup():
+        fill_canvas(data)
+        canvas.select_all()
+        canvas.objects.refresh()
+    def run(_):
+        canvas.rotate_selected_group(5.0)
+        canvas.objects.refresh()
+    return setup, run, len(canvas.objects)
+
+
+@benchmark('group_scale_selection')
+def bench_group_scale_selection(data):
+    def setup():
+        fill_canvas(data)
+        canvas.select_all()
+        canvas.objects.refresh()
+    def run(_):
+        for _ in range(5):
+            canvas.scale_selected_group(1.1)
+        canvas.scale_selected_group(1.1 ** -5)
+    return setup, run, 6 * len(canvas.objects)
+
+
+@benchmark('bake_selection')
+def bench_bake_selection(data):
+    def setup():
+        fill_canvas(data)
+        canvas.select_all()
+        canvas.rotate_selected_group(15.0)
+        canvas.scale_selected_group(1.2)
+        canvas.objects.refresh()
+    def run(_):
+        canvas.bake_selected()
+        canvas.objects.refresh()
+    return setup, run, len(canvas.objects)
+
+
+def draw_clip_benchmark(mode):
+    """Menggambar seluruh scene ke lapisan objek Modul_A_2D dengan clipping window aktif."""
+    def setup():
+        Modul_A_2D.canvas = canvas
+        Modul_A_2D.clip_mode = mode
+        canvas.selected_indices = []
+        Modul_A_2D.ensure_object_layer()
+        glBindFramebuffer(GL_FRAMEBUFFER, Modul_A_2D.object_layer['fbo'])
+    def run(_):
+        Modul_A_2D.draw_objects()
+        glFinish()
+    return setup, run, len(canvas.objects)
+
+
+@benchmark('draw_clip_cpu', gl=True)
+def bench_draw_clip_cpu(data):
+    return draw_clip_benchmark('cpu')
+
+
+@benchmark('draw_clip_gpu', gl=True)
+def bench_draw_clip_gpu(data):
+    return draw_clip_benchmark('gpu')
+
+
+def create_gl_context():
+    """Membuat window GLUT tersembunyi seukuran canvas 2D sebagai konteks OpenGL benchmark render."""
+    gl_loader.load()
+    width, height = Modul_A_2D.window_width, Modul_A_2D.window_height
+    glutInit(sys.argv[:1])
+    glutInitDisplayMode(GLUT_RGBA | GLUT_DOUBLE)
+    glutInitWindowSize(width, height)
+    glutCreateWindow(b"benchmark")
+    glutHideWindow()
+    glClearColor(1.0, 1.0, 1.0, 1.0)
+    glEnable(GL_BLEND)
+    glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+    glEnable(GL_LINE_SMOOTH)
+    Modul_A_2D.reshape(width, height)
+
+
+# =============================================================================
+# 3. BENCHMARK STARTUP
+# =============================================================================
+# Impor di-cache per proses, jadi setiap pengulangan menjalankan interpreter
+# baru. Waktu yang diukur adalah waktu dinding proses, termasuk start interpreter.
+
+def run_python(args):
+    """Menjalankan proses Python baru di folder aplikasi dan menunggu hingga selesai."""
+    subprocess.run([sys.executable] + args, cwd=APP_DIR, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+@benchmark('startup_tools_ready')
+def bench_startup_tools(data):
+    # Impor hingga siap dipakai untuk alat tanpa window (PyOpenGL tidak dimuat)
+    code = 'import ' + ', '.join(TOOL_MODULES)
+    return lambda: None, lambda _: run_python(['-c', code]), len(TOOL_MODULES)
+
+
+@benchmark('startup_headless_3d')
+def bench_startup_headless(data):
+    # Tanpa skrip: PyOpenGL dan kubus bawaan dimuat lalu aplikasi langsung keluar
+    return lambda: None, lambda _: run_python(['Modul_B_3D.py', '--headless']), 1
+
+
+@benchmark('startup_first_frame_2d', gl=True)
+def bench_startup_first_frame_2d(data):
+    return lambda: None, lambda _: run_python(['Modul_A_2D.py', '--exit-after-first-frame']), 1
+
+
+@benchmark('startup_first_frame_3d', gl=True)
+def bench_startup_first_frame_3d(data):
+    return lambda: None, lambda _: run_python(['Modul_B_3D.py', '--exit-after-first-frame']), 1
+
+
+# =============================================================================
+# 4. MENJALANKAN DAN MEMBANDINGKAN
+# =============================================================================
+
+def prepare_data(size_name, tmp_dir):
+    """Membuat scene 2D dan mesh sintetis untuk ukuran beban kerja tertentu."""
+    size = SIZES[size_name]
+    print(f"Menyiapkan data '{size_name}'...")
+    objects_2d = synthetic_data.generate_2d_scene(size['objects'], seed=0)
+
+    obj_path = os.path.join(tmp_dir, 'sphere.obj')
+    sphere_n = synthetic_data.sphere_size_for_faces(size['faces'])
+    synthetic_data.write_sphere_obj(obj_path, sphere_n)
+    model = Modul_B_3D.parse_obj(obj_path)
+    Modul_B_3D.center_model_and_reset_transform(model)
+    qmsh_path = os.path.join(tmp_dir, 'sphere.qmsh')
+    mesh_codec.save_compact(model, qmsh_path)
+    data = {'size': size, 'objects_2d': objects_2d, 'tmp_dir': tmp_dir, 'obj_path': obj_path, 'qmsh_path': qmsh_path, 'model': model,
+            'faces': 6 * sphere_n ** 2}
+    fill_canvas(data)
+    return data
+
+
+def fill_canvas(data):
+    """Mengisi ulang canvas benchmark dengan scene 2D awal (objek, seleksi kosong, clipping window)."""
+    canvas.clear()
+    canvas.objects.extend(data['objects_2d'])
+    canvas.set_clipping_window(200, 150, 1000, 550)
+
+
+def run_benchmarks(size_name, names, repeats):
+    """Menjalankan benchmark terpilih dan mengembalikan dictionary hasil."""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data = prepare_data(size_name, tmp_dir)
+        for name in names:
+            setup, run, work = BENCHMARKS[name](data)
+            # Cetakan konsol dari fungsi aplikasi dibuang agar tidak mengganggu hasil
+            with open(os.devnull, 'w') as devnull:
+                stdout, sys.stdout = sys.stdout, devnull
+                try:
+                    result = measure(setup, run, repeats)
+                finally:
+                    sys.stdout = stdout
+            result['work'] = work
+            results[name] = result
+            print(f"  {name:<34} {result['min_s'] * 1000:>10.2f} ms (min dari {repeats}, n = {work})")
+    return results
+
+
+def compare(results, baseline_path, threshold):
+    """Mencetak perbandingan dengan hasil lama. Mengembalikan jumlah regresi."""
+    with open(baseline_path, 'r') as f:
+        baseline = json.load(f)['results']
+    regressions = 0
+    print(f"\nPerbandingan dengan '{baseline_path}' (min, rasio baru/lama):")
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result['min_s'] / baseline[name]['min_s'] if baseline[name]['min_s'] else float('inf')
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = '  <-- REGRESI'; regressions += 1
+        elif ratio < 1 - threshold:
+            flag = '  (lebih cepat)'
+        print(f"  {name:<34} {ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark fungsi inti aplikasi grafika 2D/3D")
+    parser.add_argument("--size", choices=SIZES, default='small', help="ukuran beban kerja")
+    parser.add_argument("--only", help="daftar benchmark dipisah koma (default: semua)")
+    parser.add_argument("--repeats", type=int, default=3, help="jumlah pengulangan per benchmark")
+    parser.add_argument("--output", help="simpan hasil ke file JSON")
+    parser.add_argument("--compare", metavar="JSON", help="bandingkan dengan hasil lama")
+    parser.add_argument("--threshold", type=float, default=0.10, help="batas regresi relatif (default 0.10)")
+    parser.add_argument("--gl", action="store_true", help="buat konteks OpenGL dan jalankan juga benchmark render")
+    args = parser.parse_args(argv)
+
+    names = args.only.split(',') if args.only else [name for name in BENCHMARKS
+                                                    if args.gl or name not in GL_BENCHMARKS]
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        print(f"Error: Benchmark tidak dikenal: {', '.join(unknown)}")
+        sys.exit(1)
+    if not args.gl and GL_BENCHMARKS.intersection(names):
+        print("Error: Benchmark render membutuhkan --gl.")
+        sys.exit(1)
+    if args.gl:
+        create_gl_context()
+
+    Modul_B_3D.headless = True
+    report = {
+        'meta': {'python': platform.python_version(), 'platform': platform.platform(),
+                 'time': time.strftime('%Y-%m-%d %H:%M:%S'), 'size': args.size},
+        'results': run_benchmarks(args.size, names, args.repeats),
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Hasil disimpan ke '{args.output}'.")
+    if args.compare and compare(report['results'], args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
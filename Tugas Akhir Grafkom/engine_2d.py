@@ -0,0 +1,449 @@
+# -*- coding: utf-8 -*-
+"""
+Engine Canvas 2D (Tanpa OpenGL)
+
+Deskripsi:
+Modul ini berisi seluruh logika editor 2D: struktur objek, transformasi,
+seleksi, hit-test, dan clipping Cohen-Sutherland. Modul ini tidak mengimpor
+PyOpenGL sehingga dapat diimpor, diprofil, dan dijalankan di proses worker
+tanpa window. Modul_A_2D hanya bertugas sebagai adaptor GLUT di atasnya.
+Objek disimpan per kolom di ObjectStore (object_store.py); canvas.objects
+tetap dapat diindeks dan diiterasi seperti list dictionary objek.
+
+Contoh:
+    from engine_2d import Canvas
+    canvas = Canvas()
+    canvas.create_object('line', [(0, 0), (100, 100)], (0, 0, 0), 1.0)
+    canvas.set_clipping_window(10, 10, 50, 50)
+    canvas.clip_line(0, 0, 100, 100)
+"""
+
+import sys
+import json
+from math import sin, cos, radians
+
+from object_store import ObjectStore, ELLIPSE, stroke_margin
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: NumPy tidak terinstal.")
+    print("Silakan instal dengan perintah: pip install numpy")
+    sys.exit(1)
+
+# Konstanta Cohen-Sutherland
+C_INSIDE, C_LEFT, C_RIGHT, C_BOTTOM, C_TOP = 0, 1, 2, 4, 8
+
+
+# =============================================================================
+# 1. FUNGSI MATEMATIKA DAN GEOMETRI OBJEK
+# =============================================================================
+
+# Objek canvas adalah ObjectView: setiap obj['vertices'] menyalin vertex menjadi list
+# baru. Fungsi di bawah menerima `vertices`/`center` yang sudah dibaca agar satu
+# objek cukup disalin sekali.
+
+def get_object_center(obj, vertices=None):
+    if vertices is None: vertices = obj['vertices']
+    if not len(vertices): return (0, 0)
+    if obj['type'] in ['point', 'ellipse', 'freehand']: return vertices[0]
+    x_coords = [v[0] for v in vertices];
+    y_coords = [v[1] for v in vertices]
+    return (sum(x_coords) / len(x_coords), sum(y_coords) / len(y_coords))
+
+
+def get_transformed_vertex(vertex, obj, center=None):
+    if center is None: center = get_object_center(obj)
+    tr = obj['transform']
+    vx, vy = vertex[0] - center[0], vertex[1] - center[1]
+    vx, vy = vx * tr['scale'][0], vy * tr['scale'][1]
+    angle_rad = radians(tr['rotate']);
+    cos_a, sin_a = cos(angle_rad), sin(angle_rad)
+    rvx = vx * cos_a - vy * sin_a;
+    rvy = vx * sin_a + vy * cos_a
+    final_x = rvx + center[0] + tr['translate'][0];
+    final_y = rvy + center[1] + tr['translate'][1]
+    return (final_x, final_y)
+
+
+def get_rectangle_corners(vertices):
+    """Keempat sudut persegi dari dua sudut diagonalnya (agar AABB benar setelah rotasi)."""
+    (x1, y1), (x2, y2) = vertices[0], vertices[1]
+    return [(x1, y1), (x2, y1), (x2, y2), (x1, y2)]
+
+
+def get_object_aabb(obj):
+    vertices = obj['vertices']
+    if not vertices: return None
+    if obj['type'] == 'ellipse':
+        center_x, center_y = vertices[0]
+        rx = abs(vertices[1][0] - center_x);
+        ry = abs(vertices[1][1] - center_y)
+        verts_to_check = [(center_x + rx, center_y), (center_x - rx, center_y), (center_x, center_y + ry),
+                          (center_x, center_y - ry)]
+    elif obj['type'] == 'rectangle':
+        verts_to_check = get_rectangle_corners(vertices)
+    else:
+        verts_to_check = vertices
+    center = get_object_center(obj, vertices)
+    transformed_verts = [get_transformed_vertex(v, obj, center) for v in verts_to_check]
+    min_x = min(v[0] for v in transformed_verts);
+    max_x = max(v[0] for v in transformed_verts)
+    min_y = min(v[1] for v in transformed_verts);
+    max_y = max(v[1] for v in transformed_verts)
+    return (min_x, min_y, max_x, max_y)
+
+
+def get_object_bounds(obj):
+    """AABB konservatif area piksel yang digambar objek, termasuk ketebalannya.
+
+    Berbeda dengan get_object_aabb, elips memakai sudut persegi pembatasnya
+    sehingga hasilnya tetap menutupi elips yang dirotasi.
+    """
+    vertices = obj['vertices']
+    if not vertices: return None
+    if obj['type'] == 'ellipse':
+        (center_x, center_y), (px, py) = vertices[0], vertices[1]
+        rx, ry = abs(px - center_x), abs(py - center_y)
+        verts_to_check = [(center_x - rx, center_y - ry), (center_x + rx, center_y - ry),
+                          (center_x + rx, center_y + ry), (center_x - rx, center_y + ry)]
+    elif obj['type'] == 'rectangle':
+        verts_to_check = get_rectangle_corners(vertices)
+    else:
+        verts_to_check = vertices
+    center = get_object_center(obj, vertices)
+    transformed_verts = [get_transformed_vertex(v, obj, center) for v in verts_to_check]
+    margin = stroke_margin(obj['thickness'])
+    return (min(v[0] for v in transformed_verts) - margin, min(v[1] for v in transformed_verts) - margin,
+            max(v[0] for v in transformed_verts) + margin, max(v[1] for v in transformed_verts) + margin)
+
+
+def get_inverse_transformed_point(x, y, obj, center=None):
+    if center is None: center = get_object_center(obj)
+    tr = obj['transform']
+    px, py = x - tr['translate'][0], y - tr['translate'][1]
+    px, py = px - center[0], py - center[1]
+    angle_rad = radians(-tr['rotate']);
+    cos_a, sin_a = cos(angle_rad), sin(angle_rad)
+    rpx = px * cos_a - py * sin_a;
+    rpy = px * sin_a + py * cos_a
+    px, py = rpx, rpy
+    sx = tr['scale'][0] if tr['scale'][0] != 0 else 1.0;
+    sy = tr['scale'][1] if tr['scale'][1] != 0 else 1.0
+    px, py = px / sx, py / sy
+    final_px, final_py = px + center[0], py + center[1]
+    return final_px, final_py
+
+
+def dist_sq(p1, p2):
+    return (p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2
+
+
+def hit_tolerance(thickness):
+    """Jarak maksimum (koordinat lokal objek) klik dari garis agar dianggap mengenai objek."""
+    return thickness * 3 + 3
+
+
+def point_near_segment(p, v, w, tolerance_sq):
+    l2 = dist_sq(v, w)
+    if l2 == 0: return dist_sq(p, v) < tolerance_sq
+    t = max(0, min(1, ((p[0] - v[0]) * (w[0] - v[0]) + (p[1] - v[1]) * (w[1] - v[1])) / l2))
+    proj = (v[0] + t * (w[0] - v[0]), v[1] + t * (w[1] - v[1]))
+    return dist_sq(p, proj) < tolerance_sq
+
+
+def is_point_on_object(x, y, obj):
+    obj_type, verts = obj['type'], obj['vertices']
+    ix, iy = get_inverse_transformed_point(x, y, obj, get_object_center(obj, verts))
+    tolerance_sq = hit_tolerance(obj['thickness']) ** 2
+    if obj_type == 'point':
+        return dist_sq((ix, iy), verts[0]) < tolerance_sq * 2
+    elif obj_type == 'line':
+        return point_near_segment((ix, iy), verts[0], verts[1], tolerance_sq)
+    elif obj_type == 'rectangle':
+        x_coords = sorted([verts[0][0], verts[1][0]]);
+        y_coords = sorted([verts[0][1], verts[1][1]])
+        return (x_coords[0] <= ix <= x_coords[1] and y_coords[0] <= iy <= y_coords[1])
+    elif obj_type == 'ellipse':
+        center = verts[0];
+        rx, ry = abs(verts[1][0] - center[0]), abs(verts[1][1] - center[1])
+        if rx == 0 or ry == 0: return False
+        val = ((ix - center[0]) ** 2 / rx ** 2) + ((iy - center[1]) ** 2 / ry ** 2)
+        return val <= 1.1
+    elif obj_type == 'freehand':
+        # Segmen diuji di ruang lokal goresan (pusat transformasinya vertex pertama, seperti saat digambar)
+        return any(point_near_segment((ix, iy), verts[i], verts[i + 1], tolerance_sq) for i in range(len(verts) - 1))
+    return False
+
+
+# =============================================================================
+# 2. CLIPPING COHEN-SUTHERLAND
+# =============================================================================
+
+def compute_outcode(x, y, window):
+    code = C_INSIDE
+    if x < window['xmin']:
+        code |= C_LEFT
+    elif x > window['xmax']:
+        code |= C_RIGHT
+    if y < window['ymin']:
+        code |= C_BOTTOM
+    elif y > window['ymax']:
+        code |= C_TOP
+    return code
+
+
+def cohen_sutherland_clip(x1, y1, x2, y2, window):
+    outcode1, outcode2 = compute_outcode(x1, y1, window), compute_outcode(x2, y2, window)
+    accept = False
+    while True:
+        if not (outcode1 | outcode2):
+            accept = True; break
+        elif (outcode1 & outcode2):
+            break
+        else:
+            x, y = 0, 0
+            outcode_out = outcode1 if outcode1 else outcode2
+            if outcode_out & C_TOP:
+                x = x1 + (x2 - x1) * (window['ymax'] - y1) / (y2 - y1); y = window['ymax']
+            elif outcode_out & C_BOTTOM:
+                x = x1 + (x2 - x1) * (window['ymin'] - y1) / (y2 - y1); y = window['ymin']
+            elif outcode_out & C_RIGHT:
+                y = y1 + (y2 - y1) * (window['xmax'] - x1) / (x2 - x1); x = window['xmax']
+            elif outcode_out & C_LEFT:
+                y = y1 + (y2 - y1) * (window['xmin'] - x1) / (x2 - x1); x = window['xmin']
+            if outcode_out == outcode1:
+                x1, y1 = x, y; outcode1 = compute_outcode(x1, y1, window)
+            else:
+                x2, y2 = x, y; outcode2 = compute_outcode(x2, y2, window)
+    return (True, x1, y1, x2, y2) if accept else (False, 0, 0, 0, 0)
+
+
+# =============================================================================
+# 3. ENGINE CANVAS
+# =============================================================================
+
+class Canvas:
+    """State scene 2D beserta operasi buat, pilih, transformasi, clip, dan hit-test.
+
+    Semua method adalah operasi biasa tanpa OpenGL dan tanpa cetakan konsol;
+    pesan untuk pengguna menjadi tanggung jawab adaptor (Modul_A_2D).
+    """
+
+    def __init__(self):
+        self.objects = ObjectStore()
+        self.selected_indices = []
+        self.clipboard = []
+        self.clipping_window = {
+            'xmin': 100, 'ymin': 100, 'xmax': 500, 'ymax': 400,
+            'active': False,
+            'color': (1.0, 0.0, 0.0),
+        }
+
+    # --- Membuat dan mengelola objek ---
+
+    def create_object(self, obj_type, vertices, color, thickness):
+        """Membuat objek baru, menambahkannya ke canvas, dan memilihnya. Mengembalikan view objeknya."""
+        index = self.objects.append({
+            'type': obj_type,
+            'vertices': vertices,
+            'color': color,
+            'thickness': thickness,
+            'transform': {'translate': [0, 0], 'rotate': 0.0, 'scale': [1.0, 1.0]}
+        })
+        self.selected_indices = [index]
+        return self.objects[index]
+
+    def append_vertex(self, index, vertex):
+        """Menambahkan vertex ke objek (mis. saat menggambar freehand)."""
+        self.objects.append_vertex(index, vertex)
+
+    def copy_selected(self):
+        """Menyalin objek terpilih ke clipboard. Mengembalikan jumlah objek yang disalin."""
+        if not self.selected_indices:
+            return 0
+        self.clipboard = [self.objects.to_dict(i) for i in self.selected_indices]
+        return len(self.clipboard)
+
+    def paste(self, offset=15):
+        """Menempelkan clipboard dengan pergeseran `offset`. Mengembalikan jumlah objek."""
+        if not self.clipboard:
+            return 0
+        first = len(self.objects)
+        self.objects.extend(self.clipboard)
+        self.selected_indices = list(range(first, len(self.objects)))
+        self.objects.translate(self.selected_indices, offset, offset)
+        return len(self.selected_indices)
+
+    def delete_selected(self):
+        """Menghapus semua objek terpilih. Mengembalikan jumlah objek yang dihapus."""
+        count = len(self.selected_indices)
+        self.objects.delete(self.selected_indices)
+        self.selected_indices.clear()
+        return count
+
+    def clear(self):
+        """Menghapus semua objek dari canvas."""
+        self.objects.clear()
+        self.selected_indices.clear()
+
+    # --- Seleksi dan hit-test ---
+
+    def select_all(self):
+        """Memilih semua objek. Mengembalikan jumlah objek terpilih."""
+        self.selected_indices = list(range(len(self.objects)))
+        return len(self.selected_indices)
+
+    def hit_test(self, x, y, indices=None):
+        """Indeks objek teratas di (x, y), dibatasi pada `indices` jika diberikan; None jika tidak ada.
+
+        Uji kasar memakai bounds semua objek yang diperlebar toleransi hit-test,
+        sehingga uji tepat per objek hanya dijalankan untuk sedikit kandidat.
+        """
+        store = self.objects
+        reach = hit_tolerance(store.column('thickness')) * 1.5  # titik: radius toleransi * sqrt(2)
+        ellipse = np.flatnonzero(store.column('type') == ELLIPSE)
+        if len(ellipse):
+            # Elips dianggap kena sampai nilai persamaannya 1.1 (jari-jari * ~1.05)
+            radius = np.abs(store.nth_vertices(ellipse, 1) - store.nth_vertices(ellipse, 0)).max(axis=1)
+            reach[ellipse] += 0.05 * radius
+        reach *= np.abs(store.column('scale')).max(axis=1)
+        candidates = store.in_box(x, y, x, y, bounds=True, pad=reach)
+        if indices is not None:
+            candidates = np.intersect1d(candidates, np.fromiter(indices, dtype=np.int64))
+        for i in reversed(candidates.tolist()):
+            if is_point_on_object(x, y, self.objects[i]):
+                return i
+        return None
+
+    def select_at(self, x, y, toggle=False):
+        """Memilih objek teratas di (x, y); dengan `toggle` seleksi objek itu dibalik.
+
+        Mengembalikan indeks objek yang terkena atau None.
+        """
+        i = self.hit_test(x, y)
+        if i is None:
+            return None
+        if not toggle:
+            self.selected_indices = [i]
+        elif i in self.selected_indices:
+            self.selected_indices.remove(i)
+        else:
+            self.selected_indices.append(i)
+        return i
+
+    def get_objects_in_box(self, x1, y1, x2, y2):
+        """Mengembalikan indeks objek yang AABB-nya beririsan dengan kotak seleksi."""
+        return self.objects.in_box(min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)).tolist()
+
+    def select_in_box(self, x1, y1, x2, y2, additive=True):
+        """Memilih objek di dalam kotak seleksi (ditambahkan ke seleksi jika `additive`)."""
+        newly_selected = set(self.selected_indices) if additive else set()
+        newly_selected.update(self.get_objects_in_box(x1, y1, x2, y2))
+        self.selected_indices = list(newly_selected)
+        return len(self.selected_indices)
+
+    def get_bounds(self, indices):
+        """Gabungan get_object_bounds untuk objek-objek `indices`; None jika kosong."""
+        return self.objects.union_bounds(indices)
+
+    # --- Transformasi objek terpilih ---
+
+    def translate_selected(self, dx, dy):
+        self.objects.translate(self.selected_indices, dx, dy)
+
+    def rotate_selected(self, degrees):
+        self.objects.rotate(self.selected_indices, degrees)
+
+    def scale_selected(self, factor):
+        self.objects.scale(self.selected_indices, factor)
+
+    def selection_pivot(self):
+        """Pivot transformasi grup: rata-rata pusat dunia objek terpilih, atau None jika tidak ada.
+
+        Titik ini tidak berpindah saat grup diputar atau diskalakan di
+        sekitarnya, sehingga rotasi berulang tidak bergeser. Untuk satu objek
+        pivotnya sama dengan pusat objek itu sendiri.
+        """
+        if not self.selected_indices:
+            return None
+        return self.objects.world_centers(self.selected_indices).mean(axis=0)
+
+    def _transform_selected_group(self, pivot, degrees=0.0, factor=1.0):
+        if not self.selected_indices: return
+        # Seleksi diubah ke array sekali untuk pivot dan kernel transformasinya
+        indices = np.asarray(self.selected_indices, dtype=np.int64)
+        if pivot is None:
+            pivot = self.objects.world_centers(indices).mean(axis=0)
+        self.objects.transform_about(indices, pivot, degrees=degrees, factor=factor)
+
+    def rotate_selected_group(self, degrees, pivot=None):
+        """Memutar seluruh seleksi sebagai satu grup di sekitar `pivot` (default selection_pivot)."""
+        self._transform_selected_group(pivot, degrees=degrees)
+
+    def scale_selected_group(self, factor, pivot=None):
+        """Menskalakan seluruh seleksi secara seragam sebagai satu grup di sekitar `pivot` (default selection_pivot)."""
+        self._transform_selected_group(pivot, factor=factor)
+
+    def bake_selected(self):
+        """Melipat transformasi objek terpilih ke vertex-nya. Mengembalikan jumlah objek."""
+        self.objects.bake(self.selected_indices)
+        return len(self.selected_indices)
+
+    # --- Clipping window ---
+
+    def set_clipping_window(self, xmin, ymin, xmax, ymax):
+        self.clipping_window.update({'xmin': xmin, 'ymin': ymin, 'xmax': xmax, 'ymax': ymax, 'active': True})
+
+    def disable_clipping_window(self):
+        self.clipping_window['active'] = False
+
+    def move_clipping_window(self, dx, dy):
+        self.resize_clipping_window(dx, dy, dx, dy)
+
+    def resize_clipping_window(self, dxmin=0, dymin=0, dxmax=0, dymax=0):
+        """Menggeser masing-masing sisi clipping window."""
+        cw = self.clipping_window
+        cw['xmin'] += dxmin; cw['ymin'] += dymin
+        cw['xmax'] += dxmax; cw['ymax'] += dymax
+
+    def point_in_window(self, x, y):
+        cw = self.clipping_window
+        return cw['xmin'] <= x <= cw['xmax'] and cw['ymin'] <= y <= cw['ymax']
+
+    def is_object_fully_inside_window(self, obj):
+        if not obj['vertices']: return False
+        aabb = get_object_aabb(obj)
+        if not aabb: return False
+        cw = self.clipping_window
+        return (cw['xmin'] <= aabb[0] and aabb[2] <= cw['xmax'] and
+                cw['ymin'] <= aabb[1] and aabb[3] <= cw['ymax'])
+
+    def objects_inside_window(self):
+        """Mask boolean is_object_fully_inside_window untuk semua objek sekaligus."""
+        return self.objects.inside_window(self.clipping_window)
+
+    def clip_line(self, x1, y1, x2, y2):
+        """Clipping Cohen-Sutherland terhadap clipping window: (visible, x1, y1, x2, y2)."""
+        return cohen_sutherland_clip(x1, y1, x2, y2, self.clipping_window)
+
+    # --- Simpan dan muat scene ---
+
+    def save_scene(self, filename):
+        """Menyimpan semua objek dan clipping window ke file scene .json."""
+        with open(filename, 'w') as f:
+            json.dump({'objects': self.objects.to_dicts(), 'clipping_window': self.clipping_window}, f)
+
+    def load_scene(self, filename):
+        """Menambahkan objek dari file scene .json. Mengembalikan jumlah objek yang dimuat.
+
+        Melempar OSError atau ValueError jika file tidak dapat dibaca.
+        """
+        with open(filename, 'r') as f:
+            data = json.load(f)
+        loaded = data.get('objects', [])
+        self.objects.extend(loaded)
+        if 'clipping_window' in data:
+            self.clipping_window.update(data['clipping_window'])
+            self.clipping_window['color'] = tuple(self.clipping_window['color'])
+        return len(loaded)
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Penjadwal Frame untuk Loop Event GLUT
+
+Deskripsi:
+Callback input tidak lagi memanggil glutPostRedisplay() secara langsung,
+melainkan request_redraw(). Permintaan yang datang di antara dua frame
+digabung menjadi satu, frame digambar paling banyak sekali per interval
+(default 60 fps) lewat timer GLUT, dan tidak ada frame yang digambar jika
+tidak ada state yang berubah.
+
+Selain itu penjadwal mengumpulkan "damage": persegi (xmin, ymin, xmax, ymax)
+dalam koordinat window yang berubah sejak frame terakhir. Fungsi display
+dapat memakainya untuk menggambar ulang hanya area tersebut (scissor).
+"""
+
+import time
+
+import gl_loader
+
+# glutPostRedisplay dan glutTimerFunc diikat saat aplikasi memuat PyOpenGL
+gl_loader.bind(globals())
+
+DEFAULT_FPS = 60.0
+
+# State penjadwal. `full` berarti seluruh layar rusak; `damage` adalah
+# gabungan persegi yang rusak; `dirty` tanpa keduanya berarti hanya
+# overlay (mis. kotak seleksi) yang perlu digambar ulang.
+state = {
+    'interval': 1.0 / DEFAULT_FPS,
+    'dirty': False, 'full': False, 'damage': None,
+    'timer_pending': False, 'last_frame': 0.0,
+    'requests': 0, 'frames': 0,
+}
+
+
+def set_rate(fps):
+    """Mengatur batas frame per detik (0 berarti tanpa batas)."""
+    state['interval'] = 1.0 / fps if fps > 0 else 0.0
+
+
+def union_rect(a, b):
+    """Gabungan dua persegi (xmin, ymin, xmax, ymax); None dianggap kosong."""
+    if a is None: return b
+    if b is None: return a
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def request_redraw(damage=None, full=False):
+    """Menandai bahwa frame baru diperlukan dan menjadwalkannya lewat timer GLUT.
+
+    `damage` adalah persegi yang berubah, `full` menandai seluruh layar
+    berubah. Tanpa keduanya, frame tetap digambar tetapi tanpa area rusak.
+    """
+    state['requests'] += 1
+    state['dirty'] = True
+    if full:
+        state['full'] = True
+    elif damage is not None:
+        state['damage'] = union_rect(state['damage'], damage)
+    if not state['timer_pending']:
+        state['timer_pending'] = True
+        delay = state['last_frame'] + state['interval'] - time.perf_counter()
+        glutTimerFunc(max(0, int(delay * 1000)), _tick, 0)
+
+
+def _tick(value):
+    """Callback timer: meminta GLUT menggambar jika ada perubahan sejak frame terakhir."""
+    state['timer_pending'] = False
+    if state['dirty']:
+        glutPostRedisplay()
+
+
+def begin_frame():
+    """Dipanggil di awal display. Mengembalikan (full, damage) lalu mereset state.
+
+    Jika display dipanggil GLUT tanpa permintaan (mis. window ter-expose),
+    hasilnya (True, None) sehingga seluruh layar digambar ulang.
+    """
+    full = state['full'] or not state['dirty']
+    damage = None if full else state['damage']
+    state.update({'dirty': False, 'full': False, 'damage': None})
+    state['last_frame'] = time.perf_counter()
+    state['frames'] += 1
+    return full, damage
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Pemuatan PyOpenGL Secara Malas untuk Aplikasi Grafika 2D dan 3D
+
+Deskripsi:
+Mengimpor OpenGL.GL, OpenGL.GLU, dan OpenGL.GLUT memuat ribuan simbol dan
+memakan waktu startup yang berarti, padahal sebagian besar kode (parser .obj,
+codec mesh, validasi, geometri 2D, export vektor) tidak pernah menggambar.
+Modul yang memakai GL tidak lagi menjalankan `from OpenGL.GL import *` saat
+diimpor, melainkan mendaftarkan namespace globalnya ke modul ini dengan
+`bind(globals())`. Nama-nama GL baru diisikan ke namespace tersebut ketika
+`load()` dipanggil, yaitu tepat sebelum window atau konteks offscreen dibuat.
+Dengan begitu modul-modul tersebut tetap dapat diimpor tanpa PyOpenGL.
+
+Isi yang diikat sama dengan `from OpenGL.GL import *` (juga GLU dan GLUT)
+ditambah submodul `shaders`. Nama yang sudah didefinisikan modul sendiri
+tidak ditimpa. Konstanta input GLUT (INPUT_CONSTANTS) diikat langsung oleh
+`bind()`, sehingga skrip dan callback keyboard/mouse dapat diputar tanpa
+window (--headless) tanpa memuat PyOpenGL sama sekali.
+
+Contoh:
+    import gl_loader
+    gl_loader.bind(globals())          # di tingkat modul, menggantikan import GL
+
+    def main():
+        gl_loader.load()               # sebelum glutInit / membuat konteks
+        glutInit(sys.argv)
+"""
+
+import sys
+
+# Namespace modul yang menunggu nama GL
+namespaces = []
+
+# Nama GL yang sudah dimuat (None selama load() belum dipanggil)
+bindings = None
+
+# Konstanta input GLUT dengan nilai tetap dari spesifikasi GLUT (sama dengan
+# yang diekspor PyOpenGL): tombol mouse dan statusnya, tombol khusus, modifier
+INPUT_CONSTANTS = {
+    'GLUT_LEFT_BUTTON': 0, 'GLUT_MIDDLE_BUTTON': 1, 'GLUT_RIGHT_BUTTON': 2,
+    'GLUT_DOWN': 0, 'GLUT_UP': 1,
+    'GLUT_KEY_LEFT': 100, 'GLUT_KEY_UP': 101, 'GLUT_KEY_RIGHT': 102, 'GLUT_KEY_DOWN': 103,
+    'GLUT_KEY_PAGE_UP': 104, 'GLUT_KEY_PAGE_DOWN': 105, 'GLUT_KEY_HOME': 106,
+    'GLUT_KEY_END': 107, 'GLUT_KEY_INSERT': 108,
+    'GLUT_ACTIVE_SHIFT': 1, 'GLUT_ACTIVE_CTRL': 2, 'GLUT_ACTIVE_ALT': 4,
+}
+INPUT_CONSTANTS.update({f'GLUT_KEY_F{i}': i for i in range(1, 13)})
+
+
+def _public_names(module):
+    """Nama yang diekspor `from module import *`."""
+    names = getattr(module, '__all__', None)
+    if names is None:
+        names = [name for name in vars(module) if not name.startswith('_')]
+    return {name: getattr(module, name) for name in names if hasattr(module, name)}
+
+
+def _fill(namespace):
+    for name, value in bindings.items():
+        namespace.setdefault(name, value)
+
+
+def bind(namespace):
+    """Mendaftarkan namespace modul agar diisi nama GL saat load().
+
+    Konstanta input GLUT langsung diisikan. Jika GL sudah dimuat, namespace
+    langsung diisi seluruhnya.
+    """
+    for name, value in INPUT_CONSTANTS.items():
+        namespace.setdefault(name, value)
+    if bindings is not None:
+        _fill(namespace)
+        return
+    namespaces.append(namespace)
+
+
+def loaded():
+    """True jika PyOpenGL sudah dimuat oleh load()."""
+    return bindings is not None
+
+
+def load():
+    """Mengimpor PyOpenGL (sekali saja) dan mengisi semua namespace yang terdaftar.
+
+    Keluar dengan pesan error jika PyOpenGL tidak terinstal.
+    """
+    global bindings
+    if bindings is not None:
+        return
+    try:
+        import OpenGL.GL
+        import OpenGL.GLU
+        import OpenGL.GLUT
+        from OpenGL.GL import shaders
+    except ImportError:
+        print("Error: PyOpenGL tidak terinstal.")
+        print("Silakan instal dengan perintah: pip install PyOpenGL PyOpenGL_accelerate")
+        sys.exit(1)
+    names = {}
+    for module in (OpenGL.GL, OpenGL.GLUT, OpenGL.GLU):
+        names.update(_public_names(module))
+    names['shaders'] = shaders
+    bindings = names
+    for namespace in namespaces:
+        _fill(namespace)
+    namespaces.clear()
@@ -0,0 +1,470 @@
+# -*- coding: utf-8 -*-
+"""
+Skrip, Rekaman, dan Replay Interaksi untuk Aplikasi Grafika 2D dan 3D
+
+Deskripsi:
+Modul ini membaca skrip interaksi sederhana (satu perintah per baris) dan
+memutarnya melalui callback GLUT aplikasi (keyboard, mouse, dll.) dengan
+timer GLUT, sehingga sesi penggunaan dapat dijalankan ulang tanpa manusia
+di depan keyboard dan diukur waktunya dari awal hingga akhir.
+
+Sesi nyata juga dapat direkam ke file biner ringkas (.rec, gzip) lalu
+diputar ulang dengan kecepatan penuh atau real-time, dengan window maupun
+headless. Selama replay, latensi setiap handler dan waktu render setiap
+frame dicatat untuk membandingkan performa antar versi.
+
+Format skrip (koordinat dalam piksel window, titik asal kiri atas):
+    # komentar
+    wait 250                  Jeda (ms) sebelum perintah berikutnya
+    key w [shift|ctrl|alt]    Tombol keyboard (esc, tab, delete, ctrl+c, ...)
+    special up [shift]        Tombol khusus (up, down, left, right, f1, ...)
+    press X Y / release X Y   Tombol kiri mouse ditekan / dilepas
+    move X Y                  Gerakan mouse (dengan tombol ditekan)
+    click X Y [shift]         press + release di titik yang sama
+    drag X0 Y0 X1 Y1 [N]      Seret dari (X0,Y0) ke (X1,Y1) dalam N langkah
+    wheel ARAH [X Y]          Scroll mouse (1 atau -1)
+    quit                      Keluar dari aplikasi
+Perintah lain (mis. `load`, `export`) diteruskan ke fungsi perintah milik
+aplikasi. Fungsi perintah boleh mengembalikan False untuk meminta perintah
+yang sama dicoba lagi nanti (mis. menunggu pemuatan selesai).
+"""
+
+import sys
+import atexit
+import gzip
+import json
+import shlex
+import struct
+import time
+
+import gl_loader
+
+# Nama tombol keyboard -> byte yang dikirim GLUT
+KEY_NAMES = {
+    'esc': b'\x1b', 'tab': b'\t', 'enter': b'\r', 'space': b' ',
+    'backspace': b'\x08', 'delete': b'\x7f',
+}
+
+# Nama GL/GLUT diikat saat gl_loader.load() dipanggil oleh aplikasi; konstanta
+# input GLUT (tombol, mouse, modifier) sudah tersedia sejak bind()
+gl_loader.bind(globals())
+
+# Nama tombol khusus -> kode GLUT_KEY_*, dan nama modifier -> GLUT_ACTIVE_*
+SPECIAL_NAMES = {
+    'up': GLUT_KEY_UP, 'down': GLUT_KEY_DOWN, 'left': GLUT_KEY_LEFT, 'right': GLUT_KEY_RIGHT,
+    'pageup': GLUT_KEY_PAGE_UP, 'pagedown': GLUT_KEY_PAGE_DOWN,
+    'home': GLUT_KEY_HOME, 'end': GLUT_KEY_END, 'insert': GLUT_KEY_INSERT,
+}
+SPECIAL_NAMES.update({f'f{i}': GLUT_KEY_F1 + i - 1 for i in range(1, 13)})
+MODIFIER_NAMES = {'shift': GLUT_ACTIVE_SHIFT, 'ctrl': GLUT_ACTIVE_CTRL, 'alt': GLUT_ACTIVE_ALT}
+
+# Interval (ms) sebelum mencoba ulang perintah yang mengembalikan False
+RETRY_MS = 20
+
+# Modifier yang sedang diputar; None berarti baca dari GLUT
+modifier_override = None
+
+# State pemutaran skrip yang sedang berjalan
+playback = {
+    'events': [], 'index': 0, 'callbacks': {}, 'commands': {},
+    'start': 0.0, 'on_finish': None, 'use_delays': True,
+}
+
+# Format rekaman: header lalu record berukuran tetap berisi jeda sejak
+# event sebelumnya (mikrodetik), id callback, modifier, dan 4 argumen int.
+RECORD_MAGIC = b'GRFREC1\n'
+RECORD_STRUCT = struct.Struct('<IBBiiii')
+CALLBACK_IDS = ['keyboard', 'special_keys', 'mouse_click', 'mouse_motion', 'mouse_wheel']
+
+# Callback yang boleh memanggil glutGetModifiers()
+MODIFIER_CALLBACKS = ('keyboard', 'special_keys', 'mouse_click')
+
+# State perekaman yang sedang berjalan
+recording = {'file': None, 'last_time': 0.0, 'count': 0}
+
+# Statistik replay: latensi per nama callback dan waktu render per frame (detik)
+stats = {'enabled': False, 'latency': {}, 'frames': [], 'start': 0.0, 'elapsed': 0.0}
+
+# Fungsi yang dipanggil sekali setelah frame pertama selesai digambar
+first_frame_callbacks = []
+
+
+# =============================================================================
+# 1. MEMBACA SKRIP
+# =============================================================================
+
+def get_modifiers():
+    """Pengganti glutGetModifiers() yang menghormati modifier dari skrip."""
+    if modifier_override is not None:
+        return modifier_override
+    return glutGetModifiers()
+
+
+def parse_key(name):
+    """Mengubah nama tombol di skrip menjadi byte seperti yang dikirim GLUT."""
+    lowered = name.lower()
+    if lowered in KEY_NAMES:
+        return KEY_NAMES[lowered]
+    if lowered.startswith('ctrl+') and len(lowered) == 6 and lowered[5].isalpha():
+        return bytes([ord(lowered[5]) - ord('a') + 1])
+    if len(name) == 1:
+        return name.encode('utf-8')
+    raise ValueError(f"tombol tidak dikenal '{name}'")
+
+
+def parse_script(path):
+    """Membaca file skrip dan mengembalikan daftar event (delay_ms, nama, args, modifier)."""
+    events = []
+    with open(path, 'r') as f:
+        lines = f.readlines()
+
+    delay = 0.0
+    for line_no, line in enumerate(lines, 1):
+        parts = shlex.split(line, comments=True)
+        if not parts: continue
+        cmd, args = parts[0].lower(), parts[1:]
+        mods = 0
+        while args and args[-1].lower() in MODIFIER_NAMES:
+            mods |= MODIFIER_NAMES[args.pop().lower()]
+
+        try:
+            if cmd == 'wait':
+                delay += float(args[0])
+                continue
+            elif cmd == 'key':
+                events.append((delay, 'keyboard', (parse_key(args[0]), 0, 0), mods))
+            elif cmd == 'special':
+                events.append((delay, 'special_keys', (SPECIAL_NAMES[args[0].lower()], 0, 0), mods))
+            elif cmd in ('press', 'release', 'click'):
+                x, y = int(args[0]), int(args[1])
+                if cmd != 'release':
+                    events.append((delay, 'mouse_click', (GLUT_LEFT_BUTTON, GLUT_DOWN, x, y), mods))
+                    delay = 0.0
+                if cmd != 'press':
+                    events.append((delay, 'mouse_click', (GLUT_LEFT_BUTTON, GLUT_UP, x, y), mods))
+            elif cmd == 'move':
+                events.append((delay, 'mouse_motion', (int(args[0]), int(args[1])), mods))
+            elif cmd == 'drag':
+                x0, y0, x1, y1 = (int(a) for a in args[:4])
+                steps = max(1, int(args[4])) if len(args) > 4 else 10
+                events.append((delay, 'mouse_click', (GLUT_LEFT_BUTTON, GLUT_DOWN, x0, y0), mods))
+                for i in range(1, steps + 1):
+                    t = i / steps
+                    events.append((0.0, 'mouse_motion',
+                                   (round(x0 + (x1 - x0) * t), round(y0 + (y1 - y0) * t)), mods))
+                events.append((0.0, 'mouse_click', (GLUT_LEFT_BUTTON, GLUT_UP, x1, y1), mods))
+            elif cmd == 'wheel':
+                x, y = (int(args[1]), int(args[2])) if len(args) > 2 else (0, 0)
+                events.append((delay, 'mouse_wheel', (0, int(args[0]), x, y), mods))
+            else:
+                events.append((delay, 'command', (cmd, *args), mods))
+        except (IndexError, KeyError, ValueError) as e:
+            raise ValueError(f"{path}:{line_no}: perintah '{line.strip()}' tidak valid ({e})") from None
+        delay = 0.0
+    return events
+
+
+# =============================================================================
+# 2. MEMUTAR SKRIP
+# =============================================================================
+
+def dispatch_event(event, callbacks, commands):
+    """Menjalankan satu event. Mengembalikan False jika perintah minta dicoba ulang."""
+    global modifier_override
+    _, name, args, mods = event
+    if name == 'command':
+        cmd, params = args[0], args[1:]
+        if cmd == 'quit':
+            glutLeaveMainLoop()
+            return True
+        if cmd not in commands:
+            print(f"Peringatan: perintah skrip '{cmd}' tidak dikenal, dilewati.")
+            return True
+        return commands[cmd](*params) is not False
+    if name not in callbacks:
+        return True
+    modifier_override = mods
+    start = time.perf_counter()
+    try:
+        callbacks[name](*args)
+    finally:
+        modifier_override = None
+    if stats['enabled']:
+        stats['latency'].setdefault(name, []).append(time.perf_counter() - start)
+    return True
+
+
+def run_events(events, callbacks, commands=None, on_finish=None, use_delays=True):
+    """Memutar daftar event lewat timer GLUT, satu event per tick.
+
+    Jika `use_delays` False, jeda antar event diabaikan (kecepatan penuh).
+    """
+    playback.update({
+        'events': events, 'index': 0, 'callbacks': callbacks, 'commands': commands or {},
+        'start': time.perf_counter(), 'on_finish': on_finish, 'use_delays': use_delays,
+    })
+    if events:
+        glutTimerFunc(_delay_of(events[0]), _play_next, 0)
+    else:
+        _finish()
+
+
+def _delay_of(event):
+    """Jeda (ms) sebelum event, atau 0 saat diputar dengan kecepatan penuh."""
+    return int(event[0]) if playback['use_delays'] else 0
+
+
+def _play_next(value):
+    """Callback timer: menjalankan event berikutnya lalu menjadwalkan event sesudahnya."""
+    events = playback['events']
+    index = playback['index']
+    if index >= len(events): return
+    if not dispatch_event(events[index], playback['callbacks'], playback['commands']):
+        glutTimerFunc(RETRY_MS, _play_next, 0)
+        return
+    playback['index'] = index + 1
+    if playback['index'] < len(events):
+        glutTimerFunc(_delay_of(events[playback['index']]), _play_next, 0)
+    else:
+        _finish()
+
+
+def _finish():
+    """Mencetak total waktu pemutaran dan memanggil on_finish."""
+    elapsed = time.perf_counter() - playback['start']
+    stats['elapsed'] = elapsed
+    print(f"Skrip selesai: {len(playback['events'])} event dalam {elapsed:.3f} detik.")
+    if playback['on_finish']:
+        playback['on_finish']()
+
+
+def replay_headless(events, callbacks, commands=None, idle=None, use_delays=False):
+    """Memutar event langsung tanpa window dan timer GLUT.
+
+    `idle` dipanggil saat sebuah perintah minta dicoba ulang, misalnya untuk
+    memproses hasil pemuatan latar belakang. Perintah `quit` menghentikan
+    pemutaran.
+    """
+    start = time.perf_counter()
+    for event in events:
+        if use_delays and event[0]:
+            time.sleep(event[0] / 1000.0)
+        if event[1] == 'command' and event[2][0] == 'quit':
+            break
+        while not dispatch_event(event, callbacks, commands or {}):
+            if idle: idle()
+            time.sleep(RETRY_MS / 1000.0)
+    stats['elapsed'] = time.perf_counter() - start
+    print(f"Replay headless selesai: {len(events)} event dalam {stats['elapsed']:.3f} detik.")
+
+
+# =============================================================================
+# 3. PEREKAMAN DAN FILE REKAMAN
+# =============================================================================
+
+def start_recording(path):
+    """Mulai merekam semua callback input ke file .rec (ditutup otomatis saat keluar)."""
+    recording['file'] = gzip.open(path, 'wb')
+    recording['file'].write(RECORD_MAGIC)
+    recording['last_time'] = time.perf_counter()
+    recording['count'] = 0
+    atexit.register(stop_recording)
+    print(f"Merekam interaksi ke '{path}'.")
+
+
+def stop_recording():
+    """Menutup file rekaman yang sedang aktif."""
+    if recording['file'] is None: return
+    recording['file'].close()
+    recording['file'] = None
+    print(f"Rekaman selesai: {recording['count']} event.")
+
+
+def _encode_args(name, args):
+    """Mengubah argumen callback menjadi 4 bilangan bulat."""
+    if name in ('keyboard', 'special_keys'):
+        key, x, y = args
+        code = key[0] if isinstance(key, bytes) else int(key)
+        return code, 0, int(x), int(y)
+    values = [int(a) for a in args]
+    return tuple(values + [0] * (4 - len(values)))
+
+
+def _decode_args(name, values):
+    """Kebalikan dari _encode_args."""
+    a, b, x, y = values
+    if name == 'keyboard':
+        return bytes([a]), x, y
+    if name == 'special_keys':
+        return a, x, y
+    if name == 'mouse_motion':
+        return a, b
+    return a, b, x, y
+
+
+def record_event(name, args):
+    """Menulis satu invokasi callback ke file rekaman."""
+    now = time.perf_counter()
+    delay_us = min(int((now - recording['last_time']) * 1e6), 0xFFFFFFFF)
+    recording['last_time'] = now
+    mods = glutGetModifiers() if name in MODIFIER_CALLBACKS else 0
+    recording['file'].write(RECORD_STRUCT.pack(delay_us, CALLBACK_IDS.index(name), mods,
+                                               *_encode_args(name, args)))
+    recording['count'] += 1
+
+
+def recording_callbacks(callbacks):
+    """Membungkus callback sehingga setiap pemanggilan direkam sebelum diteruskan."""
+    def wrap(name, func):
+        def wrapper(*args):
+            if recording['file'] is not None:
+                record_event(name, args)
+            return func(*args)
+        return wrapper
+    return {name: wrap(name, func) if name in CALLBACK_IDS else func for name, func in callbacks.items()}
+
+
+def load_recording(path):
+    """Membaca file .rec dan mengembalikan daftar event seperti parse_script()."""
+    with gzip.open(path, 'rb') as f:
+        data = f.read()
+    if not data.startswith(RECORD_MAGIC):
+        raise ValueError(f"'{path}' bukan file rekaman interaksi")
+    events = []
+    for delay_us, cb_id, mods, *values in RECORD_STRUCT.iter_unpack(data[len(RECORD_MAGIC):]):
+        name = CALLBACK_IDS[cb_id]
+        events.append((delay_us / 1000.0, name, _decode_args(name, values), mods))
+    return events
+
+
+# =============================================================================
+# 4. STATISTIK PERFORMA
+# =============================================================================
+
+def timed_display(display):
+    """Membungkus fungsi display agar waktu render tiap frame dicatat selama replay.
+
+    Setelah frame pertama, fungsi yang didaftarkan dengan after_first_frame() dipanggil.
+    """
+    def wrapper():
+        if not stats['enabled']:
+            display()
+        else:
+            start = time.perf_counter()
+            display()
+            glFinish()
+            stats['frames'].append(time.perf_counter() - start)
+        if first_frame_callbacks:
+            callbacks = first_frame_callbacks[:]
+            first_frame_callbacks.clear()
+            for callback in callbacks:
+                callback()
+    return wrapper
+
+
+def after_first_frame(callback):
+    """Mendaftarkan fungsi tanpa argumen yang dipanggil sekali setelah frame pertama."""
+    first_frame_callbacks.append(callback)
+
+
+def enable_stats():
+    """Mengosongkan dan mengaktifkan pencatatan statistik."""
+    stats.update({'enabled': True, 'latency': {}, 'frames': [], 'start': time.perf_counter(), 'elapsed': 0.0})
+
+
+def summarize(samples):
+    """Ringkasan (dalam ms) dari daftar durasi dalam detik."""
+    if not samples:
+        return {'count': 0}
+    ordered = sorted(samples)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000.0
+    return {
+        'count': len(ordered),
+        'mean_ms': sum(ordered) / len(ordered) * 1000.0,
+        'p50_ms': pick(0.50),
+        'p95_ms': pick(0.95),
+        'max_ms': ordered[-1] * 1000.0,
+    }
+
+
+def report_stats(path=None):
+    """Mencetak ringkasan latensi handler dan waktu frame, opsional menyimpannya ke JSON."""
+    report = {
+        'elapsed_s': stats['elapsed'],
+        'latency': {name: summarize(samples) for name, samples in sorted(stats['latency'].items())},
+        'frames': summarize(stats['frames']),
+    }
+    print("=" * 60)
+    print(f"{'Handler':<16}{'Jumlah':>8}{'Rata2 ms':>10}{'p50 ms':>9}{'p95 ms':>9}{'Maks ms':>9}")
+    rows = list(report['latency'].items()) + [('[frame]', report['frames'])]
+    for name, s in rows:
+        if not s['count']: continue
+        print(f"{name:<16}{s['count']:>8}{s['mean_ms']:>10.3f}{s['p50_ms']:>9.3f}{s['p95_ms']:>9.3f}{s['max_ms']:>9.3f}")
+    print(f"Total waktu replay: {stats['elapsed']:.3f} detik")
+    print("=" * 60)
+    if path:
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Statistik disimpan ke '{path}'.")
+    return report
+
+
+# =============================================================================
+# 5. INTEGRASI BARIS PERINTAH
+# =============================================================================
+
+def add_arguments(parser):
+    """Menambahkan opsi skrip, rekaman, dan replay ke parser argumen aplikasi."""
+    parser.add_argument("--script", help="file skrip interaksi yang diputar setelah window siap")
+    parser.add_argument("--record", metavar="FILE", help="rekam semua input ke file .rec")
+    parser.add_argument("--replay", metavar="FILE", help="putar ulang file .rec lalu keluar")
+    parser.add_argument("--realtime", action="store_true",
+                        help="putar rekaman sesuai jeda aslinya (default: kecepatan penuh)")
+    parser.add_argument("--headless", action="store_true",
+                        help="putar skrip/rekaman tanpa window (hanya latensi handler)")
+    parser.add_argument("--stats", metavar="FILE", help="simpan statistik latensi dan waktu frame ke JSON")
+    parser.add_argument("--exit-after-first-frame", action="store_true",
+                        help="keluar segera setelah frame pertama selesai (untuk mengukur waktu startup)")
+
+
+def load_events(args):
+    """Membaca event dari --script atau --replay. Keluar dengan pesan error jika gagal."""
+    try:
+        if args.replay:
+            return load_recording(args.replay)
+        if args.script:
+            return parse_script(args.script)
+    except (OSError, ValueError) as e:
+        print(f"Error: Gagal membaca skrip/rekaman: {e}")
+        sys.exit(1)
+    return []
+
+
+def start_session(args, events, callbacks, commands):
+    """Memulai perekaman dan/atau pemutaran sesuai argumen, untuk mode dengan window.
+
+    Mengembalikan callback (mungkin dibungkus perekam) untuk didaftarkan ke GLUT.
+    """
+    if args.record:
+        start_recording(args.record)
+        callbacks = recording_callbacks(callbacks)
+    if events:
+        def on_finish():
+            report_stats(args.stats)
+            if args.replay:
+                glutLeaveMainLoop()
+        enable_stats()
+        run_events(events, callbacks, commands, on_finish, use_delays=not args.replay or args.realtime)
+    if args.exit_after_first_frame:
+        def leave():
+            glFinish()
+            glutLeaveMainLoop()
+        after_first_frame(leave)
+    return callbacks
+
+
+def run_headless(args, events, callbacks, commands, idle=None):
+    """Memutar event tanpa window lalu mencetak statistiknya."""
+    enable_stats()
+    replay_headless(events, callbacks, commands, idle, use_delays=args.realtime)
+    report_stats(args.stats)
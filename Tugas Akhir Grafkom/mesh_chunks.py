@@ -0,0 +1,414 @@
+# -*- coding: utf-8 -*-
+"""
+Format Mesh Ber-chunk untuk Menampilkan Model yang Lebih Besar dari RAM
+
+Deskripsi:
+File .obj dikonversi sekali menjadi file biner .mchk: segitiga diurutkan
+secara spasial (kurva Morton dari pusat segitiga) lalu dibagi menjadi chunk
+berisi paling banyak `chunk_triangles` segitiga. Setiap chunk menyimpan
+AABB-nya dan beberapa level LOD: level 0 adalah segitiga asli, level
+berikutnya hasil vertex clustering dengan grid yang makin kasar (LOD_GRIDS).
+
+Viewer memetakan file ke memori (memmap) dan hanya membaca chunk yang
+terlihat, pada level LOD yang sesuai ukurannya di layar. Chunk yang sudah
+dimuat disimpan di ChunkCache (LRU) dengan batas ukuran tetap dalam byte.
+
+Konversi membaca .obj secara streaming; vertex, normal, dan indeks segitiga
+ditampung di file sementara yang di-memmap. Yang tetap berada di RAM hanya
+kunci urutan spasial (16 byte per segitiga).
+
+Layout file .mchk (little endian):
+    MAGIC (8 byte)
+    header: jumlah chunk (u32), jumlah segitiga (u64), pusat asli (3 f32),
+            AABB min (3 f32), AABB max (3 f32) dari posisi yang sudah dipusatkan
+    tabel chunk: per chunk dan per level segitiga pertama (u64), jumlah (u32),
+                 ukuran sel grid (f32, 0 untuk level 0); lalu AABB chunk (6 f32)
+    data (rata 16 byte): per vertex posisi + normal (6 f32), 3 vertex per segitiga
+
+Contoh:
+    python mesh_chunks.py scan.obj scan.mchk
+    python Modul_B_3D.py scan.mchk --chunk-cache-mb 256
+"""
+
+import os
+import sys
+import struct
+import argparse
+import tempfile
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: NumPy tidak terinstal.")
+    print("Silakan instal dengan perintah: pip install numpy")
+    sys.exit(1)
+
+EXTENSION = ".mchk"
+MAGIC = b'GRFMESH1'
+HEADER_STRUCT = struct.Struct('<IQ3f3f3f')
+
+# Level LOD: jumlah sel grid clustering sepanjang sisi terpanjang chunk (0 = segitiga asli)
+LOD_GRIDS = (0, 64, 16, 4)
+CHUNK_DTYPE = np.dtype([('first', '<u8', len(LOD_GRIDS)), ('count', '<u4', len(LOD_GRIDS)),
+                        ('cell', '<f4', len(LOD_GRIDS)), ('lo', '<f4', 3), ('hi', '<f4', 3)])
+
+# Satu segitiga = 3 vertex x 6 float32 (posisi + normal)
+TRIANGLE_BYTES = 3 * 6 * 4
+
+DEFAULT_CHUNK_TRIANGLES = 65536
+
+# Jumlah segitiga yang diproses per blok saat konversi, dan jumlah baris .obj
+# yang ditampung sebagai objek Python sebelum ditulis ke file sementara
+CONVERT_BLOCK = 1 << 20
+PARSE_FLUSH = 1 << 16
+
+
+# =============================================================================
+# 1. GEOMETRI SEGITIGA
+# =============================================================================
+
+def interleave_with_normals(positions, normals, n_ids):
+    """Menggabungkan posisi vertex segitiga (n*3, 3) dengan normalnya menjadi array (n*3, 6).
+
+    `n_ids` adalah indeks ke `normals` per vertex; vertex dengan indeks
+    negatif memakai normal datar hasil cross product segitiganya.
+    """
+    tri = positions.reshape(-1, 3, 3)
+    flat = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    length = np.linalg.norm(flat, axis=1, keepdims=True)
+    flat = np.divide(flat, length, out=np.zeros_like(flat), where=length > 0)
+    out_normals = np.repeat(flat, 3, axis=0)
+    has_normal = n_ids >= 0
+    if len(normals):
+        out_normals[has_normal] = normals[n_ids[has_normal]]
+    return np.hstack([positions, out_normals])
+
+
+def cluster_triangles(data, origin, cell):
+    """Penyederhanaan vertex clustering untuk array segitiga (n*3, 6).
+
+    Setiap vertex diganti rata-rata vertex lain di sel grid berukuran `cell`
+    yang sejajar dengan `origin`; segitiga yang dua vertexnya jatuh di sel
+    yang sama hilang. Karena grid sejajar untuk seluruh mesh, chunk
+    bertetangga dengan ukuran sel yang sama berbagi sel di perbatasannya.
+    """
+    if not len(data):
+        return data
+    cells = np.floor((data[:, :3] - origin) / cell).astype(np.int64)
+    keys = (cells[:, 0] << 42) | (cells[:, 1] << 21) | cells[:, 2]
+    _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    inverse = inverse.reshape(-1)
+    merged = np.empty((len(counts), 6), dtype=np.float64)
+    for column in range(6):
+        merged[:, column] = np.bincount(inverse, weights=data[:, column], minlength=len(counts)) / counts
+    length = np.linalg.norm(merged[:, 3:], axis=1, keepdims=True)
+    merged[:, 3:] = np.divide(merged[:, 3:], length, out=np.zeros_like(merged[:, 3:]), where=length > 0)
+    tri = inverse.reshape(-1, 3)
+    keep = (tri[:, 0] != tri[:, 1]) & (tri[:, 1] != tri[:, 2]) & (tri[:, 2] != tri[:, 0])
+    return merged[tri[keep].reshape(-1)].astype(np.float32)
+
+
+def lod_cell_sizes(chunk_size, mesh_size):
+    """Ukuran sel grid setiap level LOD untuk chunk dengan sisi terpanjang `chunk_size`.
+
+    Ukuran dibulatkan ke bawah menjadi mesh_size / 2^k agar chunk berukuran
+    mirip memakai grid yang sama persis.
+    """
+    sizes = []
+    for grid in LOD_GRIDS:
+        if grid == 0 or chunk_size <= 0:
+            sizes.append(0.0)
+        else:
+            sizes.append(mesh_size / 2.0 ** np.ceil(np.log2(mesh_size * grid / chunk_size)))
+    return sizes
+
+
+def morton_codes(points, low, high):
+    """Kode Morton 63-bit (21 bit per sumbu) untuk titik di dalam AABB [low, high]."""
+    unit = (points - low) / np.maximum(high - low, 1e-12)
+    q = np.minimum((unit * (1 << 21)).astype(np.uint64), np.uint64((1 << 21) - 1))
+    codes = np.zeros(len(points), dtype=np.uint64)
+    for bit in range(21):
+        for axis in range(3):
+            codes |= ((q[:, axis] >> np.uint64(bit)) & np.uint64(1)) << np.uint64(3 * bit + 2 - axis)
+    return codes
+
+
+# =============================================================================
+# 2. KONVERSI .OBJ -> .MCHK
+# =============================================================================
+
+def _parse_obj_to_files(filename, tmp_dir, progress=None):
+    """Membaca .obj baris demi baris ke file biner sementara (vertex, normal, indeks segitiga)."""
+    paths = {name: os.path.join(tmp_dir, name) for name in ('v', 'vn', 'tri')}
+    counts = {'v': 0, 'vn': 0, 'tri': 0}
+    buffers = {'v': [], 'vn': [], 'tri': []}
+    total_size = max(os.path.getsize(filename), 1)
+    bytes_read = 0
+
+    with open(paths['v'], 'wb') as fv, open(paths['vn'], 'wb') as fn, open(paths['tri'], 'wb') as ft:
+        files = {'v': (fv, 'f4'), 'vn': (fn, 'f4'), 'tri': (ft, 'i4')}
+
+        def flush(name):
+            if buffers[name]:
+                f, dtype = files[name]
+                f.write(np.asarray(buffers[name], dtype=dtype).tobytes())
+                buffers[name].clear()
+
+        with open(filename, 'r') as f:
+            for line_no, line in enumerate(f):
+                if progress is not None:
+                    bytes_read += len(line)
+                    if line_no % 65536 == 0:
+                        progress(bytes_read / total_size)
+                parts = line.split()
+                if not parts: continue
+                if parts[0] == 'v' or parts[0] == 'vn':
+                    buffers[parts[0]].append(tuple(map(float, parts[1:4])))
+                    counts[parts[0]] += 1
+                    if len(buffers[parts[0]]) >= PARSE_FLUSH: flush(parts[0])
+                elif parts[0] == 'f':
+                    face = []
+                    for part in parts[1:]:
+                        indices = part.split('/')
+                        face.append((int(indices[0]) - 1,
+                                     int(indices[2]) - 1 if len(indices) > 2 and indices[2] else -1))
+                    # Triangulasi fan: (v0, vi, vi+1), disimpan sebagai v0 v1 v2 n0 n1 n2
+                    for i in range(1, len(face) - 1):
+                        a, b, c = face[0], face[i], face[i + 1]
+                        buffers['tri'].append((a[0], b[0], c[0], a[1], b[1], c[1]))
+                        counts['tri'] += 1
+                    if len(buffers['tri']) >= PARSE_FLUSH: flush('tri')
+        for name in buffers:
+            flush(name)
+    return paths, counts
+
+
+def _open_temp(path, count, width, dtype):
+    if count == 0:
+        return np.zeros((0, width), dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', shape=(count, width))
+
+
+def convert_obj(obj_path, out_path, chunk_triangles=DEFAULT_CHUNK_TRIANGLES, progress=None):
+    """Mengonversi .obj menjadi file .mchk ber-chunk. Mengembalikan (jumlah segitiga, jumlah chunk)."""
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(out_path))) as tmp_dir:
+        paths, counts = _parse_obj_to_files(obj_path, tmp_dir, progress)
+        vertices = _open_temp(paths['v'], counts['v'], 3, '<f4')
+        normals = _open_temp(paths['vn'], counts['vn'], 3, '<f4')
+        tris = _open_temp(paths['tri'], counts['tri'], 6, '<i4')
+        total = len(tris)
+
+        # AABB dan pusat model dihitung per blok agar tidak memuat semua vertex sekaligus
+        low = np.full(3, np.inf, dtype=np.float64)
+        high = np.full(3, -np.inf, dtype=np.float64)
+        for start in range(0, len(vertices), CONVERT_BLOCK):
+            block = vertices[start:start + CONVERT_BLOCK]
+            low = np.minimum(low, block.min(axis=0))
+            high = np.maximum(high, block.max(axis=0))
+        center = (low + high) / 2.0 if len(vertices) else np.zeros(3)
+
+        # Urutan spasial: kode Morton pusat segitiga, lalu diurutkan
+        codes = np.empty(total, dtype=np.uint64)
+        for start in range(0, total, CONVERT_BLOCK):
+            ids = tris[start:start + CONVERT_BLOCK, :3]
+            codes[start:start + len(ids)] = morton_codes(vertices[ids].mean(axis=1), low, high)
+        order = np.argsort(codes, kind='stable')
+        del codes
+
+        chunk_count = (total + chunk_triangles - 1) // chunk_triangles
+        table = np.zeros(chunk_count, dtype=CHUNK_DTYPE)
+        data_offset = len(MAGIC) + HEADER_STRUCT.size + table.nbytes
+        data_offset += -data_offset % 16
+        centered_low = (low - center) if len(vertices) else np.zeros(3)
+        centered_high = (high - center) if len(vertices) else np.zeros(3)
+        mesh_size = float((centered_high - centered_low).max())
+        written = 0
+        with open(out_path, 'wb') as out:
+            out.seek(data_offset)
+            for index in range(chunk_count):
+                ids = np.sort(order[index * chunk_triangles:(index + 1) * chunk_triangles])
+                chunk = tris[ids]
+                positions = (vertices[chunk[:, :3].reshape(-1)] - center).astype(np.float32)
+                full = np.ascontiguousarray(interleave_with_normals(positions, normals, chunk[:, 3:].reshape(-1)),
+                                            dtype='<f4')
+                lo, hi = positions.min(axis=0), positions.max(axis=0)
+                cells = lod_cell_sizes(float((hi - lo).max()), mesh_size)
+                firsts, counts = [], []
+                for cell in cells:
+                    data = full if cell == 0 else cluster_triangles(full, centered_low, cell)
+                    out.write(data.astype('<f4').tobytes())
+                    firsts.append(written)
+                    counts.append(len(data) // 3)
+                    written += len(data) // 3
+                table[index] = (firsts, counts, cells, lo, hi)
+
+            out.seek(0)
+            out.write(MAGIC)
+            out.write(HEADER_STRUCT.pack(chunk_count, total, *center, *centered_low, *centered_high))
+            out.write(table.tobytes())
+        del vertices, normals, tris
+    return total, chunk_count
+
+
+# =============================================================================
+# 3. MEMBACA FILE .MCHK
+# =============================================================================
+
+class ChunkedMesh:
+    """Mesh .mchk yang di-memmap; data chunk hanya dibaca dari disk saat diakses."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError("bukan file mesh .mchk")
+            fields = HEADER_STRUCT.unpack(f.read(HEADER_STRUCT.size))
+            # triangle_count adalah jumlah segitiga asli (level 0 semua chunk)
+            self.chunk_count, self.triangle_count = fields[0], fields[1]
+            self.center = tuple(fields[2:5])
+            self.low, self.high = np.array(fields[5:8]), np.array(fields[8:11])
+            self.table = np.frombuffer(f.read(CHUNK_DTYPE.itemsize * self.chunk_count), dtype=CHUNK_DTYPE)
+        data_offset = len(MAGIC) + HEADER_STRUCT.size + self.table.nbytes
+        data_offset += -data_offset % 16
+        stored = int((self.table['first'] + self.table['count']).max()) if self.chunk_count else 0
+        self.data = None
+        if stored:
+            self.data = np.memmap(path, dtype='<f4', mode='r', offset=data_offset, shape=(stored * 3, 6))
+        self.extent = float(np.abs(np.concatenate([self.low, self.high])).max()) or 1.0
+
+        # 8 sudut AABB setiap chunk (koordinat homogen) untuk culling dan LOD
+        lo, hi = self.table['lo'], self.table['hi']
+        corners = np.empty((self.chunk_count, 8, 4), dtype=np.float64)
+        for i in range(8):
+            corners[:, i, 0] = np.where(i & 1, hi[:, 0], lo[:, 0])
+            corners[:, i, 1] = np.where(i & 2, hi[:, 1], lo[:, 1])
+            corners[:, i, 2] = np.where(i & 4, hi[:, 2], lo[:, 2])
+        corners[:, :, 3] = 1.0
+        self.corners = corners
+
+    def chunk_triangles(self, index, level):
+        """Jumlah segitiga chunk `index` pada level LOD `level`."""
+        return int(self.table['count'][index, level])
+
+    def chunk_data(self, index, level):
+        """Array (n*3, 6) float32 chunk `index` pada level LOD `level` (view memmap, tanpa salinan)."""
+        first = int(self.table['first'][index, level]) * 3
+        return self.data[first:first + self.chunk_triangles(index, level) * 3]
+
+    def select_chunks(self, mvp, viewport, pixels_per_cell=1.0):
+        """Chunk yang terlihat untuk matriks model-view-projection `mvp` (4x4, clip = mvp @ titik).
+
+        Mengembalikan daftar (indeks chunk, level LOD). Level yang dipilih
+        adalah level paling kasar yang sel grid-nya tidak lebih besar dari
+        `pixels_per_cell` piksel di layar, sehingga penyederhanaan tidak terlihat.
+        Chunk yang memotong bidang kamera selalu memakai level 0.
+        """
+        if not self.chunk_count:
+            return []
+        clip = self.corners @ np.asarray(mvp, dtype=np.float64).T
+        x, y, z, w = clip[..., 0], clip[..., 1], clip[..., 2], clip[..., 3]
+        # Chunk dibuang jika kedelapan sudutnya berada di luar salah satu bidang frustum
+        outside = ((x < -w).all(axis=1) | (x > w).all(axis=1) | (y < -w).all(axis=1) |
+                   (y > w).all(axis=1) | (z < -w).all(axis=1) | (z > w).all(axis=1))
+        visible = np.nonzero(~outside)[0]
+
+        wv = w[visible]
+        in_front = (wv > 1e-9).all(axis=1)
+        safe_w = np.where(wv > 1e-9, wv, 1.0)
+        ndc_x, ndc_y = x[visible] / safe_w, y[visible] / safe_w
+        # Piksel per satuan dunia, diperkirakan dari proyeksi AABB (tanpa dipotong layar)
+        span = np.maximum((ndc_x.max(axis=1) - ndc_x.min(axis=1)) * viewport[0] / 2.0,
+                          (ndc_y.max(axis=1) - ndc_y.min(axis=1)) * viewport[1] / 2.0)
+        size = (self.table['hi'][visible] - self.table['lo'][visible]).max(axis=1)
+        pixels_per_unit = span / np.maximum(size, 1e-12)
+        cells = self.table['cell'][visible].astype(np.float64)
+        usable = ((cells > 0) & (cells * pixels_per_unit[:, None] <= pixels_per_cell) &
+                  (self.table['count'][visible] > 0) & in_front[:, None])
+        # Level tertinggi (paling kasar) yang memenuhi syarat, atau 0
+        last = len(LOD_GRIDS) - 1 - np.argmax(usable[:, ::-1], axis=1)
+        levels = np.where(usable.any(axis=1), last, 0)
+        return list(zip(visible.tolist(), levels.tolist()))
+
+
+# =============================================================================
+# 4. CACHE CHUNK (LRU)
+# =============================================================================
+
+class ChunkCache:
+    """Cache LRU berbatas byte untuk chunk yang sudah dimuat (mis. VBO di GPU).
+
+    `load(mesh, index, level)` membuat nilai cache, `release(value)`
+    membebaskannya saat dikeluarkan. Setiap chunk disimpan pada satu level
+    LOD; permintaan level yang lebih halus memuat ulang chunk tersebut.
+    """
+
+    def __init__(self, budget_bytes, load, release=None):
+        self.budget_bytes = budget_bytes
+        self.load = load
+        self.release = release
+        self.entries = OrderedDict()
+        self.used_bytes = 0
+        self.loaded_bytes = 0  # total byte yang pernah dimuat (untuk statistik)
+
+    def _evict(self, key):
+        value, level, nbytes = self.entries.pop(key)
+        self.used_bytes -= nbytes
+        if self.release: self.release(value)
+
+    def get(self, mesh, index, level, allow_load=True):
+        """(nilai, level dimuat) untuk chunk `index` pada level `level` atau lebih halus.
+
+        Jika `allow_load` False, chunk tidak dimuat: entri yang ada (mungkin
+        dengan level lebih kasar) dikembalikan, atau None jika belum ada.
+        """
+        key = (id(mesh), index)
+        entry = self.entries.get(key)
+        if entry is not None and (entry[1] <= level or not allow_load):
+            self.entries.move_to_end(key)
+            return entry[:2]
+        if not allow_load:
+            return None
+        if entry is not None:
+            self._evict(key)
+        nbytes = mesh.chunk_triangles(index, level) * TRIANGLE_BYTES
+        while self.entries and self.used_bytes + nbytes > self.budget_bytes:
+            self._evict(next(iter(self.entries)))
+        value = self.load(mesh, index, level)
+        self.entries[key] = (value, level, nbytes)
+        self.used_bytes += nbytes
+        self.loaded_bytes += nbytes
+        return value, level
+
+    def drop_mesh(self, mesh):
+        """Mengeluarkan semua chunk milik `mesh` dari cache."""
+        for key in [key for key in self.entries if key[0] == id(mesh)]:
+            self._evict(key)
+
+
+# =============================================================================
+# 5. FUNGSI MAIN
+# =============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Konversi .obj menjadi mesh ber-chunk .mchk (out-of-core)")
+    parser.add_argument("input", help="file .obj sumber")
+    parser.add_argument("output", help="file .mchk tujuan")
+    parser.add_argument("--chunk-triangles", type=int, default=DEFAULT_CHUNK_TRIANGLES,
+                        help=f"jumlah segitiga per chunk (default {DEFAULT_CHUNK_TRIANGLES})")
+    args = parser.parse_args(argv)
+
+    def report(fraction):
+        print(f"\rMembaca '{args.input}': {fraction * 100:5.1f}%", end="", flush=True)
+
+    try:
+        total, chunks = convert_obj(args.input, args.output, args.chunk_triangles, report)
+    except (OSError, ValueError, IndexError) as e:
+        print(f"\nError: Gagal mengonversi '{args.input}': {e}")
+        sys.exit(1)
+    print(f"\n{total} segitiga dalam {chunks} chunk ditulis ke '{args.output}'.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,372 @@
+# -*- coding: utf-8 -*-
+"""
+Format Mesh Ringkas (.qmsh) dengan Kuantisasi dan Kompresi
+
+Deskripsi:
+Menyimpan model Modul_B_3D jauh lebih kecil daripada .obj maupun array
+float32 mentah:
+- posisi dikuantisasi ke 16 bit per sumbu terhadap AABB model (yang sudah
+  dipusatkan), lalu disimpan sebagai selisih dengan vertex sebelumnya;
+- normal dikodekan oktahedral menjadi dua bilangan 16 bit;
+- ukuran face dan indeks vertex setiap sudut face dikodekan sebagai selisih
+  dengan sudut sebelumnya (zigzag + varint); indeks normal disimpan relatif
+  terhadap indeks vertex sudut yang sama;
+- seluruh payload dikompresi dengan zlib, dengan byte tinggi dan rendah
+  array 16 bit dipisah agar lebih mudah dikompresi.
+
+Decode sepenuhnya memakai operasi array NumPy (tanpa loop per vertex),
+sehingga membaca file yang jauh lebih kecil ditambah decode tetap lebih
+cepat daripada membaca array float mentah dari disk.
+
+Contoh:
+    python mesh_codec.py model.obj model.qmsh
+    python mesh_codec.py model.qmsh kembali.obj
+    python Modul_B_3D.py model.qmsh
+"""
+
+import sys
+import zlib
+import struct
+import argparse
+from itertools import chain
+from collections.abc import Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: NumPy tidak terinstal.")
+    print("Silakan instal dengan perintah: pip install numpy")
+    sys.exit(1)
+
+EXTENSION = ".qmsh"
+MAGIC = b'GRFQMSH1'
+# Jumlah vertex, normal, face, sudut face; pusat asli; AABB posisi yang sudah dipusatkan
+HEADER_STRUCT = struct.Struct('<IIII3f3f3f')
+# Panjang byte aliran varint: ukuran face, indeks vertex, indeks normal
+SECTIONS_STRUCT = struct.Struct('<QQQ')
+
+COMPRESS_LEVEL = 6
+QUANT_MAX = 65535
+OCT_MAX = 32767
+
+
+# =============================================================================
+# 1. KODE ANGKA: ZIGZAG, VARINT, DAN PEMISAHAN BYTE
+# =============================================================================
+
+def zigzag_encode(values):
+    """Memetakan int64 bertanda ke uint64 (0, -1, 1, -2, ... -> 0, 1, 2, 3, ...)."""
+    values = np.asarray(values, dtype=np.int64)
+    return ((values << 1) ^ (values >> 63)).astype(np.uint64)
+
+
+def zigzag_decode(values):
+    """Kebalikan zigzag_encode; menerima array bilangan tak bertanda dengan tipe apa pun."""
+    values = np.asarray(values)
+    return (values >> 1).astype(np.int64) ^ -(values & 1).astype(np.int64)
+
+
+def varint_encode(values):
+    """Mengodekan array uint64 menjadi bytes varint (7 bit per byte, bit 8 = lanjut)."""
+    values = np.asarray(values, dtype=np.uint64)
+    if not len(values) or values.max() < 128:
+        return values.astype(np.uint8).tobytes()
+    lengths = np.ones(len(values), dtype=np.int64)
+    rest = values >> np.uint64(7)
+    while rest.any():
+        lengths += rest > 0
+        rest >>= np.uint64(7)
+    starts = np.cumsum(lengths) - lengths
+    position = np.arange(lengths.sum()) - np.repeat(starts, lengths)
+    out = (np.repeat(values, lengths) >> (7 * position).astype(np.uint64)) & np.uint64(0x7f)
+    out |= np.where(position < np.repeat(lengths, lengths) - 1, np.uint64(0x80), np.uint64(0))
+    return out.astype(np.uint8).tobytes()
+
+
+def varint_decode(data, count):
+    """Kebalikan varint_encode; `count` adalah jumlah bilangan yang diharapkan.
+
+    Tipe hasil adalah tipe tak bertanda terkecil yang cukup (uint8, uint32,
+    atau uint64) agar operasi array berikutnya lebih ringan.
+    """
+    raw = np.frombuffer(data, dtype=np.uint8)
+    if len(raw) == count:
+        # Semua bilangan muat dalam satu byte (kasus umum untuk selisih indeks)
+        return raw
+    ends = np.flatnonzero(raw < 0x80)
+    if len(ends) != count:
+        raise ValueError("aliran varint rusak")
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    lengths = ends - starts + 1
+    longest = int(lengths.max())
+    dtype = np.uint32 if longest <= 4 else np.uint64
+    payload = raw & 0x7f
+    values = payload[starts].astype(dtype)
+    # Satu langkah per posisi byte (paling banyak 10), bukan per byte
+    for k in range(1, longest):
+        longer = np.flatnonzero(lengths > k)
+        values[longer] |= payload[starts[longer] + k].astype(dtype) << dtype(7 * k)
+    return values
+
+
+def split_bytes(values):
+    """Array 16 bit -> bytes dengan semua byte rendah lebih dulu, lalu semua byte tinggi."""
+    return np.ascontiguousarray(np.asarray(values).astype('<u2').view(np.uint8).reshape(-1, 2).T).tobytes()
+
+
+def join_bytes(data, count):
+    planes = np.frombuffer(data, dtype=np.uint8, count=count * 2).reshape(2, count)
+    return np.ascontiguousarray(planes.T).view('<u2').reshape(-1)
+
+
+# =============================================================================
+# 2. KUANTISASI POSISI DAN NORMAL
+# =============================================================================
+
+def quantize_positions(positions, low, high):
+    """Posisi (n, 3) -> uint16 (n, 3) relatif terhadap AABB [low, high]."""
+    scale = QUANT_MAX / np.maximum(np.asarray(high, dtype=np.float64) - low, 1e-30)
+    return np.round((positions - np.asarray(low, dtype=np.float64)) * scale).clip(0, QUANT_MAX).astype(np.uint16)
+
+
+def dequantize_positions(quantized, low, high):
+    step = (np.asarray(high, dtype=np.float64) - low) / QUANT_MAX
+    return (quantized * step + low).astype(np.float32)
+
+
+def octahedral_encode(normals):
+    """Normal (n, 3) -> int16 (n, 2) dengan pemetaan oktahedral."""
+    normals = np.asarray(normals, dtype=np.float64).reshape(-1, 3)
+    total = np.abs(normals).sum(axis=1, keepdims=True)
+    n = np.divide(normals, total, out=np.zeros_like(normals), where=total > 0)
+    x, y = n[:, 0], n[:, 1]
+    sign_x = np.where(x >= 0, 1.0, -1.0)
+    sign_y = np.where(y >= 0, 1.0, -1.0)
+    # Setengah bola bawah dilipat ke sudut-sudut persegi
+    lower = n[:, 2] < 0
+    ox = np.where(lower, (1.0 - np.abs(y)) * sign_x, x)
+    oy = np.where(lower, (1.0 - np.abs(x)) * sign_y, y)
+    return np.round(np.stack([ox, oy], axis=1).clip(-1, 1) * OCT_MAX).astype(np.int16)
+
+
+def octahedral_decode(encoded):
+    """Kebalikan octahedral_encode; hasilnya normal satuan float32 (n, 3)."""
+    o = np.asarray(encoded, dtype=np.float32).reshape(-1, 2) / OCT_MAX
+    x, y = o[:, 0], o[:, 1]
+    z = 1.0 - np.abs(x) - np.abs(y)
+    fold = np.maximum(-z, 0.0)
+    x = x - np.where(x >= 0, fold, -fold)
+    y = y - np.where(y >= 0, fold, -fold)
+    normals = np.stack([x, y, z], axis=1)
+    return normals / np.linalg.norm(normals, axis=1, keepdims=True)
+
+
+# =============================================================================
+# 3. TAMPILAN LIST UNTUK ARRAY HASIL DECODE
+# =============================================================================
+
+class ArrayRows(Sequence):
+    """Array NumPy (n, k) yang tampil seperti list of tuple hasil parse_obj.
+
+    Tuple per baris baru dibuat saat diakses (mis. saat export), sehingga
+    decode tidak perlu membuat jutaan objek Python di muka.
+    """
+
+    def __init__(self, array):
+        self.array = array
+
+    def __len__(self):
+        return len(self.array)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(map(tuple, self.array[index].tolist()))
+        return tuple(self.array[index].tolist())
+
+    def __iter__(self):
+        return map(tuple, self.array.tolist())
+
+    def __array__(self, dtype=None, copy=None):
+        return self.array if dtype is None else self.array.astype(dtype)
+
+
+class FaceRows(Sequence):
+    """Face hasil decode (ukuran face + indeks vertex/normal per sudut) yang tampil seperti list face parse_obj."""
+
+    def __init__(self, sizes, corner_v, corner_n):
+        self.sizes = sizes
+        self.corner_v = corner_v
+        self.corner_n = corner_n
+        self.ends = np.cumsum(sizes)
+
+    def __len__(self):
+        return len(self.sizes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        end = int(self.ends[index])
+        start = end - int(self.sizes[index])
+        return tuple(zip(self.corner_v[start:end].tolist(), self.corner_n[start:end].tolist()))
+
+    def __iter__(self):
+        pairs = list(zip(self.corner_v.tolist(), self.corner_n.tolist()))
+        start = 0
+        for size in self.sizes.tolist():
+            yield tuple(pairs[start:start + size])
+            start += size
+
+
+# =============================================================================
+# 4. ENCODE DAN DECODE MODEL
+# =============================================================================
+
+def face_arrays(faces):
+    """Ukuran face serta indeks vertex dan normal per sudut (int64) dari list face parse_obj atau FaceRows."""
+    if isinstance(faces, FaceRows):
+        return faces.sizes, faces.corner_v, faces.corner_n
+    sizes = np.fromiter(map(len, faces), dtype=np.int64, count=len(faces))
+    flat = chain.from_iterable(chain.from_iterable(faces))
+    corners = np.fromiter(flat, dtype=np.int64, count=2 * int(sizes.sum())).reshape(-1, 2)
+    return sizes, corners[:, 0], corners[:, 1]
+
+
+def model_aabb(model, vertices):
+    """AABB posisi model; memakai hasil center_model_and_reset_transform jika ada."""
+    if "aabb" in model:
+        return np.asarray(model["aabb"][0], dtype=np.float64), np.asarray(model["aabb"][1], dtype=np.float64)
+    if not len(vertices):
+        return np.zeros(3), np.zeros(3)
+    return vertices.min(axis=0).astype(np.float64), vertices.max(axis=0).astype(np.float64)
+
+
+def encode_model(model):
+    """Mengodekan dictionary model Modul_B_3D (vertex sudah dipusatkan) menjadi bytes .qmsh."""
+    vertices = np.asarray(model["vertices"], dtype=np.float64).reshape(-1, 3)
+    normals = np.asarray(model["normals"], dtype=np.float64).reshape(-1, 3)
+    sizes, corner_v, corner_n = face_arrays(model["faces"])
+    low, high = model_aabb(model, vertices)
+
+    quantized = quantize_positions(vertices, low, high).astype(np.int64)
+    # Selisih dengan vertex sebelumnya (aritmetika modulo 2^16)
+    deltas = np.diff(quantized, axis=0, prepend=np.zeros((1, 3), dtype=np.int64)) & 0xffff
+    face_sizes = varint_encode(zigzag_encode(sizes - 3))
+    v_stream = varint_encode(zigzag_encode(np.diff(corner_v, prepend=0)))
+    # Indeks normal disimpan relatif terhadap indeks vertex sudut yang sama;
+    # untuk face "f a//a" (paling umum) seluruh alirannya bernilai 0
+    n_stream = varint_encode(zigzag_encode(np.diff(corner_n - corner_v, prepend=0)))
+
+    payload = b''.join([
+        SECTIONS_STRUCT.pack(len(face_sizes), len(v_stream), len(n_stream)),
+        split_bytes(deltas.T.reshape(-1)),
+        split_bytes(octahedral_encode(normals).view(np.uint16).T.reshape(-1)),
+        face_sizes, v_stream, n_stream,
+    ])
+    header = HEADER_STRUCT.pack(len(vertices), len(normals), len(sizes), len(corner_v),
+                                *model.get("center", (0.0, 0.0, 0.0)), *low, *high)
+    return MAGIC + header + zlib.compress(payload, COMPRESS_LEVEL)
+
+
+def triangulate(sizes, corner_v, corner_n):
+    """Triangulasi fan (v0, vi, vi+1) semua face sekaligus; mengembalikan indeks per sudut segitiga."""
+    if len(sizes) and sizes.min() == sizes.max() >= 3:
+        # Semua face berukuran sama (mis. mesh segitiga atau quad saja)
+        size = int(sizes[0])
+        fan = np.array([(0, i, i + 1) for i in range(1, size - 1)]).reshape(-1)
+        return corner_v.reshape(-1, size)[:, fan].reshape(-1), corner_n.reshape(-1, size)[:, fan].reshape(-1)
+    offsets = np.cumsum(sizes) - sizes
+    per_face = np.maximum(sizes - 2, 0)
+    face = np.repeat(np.arange(len(sizes)), per_face)
+    i = np.arange(per_face.sum()) - np.repeat(np.cumsum(per_face) - per_face, per_face) + 1
+    first = offsets[face]
+    corners = np.stack([first, first + i, first + i + 1], axis=1).reshape(-1)
+    return corner_v[corners], corner_n[corners]
+
+
+def decode_model(data):
+    """Kebalikan encode_model. Mengembalikan dictionary model Modul_B_3D.
+
+    "vertices", "normals", dan "faces" berupa ArrayRows/FaceRows di atas
+    array hasil decode. Hasilnya juga berisi "center", "extent", "aabb"
+    (sehingga tidak perlu dipusatkan ulang) dan "arrays": array posisi,
+    normal, serta indeks segitiga hasil triangulasi yang dipakai langsung
+    oleh build_vertex_array.
+    """
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("bukan file mesh .qmsh")
+    fields = HEADER_STRUCT.unpack_from(data, len(MAGIC))
+    vertex_count, normal_count, face_count, corner_count = fields[:4]
+    center, low, high = fields[4:7], np.array(fields[7:10]), np.array(fields[10:13])
+    try:
+        payload = zlib.decompress(data[len(MAGIC) + HEADER_STRUCT.size:])
+    except zlib.error as e:
+        raise ValueError(f"data terkompresi rusak: {e}")
+
+    size_len, v_len, n_len = SECTIONS_STRUCT.unpack_from(payload)
+    offset = SECTIONS_STRUCT.size
+    deltas = join_bytes(payload[offset:], vertex_count * 3).reshape(3, -1).T
+    offset += vertex_count * 6
+    octahedral = join_bytes(payload[offset:], normal_count * 2).view(np.int16).reshape(2, -1).T
+    offset += normal_count * 4
+    sizes = zigzag_decode(varint_decode(payload[offset:offset + size_len], face_count)) + 3
+    offset += size_len
+    corner_v = np.cumsum(zigzag_decode(varint_decode(payload[offset:offset + v_len], corner_count)))
+    offset += v_len
+    corner_n = corner_v + np.cumsum(zigzag_decode(varint_decode(payload[offset:offset + n_len], corner_count)))
+
+    positions = dequantize_positions(np.cumsum(deltas, axis=0, dtype=np.uint16), low, high)
+    normals = octahedral_decode(octahedral) if normal_count else np.zeros((0, 3), dtype=np.float32)
+
+    extent = float(np.abs(np.concatenate([low, high])).max()) if vertex_count else 1.0
+    return {
+        "vertices": ArrayRows(positions),
+        "normals": ArrayRows(normals),
+        "faces": FaceRows(sizes, corner_v, corner_n),
+        "center": center, "extent": extent or 1.0, "aabb": (tuple(low), tuple(high)),
+        "arrays": (positions, normals) + triangulate(sizes, corner_v, corner_n),
+    }
+
+
+def save_compact(model, filename):
+    with open(filename, 'wb') as f:
+        f.write(encode_model(model))
+
+
+def load_compact(filename):
+    with open(filename, 'rb') as f:
+        return decode_model(f.read())
+
+
+# =============================================================================
+# 5. FUNGSI MAIN
+# =============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Konversi antara .obj dan format mesh ringkas .qmsh")
+    parser.add_argument("input", help="file .obj atau .qmsh sumber")
+    parser.add_argument("output", help="file .qmsh atau .obj tujuan")
+    args = parser.parse_args(argv)
+
+    # Parser dan exporter .obj milik aplikasi 3D dipakai agar hasilnya identik
+    import Modul_B_3D
+    Modul_B_3D.headless = True
+    try:
+        if args.input.lower().endswith(EXTENSION):
+            model = load_compact(args.input)
+        else:
+            model = Modul_B_3D.parse_obj(args.input)
+            Modul_B_3D.center_model_and_reset_transform(model)
+        if args.output.lower().endswith(EXTENSION):
+            save_compact(model, args.output)
+        else:
+            Modul_B_3D.export_obj(args.output, model)
+    except (OSError, ValueError, IndexError) as e:
+        print(f"Error: Gagal mengonversi '{args.input}': {e}")
+        sys.exit(1)
+    print(f"{len(model['vertices'])} vertices, {len(model['faces'])} faces ditulis ke '{args.output}'.")
+
+
+if __name__ == "__main__":
+    main()
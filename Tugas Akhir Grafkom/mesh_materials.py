@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+"""
+Material (.mtl) dan Tekstur untuk Model .obj
+
+Deskripsi:
+Membaca library material .mtl yang dirujuk `mtllib` file .obj (nama
+material, warna diffuse Kd, dan tekstur diffuse map_Kd), mendekode gambar
+tekstur, dan membuat rantai mipmap-nya. Modul ini tidak memakai OpenGL;
+Modul_B_3D yang mengunggah hasilnya ke GPU.
+
+Gambar hasil decode disimpan di TextureCache dengan kunci hash isi file
+(SHA-1), bukan path-nya: file yang sama (atau salinan identik di folder
+lain) hanya didekode dan dibuatkan mipmap sekali, lalu dipakai bersama oleh
+semua model dan instance, termasuk saat model dimuat ulang.
+
+Decoder bawaan mendukung PNG (non-interlaced, semua tipe warna, 1-16 bit)
+dan PPM/PGM biner. Jika Pillow terinstal, format lain (mis. JPEG) juga
+dapat dibaca.
+
+Contoh:
+    cache = TextureCache(256 * 1024 * 1024)
+    materials = parse_mtl("model.mtl")
+    digest, levels = cache.load(materials["kayu"]["texture_path"])
+    levels[0].shape  # (tinggi, lebar, 4) uint8, baris paling bawah lebih dulu
+"""
+
+import io
+import os
+import sys
+import zlib
+import struct
+import hashlib
+import threading
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: NumPy tidak terinstal.")
+    print("Silakan instal dengan perintah: pip install numpy")
+    sys.exit(1)
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Warna diffuse material yang tidak menulis Kd (nilai default spesifikasi MTL)
+DEFAULT_DIFFUSE = (0.8, 0.8, 0.8)
+
+# Kunci tambahan dictionary model untuk koordinat tekstur dan material:
+# "texcoords" (n, 2) float64, "corner_t" indeks texcoord per sudut face (-1 =
+# tanpa UV), "face_materials" indeks material per face (-1 = tanpa material),
+# dan "materials" daftar material yang dirujuk indeks tersebut.
+MODEL_KEYS = ("texcoords", "corner_t", "face_materials", "materials")
+
+# Opsi map_Kd yang diikuti angka (mis. "-s 2 2 1") sebelum nama file
+MAP_OPTIONS = ("-blendu", "-blendv", "-boost", "-mm", "-o", "-s", "-t", "-texres",
+               "-clamp", "-bm", "-imfchan", "-type", "-cc")
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# Jumlah kanal per tipe warna PNG: abu-abu, RGB, palet, abu-abu + alpha, RGBA
+PNG_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+
+# =============================================================================
+# 1. LIBRARY MATERIAL (.mtl)
+# =============================================================================
+
+def _map_path(tokens, base_dir):
+    """Path tekstur dari argumen map_Kd setelah opsi-opsinya dilewati."""
+    i = 0
+    while i < len(tokens) and tokens[i].lower() in MAP_OPTIONS:
+        i += 1
+        while i < len(tokens) - 1:
+            try:
+                float(tokens[i])
+            except ValueError:
+                break
+            i += 1
+    name = " ".join(tokens[i:]).replace("\\", os.sep)
+    return os.path.normpath(os.path.join(base_dir, name)) if name else None
+
+
+def parse_mtl(filename):
+    """Membaca file .mtl. Mengembalikan dictionary nama -> material.
+
+    Setiap material berisi "name", "diffuse" (Kd) dan "texture_path" (path
+    absolut map_Kd, atau None). Parameter lain (Ka, Ks, Ns, d, ...) diabaikan.
+    """
+    base_dir = os.path.dirname(os.path.abspath(filename))
+    materials = {}
+    current = None
+    with open(filename, 'r') as f:
+        for line in f:
+            parts = line.strip().split()
+            if not parts: continue
+            if parts[0] == 'newmtl':
+                name = " ".join(parts[1:])
+                current = materials[name] = {"name": name, "diffuse": DEFAULT_DIFFUSE, "texture_path": None}
+            elif current is None:
+                continue
+            elif parts[0] == 'Kd' and len(parts) >= 4:
+                current["diffuse"] = tuple(map(float, parts[1:4]))
+            elif parts[0] == 'map_Kd':
+                current["texture_path"] = _map_path(parts[1:], base_dir)
+    return materials
+
+
+def write_mtl(filename, materials):
+    """Menulis daftar material ke file .mtl; path tekstur ditulis relatif terhadap file .mtl."""
+    base_dir = os.path.dirname(os.path.abspath(filename))
+    with open(filename, 'w') as f:
+        f.write("# Diekspor oleh Aplikasi Grafika 3D\n")
+        for material in materials:
+            f.write(f"\nnewmtl {material['name']}\n")
+            f.write("Kd {:.6f} {:.6f} {:.6f}\n".format(*material["diffuse"]))
+            if material.get("texture_path"):
+                f.write(f"map_Kd {os.path.relpath(material['texture_path'], base_dir)}\n")
+
+
+# =============================================================================
+# 2. DECODE GAMBAR
+# =============================================================================
+
+def _unfilter(data, height, row_bytes, bpp):
+    """Membalik filter baris PNG. `data` berisi byte filter + baris terfilter, hasilnya (height, row_bytes) uint8.
+
+    Filter None/Sub/Up dihitung per baris dengan operasi array. Jika ada baris
+    Average/Paeth (yang bergantung pada piksel kiri hasil decode), seluruh
+    gambar didekode per anti-diagonal piksel: semua piksel pada diagonal yang
+    sama hanya bergantung pada diagonal sebelumnya, sehingga satu langkah
+    array per diagonal (tinggi + lebar langkah) menggantikan loop per piksel.
+    """
+    rows = np.frombuffer(data, dtype=np.uint8, count=height * (row_bytes + 1)).reshape(height, row_bytes + 1)
+    filters = rows[:, 0]
+    if filters.max(initial=0) > 4:
+        raise ValueError("tipe filter PNG tidak dikenal")
+    filtered = rows[:, 1:]
+    width = row_bytes // bpp
+    if not (filters >= 3).any():
+        out = np.empty((height, row_bytes), dtype=np.uint8)
+        previous = np.zeros(row_bytes, dtype=np.uint8)
+        for y, kind in enumerate(filters.tolist()):
+            row = filtered[y]
+            if kind == 1:
+                # Sub: jumlah kumulatif per kanal (modulo 256)
+                row = np.cumsum(row.reshape(width, bpp), axis=0, dtype=np.uint8).reshape(-1)
+            elif kind == 2:
+                row = row + previous
+            out[y] = row
+            previous = out[y]
+        return out
+
+    pixels = filtered.reshape(height, width, bpp)
+    out = np.empty((height, width, bpp), dtype=np.uint8)
+    kinds = filters.astype(np.int16)[:, None]
+    # Dua diagonal sebelumnya, diindeks y + 1; sel di luar gambar bernilai 0
+    previous = np.zeros((height + 1, bpp), dtype=np.int16)
+    before = np.zeros_like(previous)
+    for d in range(height + width - 1):
+        y0, y1 = max(0, d - width + 1), min(height - 1, d) + 1
+        y = np.arange(y0, y1)
+        left, up, corner = previous[y0 + 1:y1 + 1], previous[y0:y1], before[y0:y1]
+        # Jarak prediktor Paeth p = left + up - corner ke masing-masing tetangga
+        pa, pb = np.abs(up - corner), np.abs(left - corner)
+        pc = np.abs(left + up - 2 * corner)
+        paeth = np.where((pa <= pb) & (pa <= pc), left, np.where(pb <= pc, up, corner))
+        kind = kinds[y0:y1]
+        predictor = np.select([kind == 0, kind == 1, kind == 2, kind == 3],
+                              [0, left, up, (left + up) >> 1], paeth)
+        current = np.zeros_like(previous)
+        current[y0 + 1:y1 + 1] = (pixels[y, d - y] + predictor) & 0xff
+        out[y, d - y] = current[y0 + 1:y1 + 1]
+        before, previous = previous, current
+    return out.reshape(height, row_bytes)
+
+
+def decode_png(data):
+    """Mendekode bytes PNG non-interlaced menjadi array RGBA (tinggi, lebar, 4) uint8, baris atas lebih dulu."""
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError("bukan file PNG")
+    offset = len(PNG_SIGNATURE)
+    header, palette, transparency, idat = None, None, None, []
+    while offset + 8 <= len(data):
+        length, tag = struct.unpack_from('>I4s', data, offset)
+        body = data[offset + 8:offset + 8 + length]
+        offset += 12 + length
+        if tag == b'IHDR':
+            header = struct.unpack('>IIBBBBB', body)
+        elif tag == b'PLTE':
+            palette = np.frombuffer(body, dtype=np.uint8).reshape(-1, 3)
+        elif tag == b'tRNS':
+            transparency = body
+        elif tag == b'IDAT':
+            idat.append(body)
+        elif tag == b'IEND':
+            break
+    if header is None:
+        raise ValueError("PNG tanpa header IHDR")
+    width, height, depth, color_type, _, _, interlace = header
+    if interlace:
+        raise ValueError("PNG interlaced tidak didukung (instal Pillow)")
+    if color_type not in PNG_CHANNELS or depth not in (1, 2, 4, 8, 16):
+        raise ValueError(f"format PNG tidak didukung (tipe warna {color_type}, {depth} bit)")
+    channels = PNG_CHANNELS[color_type]
+    bits = channels * depth
+    row_bytes = (width * bits + 7) // 8
+    try:
+        raw = zlib.decompress(b''.join(idat))
+    except zlib.error as e:
+        raise ValueError(f"data PNG rusak: {e}")
+    if len(raw) < height * (row_bytes + 1):
+        raise ValueError("data PNG terpotong")
+    rows = _unfilter(raw, height, row_bytes, max(1, bits // 8))
+
+    if depth == 16:
+        # Cukup byte tinggi setiap sampel (big-endian)
+        samples = rows.reshape(height, width, channels, 2)[..., 0]
+    elif depth == 8:
+        samples = rows.reshape(height, width, channels)
+    else:
+        unpacked = np.unpackbits(rows, axis=1)[:, :width * depth].reshape(height, width, depth)
+        samples = (unpacked @ (1 << np.arange(depth - 1, -1, -1))).astype(np.uint8)[..., None]
+        if color_type == 0:
+            samples = samples * np.uint8(255 // ((1 << depth) - 1))
+
+    rgba = np.full((height, width, 4), 255, dtype=np.uint8)
+    if color_type == 3:
+        if palette is None:
+            raise ValueError("PNG berpalet tanpa chunk PLTE")
+        index = samples[..., 0]
+        rgba[..., :3] = palette[np.minimum(index, len(palette) - 1)]
+        if transparency:
+            alpha = np.full(256, 255, dtype=np.uint8)
+            alpha[:len(transparency)] = np.frombuffer(transparency, dtype=np.uint8)[:256]
+            rgba[..., 3] = alpha[index]
+    elif channels <= 2:
+        rgba[..., :3] = samples[..., :1]
+        if channels == 2: rgba[..., 3] = samples[..., 1]
+    else:
+        rgba[..., :channels] = samples
+    return rgba
+
+
+def decode_ppm(data):
+    """Mendekode PPM (P6) atau PGM (P5) biner menjadi array RGBA, baris atas lebih dulu."""
+    fields, offset = [], 0
+    while len(fields) < 4:
+        while offset < len(data) and data[offset:offset + 1].isspace():
+            offset += 1
+        if data[offset:offset + 1] == b'#':
+            offset = data.index(b'\n', offset)
+            continue
+        end = offset
+        while end < len(data) and not data[end:end + 1].isspace():
+            end += 1
+        fields.append(data[offset:end])
+        offset = end
+    offset += 1  # satu karakter spasi setelah nilai maksimum
+    magic, width, height, maximum = fields[0], int(fields[1]), int(fields[2]), int(fields[3])
+    if magic not in (b'P5', b'P6'):
+        raise ValueError("hanya PPM/PGM biner (P6/P5) yang didukung")
+    channels = 3 if magic == b'P6' else 1
+    dtype = np.dtype('>u2') if maximum > 255 else np.uint8
+    samples = np.frombuffer(data, dtype=dtype, count=width * height * channels, offset=offset)
+    samples = (samples.astype(np.uint32) * 255 // maximum).astype(np.uint8).reshape(height, width, channels)
+    rgba = np.full((height, width, 4), 255, dtype=np.uint8)
+    rgba[..., :3] = samples
+    return rgba
+
+
+def decode_image(data):
+    """Mendekode bytes gambar (PNG, PPM/PGM, atau format Pillow) menjadi RGBA (tinggi, lebar, 4), baris atas lebih dulu."""
+    if data.startswith(PNG_SIGNATURE) and Image is None:
+        return decode_png(data)
+    if data[:2] in (b'P5', b'P6'):
+        return decode_ppm(data)
+    if Image is None:
+        raise ValueError("format gambar tidak didukung tanpa Pillow (hanya PNG dan PPM)")
+    return _decode_pillow(data)
+
+
+def _decode_pillow(data):
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            return np.asarray(image.convert("RGBA"), dtype=np.uint8)
+    except OSError as e:
+        raise ValueError(f"gambar tidak dapat dibaca: {e}")
+
+
+# =============================================================================
+# 3. MIPMAP DAN CACHE TEKSTUR
+# =============================================================================
+
+def mipmap_levels(image):
+    """Rantai mipmap lengkap (hingga 1x1) dari gambar RGBA; setiap level rata-rata kotak 2x2 level sebelumnya."""
+    levels = [np.ascontiguousarray(image)]
+    while levels[-1].shape[0] > 1 or levels[-1].shape[1] > 1:
+        level = levels[-1]
+        height, width = level.shape[:2]
+        # Ukuran level berikutnya max(1, n // 2) seperti yang diharapkan OpenGL; baris/kolom ganjil terakhir dilewati
+        block = level[:max(height // 2, 1) * 2 if height > 1 else 1, :max(width // 2, 1) * 2 if width > 1 else 1]
+        total = block.astype(np.uint16)
+        count = 1
+        if height > 1:
+            total = total[0::2] + total[1::2]; count *= 2
+        if width > 1:
+            total = total[:, 0::2] + total[:, 1::2]; count *= 2
+        levels.append(((total + count // 2) // count).astype(np.uint8))
+    return levels
+
+
+class TextureCache:
+    """Cache gambar tekstur hasil decode beserta mipmap-nya, dengan kunci hash isi file.
+
+    Dibatasi jumlah byte: gambar yang paling lama tidak dipakai dibuang lebih
+    dulu. Aman dipanggil dari thread pemuatan dan thread GL sekaligus.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # digest -> rantai mipmap
+        self.loaded_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def load(self, path):
+        """Mengembalikan (digest, levels) untuk file gambar; didekode hanya jika isinya belum ada di cache.
+
+        `levels` adalah rantai mipmap RGBA uint8 dengan baris paling bawah
+        lebih dulu (urutan baris tekstur OpenGL, sesuai koordinat v file .obj).
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha1(data).hexdigest()
+        with self.lock:
+            levels = self.entries.get(digest)
+            if levels is not None:
+                self.entries.move_to_end(digest)
+                self.hits += 1
+                return digest, levels
+        levels = mipmap_levels(decode_image(data)[::-1])
+        size = sum(level.nbytes for level in levels)
+        with self.lock:
+            self.misses += 1
+            if digest not in self.entries:
+                self.entries[digest] = levels
+                self.loaded_bytes += size
+                while self.loaded_bytes > self.max_bytes and len(self.entries) > 1:
+                    _, dropped = self.entries.popitem(last=False)
+                    self.loaded_bytes -= sum(level.nbytes for level in dropped)
+        return digest, levels
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.loaded_bytes = 0
@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+"""
+Validasi dan Statistik Mesh
+
+Deskripsi:
+Memeriksa model Modul_B_3D setelah diparse, sebelum geometrinya dipakai
+untuk menggambar. Semua pemeriksaan memakai operasi array NumPy atas
+seluruh face sekaligus (waktu linear, ditambah pengurutan), sehingga tetap
+selesai dalam hitungan detik untuk puluhan juta face:
+- indeks vertex/normal di luar jangkauan (face seperti ini akan membuat
+  build_vertex_array gagal di tengah frame);
+- face degenerate: kurang dari 3 sudut, vertex yang sama dipakai dua kali,
+  atau luasnya nol;
+- face duplikat: himpunan vertex sama dengan face sebelumnya;
+- edge non-manifold (dipakai lebih dari dua face) dan edge batas, dihitung
+  dari kunci edge yang diurutkan;
+- vertex dan normal yang tidak dirujuk face mana pun;
+- histogram ukuran face dan AABB.
+
+Laporan berupa dictionary yang dapat langsung ditulis sebagai JSON.
+clean_model membuang face berindeks rusak, dan opsional memadatkan model
+(membuang face degenerate/duplikat serta vertex dan normal yang tidak
+terpakai, lalu memetakan ulang indeksnya).
+
+Contoh:
+    python mesh_validate.py scan.obj --json laporan.json
+    python mesh_validate.py scan.obj --compact bersih.qmsh
+"""
+
+import sys
+import json
+import argparse
+
+from mesh_codec import ArrayRows, FaceRows, face_arrays, triangulate, load_compact, save_compact, EXTENSION
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: NumPy tidak terinstal.")
+    print("Silakan instal dengan perintah: pip install numpy")
+    sys.exit(1)
+
+# Face dengan luas <= AREA_EPSILON * (diagonal AABB)^2 dianggap berluas nol
+AREA_EPSILON = 1e-12
+# Segitiga per blok saat menghitung luas (membatasi memori sementara)
+AREA_BLOCK = 1 << 21
+
+
+# =============================================================================
+# 1. PEMERIKSAAN FACE DAN EDGE
+# =============================================================================
+
+def _face_rows(corner_v, starts, faces, size, face_count):
+    """Indeks vertex face berukuran `size` sebagai array (len(faces), size)."""
+    if len(faces) == face_count:
+        # Semua face berukuran sama (mis. mesh segitiga saja): cukup reshape
+        return corner_v.reshape(-1, size)
+    return corner_v[starts[faces, None] + np.arange(size)]
+
+
+def _face_areas(positions, sizes, corner_v, faces):
+    """Luas face `faces` (jumlah luas segitiga fan-nya) sebagai array per face."""
+    if len(faces) == len(sizes):
+        selected, corners = sizes, corner_v
+    else:
+        mask = np.zeros(len(sizes), dtype=bool)
+        mask[faces] = True
+        selected, corners = sizes[faces], corner_v[np.repeat(mask, sizes)]
+    v_ids, _ = triangulate(selected, corners, corners)
+    v_ids = v_ids.reshape(-1, 3)
+    owner = np.repeat(np.arange(len(faces)), selected - 2)
+    # Per komponen (array kontigu) agar gather dan cross product tidak membuat array (n, 3, 3)
+    axes = [np.ascontiguousarray(positions[:, k]) for k in range(3)]
+    areas = np.zeros(len(faces))
+    for start in range(0, len(owner), AREA_BLOCK):
+        ids = v_ids[start:start + AREA_BLOCK].T
+        edge1 = [axis[ids[1]] - axis[ids[0]] for axis in axes]
+        edge2 = [axis[ids[2]] - axis[ids[0]] for axis in axes]
+        cross_sq = sum((edge1[i] * edge2[j] - edge1[j] * edge2[i]) ** 2 for i, j in ((1, 2), (2, 0), (0, 1)))
+        # Segitiga fan berurutan per face, jadi blok ini hanya menyentuh rentang face [first, last]
+        block = owner[start:start + AREA_BLOCK]
+        first = block[0]
+        areas[first:block[-1] + 1] += np.bincount(block - first, weights=np.sqrt(cross_sq) / 2.0)
+    return areas
+
+
+def _edge_counts(vertex_count, sizes, corner_v, face_mask):
+    """Jumlah face per edge unik (tanpa arah) dari face yang dipilih `face_mask`."""
+    ends = np.cumsum(sizes)
+    following = np.arange(len(corner_v)) + 1
+    # Sudut terakhir setiap face tersambung kembali ke sudut pertamanya
+    nonempty = sizes > 0
+    following[ends[nonempty] - 1] = (ends - sizes)[nonempty]
+    a, b = corner_v, corner_v[following]
+    keep = np.repeat(face_mask, sizes) & (a != b)
+    low, high = np.minimum(a, b)[keep], np.maximum(a, b)[keep]
+    keys = np.sort(low * vertex_count + high)
+    if not len(keys):
+        return keys
+    first = np.flatnonzero(np.concatenate([[True], keys[1:] != keys[:-1]]))
+    return np.diff(np.append(first, len(keys)))
+
+
+def analyze(positions, normal_count, sizes, corner_v, corner_n):
+    """Memeriksa mesh dalam bentuk array; mengembalikan (laporan, mask).
+
+    `positions` berupa array (n, 3); face diberikan sebagai ukuran face dan
+    indeks vertex/normal per sudut (lihat mesh_codec.face_arrays), dengan
+    indeks normal -1 untuk sudut tanpa normal. `mask` berisi array bool per
+    face: "invalid" (indeks di luar jangkauan), "degenerate", dan
+    "duplicate" (kemunculan kedua dan seterusnya dari face yang sama).
+    """
+    vertex_count, face_count = len(positions), len(sizes)
+    ends = np.cumsum(sizes)
+    starts = ends - sizes
+    face_of = np.repeat(np.arange(face_count), sizes)
+
+    bad_vertex = np.zeros(face_count, dtype=bool)
+    bad_vertex[face_of[(corner_v < 0) | (corner_v >= vertex_count)]] = True
+    bad_normal = np.zeros(face_count, dtype=bool)
+    bad_normal[face_of[(corner_n < -1) | (corner_n >= normal_count)]] = True
+    invalid = bad_vertex | bad_normal
+
+    degenerate = sizes < 3
+    duplicate = np.zeros(face_count, dtype=bool)
+    for size in np.unique(sizes).tolist():
+        if size == 0: continue
+        faces = np.flatnonzero(sizes == size)
+        # Kolom ke-j = vertex terkecil ke-j setiap face
+        columns = np.sort(_face_rows(corner_v, starts, faces, size, face_count), axis=1).T.copy()
+        # Vertex yang sama muncul dua kali dalam satu face
+        repeated = np.zeros(len(faces), dtype=bool)
+        for j in range(size - 1):
+            repeated |= columns[j] == columns[j + 1]
+        degenerate[faces[repeated]] = True
+        # Baris terurut yang sama = himpunan vertex sama; lexsort stabil sehingga kemunculan pertama dipertahankan
+        order = np.lexsort(columns[::-1])
+        same = np.ones(len(faces) - 1, dtype=bool)
+        for column in columns:
+            column = column[order]
+            same &= column[1:] == column[:-1]
+        duplicate[faces[order[1:][same]]] = True
+
+    if vertex_count:
+        low, high = positions.min(axis=0), positions.max(axis=0)
+        check = np.flatnonzero(~invalid & ~degenerate)
+        if len(check):
+            limit = AREA_EPSILON * float(((high - low) ** 2).sum())
+            degenerate[check[_face_areas(positions, sizes, corner_v, check) <= limit]] = True
+    edge_counts = _edge_counts(vertex_count, sizes, corner_v, ~invalid & (sizes >= 3))
+
+    valid_corner = ~invalid[face_of]
+    vertex_refs = np.bincount(corner_v[valid_corner], minlength=vertex_count)
+    has_normal = valid_corner & (corner_n >= 0)
+    normal_refs = np.bincount(corner_n[has_normal], minlength=normal_count)
+
+    face_sizes, size_counts = np.unique(sizes, return_counts=True)
+    report = {
+        "vertices": vertex_count,
+        "normals": normal_count,
+        "faces": face_count,
+        "triangles": int(np.maximum(sizes - 2, 0).sum()),
+        "face_sizes": {str(size): count for size, count in zip(face_sizes.tolist(), size_counts.tolist())},
+        "faces_vertex_out_of_range": int(bad_vertex.sum()),
+        "faces_normal_out_of_range": int(bad_normal.sum()),
+        "degenerate_faces": int((degenerate & ~invalid).sum()),
+        "duplicate_faces": int((duplicate & ~invalid).sum()),
+        "edges": len(edge_counts),
+        "boundary_edges": int((edge_counts == 1).sum()),
+        "non_manifold_edges": int((edge_counts > 2).sum()),
+        "unreferenced_vertices": int((vertex_refs == 0).sum()),
+        "unreferenced_normals": int((normal_refs == 0).sum()),
+        "bounds": [low.tolist(), high.tolist()] if vertex_count else None,
+        "valid": not invalid.any(),
+    }
+    return report, {"invalid": invalid, "degenerate": degenerate, "duplicate": duplicate}
+
+
+def mesh_arrays(model):
+    """Posisi, jumlah normal, dan array face model untuk analyze."""
+    positions = np.asarray(model["vertices"], dtype=np.float64).reshape(-1, 3)
+    return (positions, len(model["normals"])) + face_arrays(model["faces"])
+
+
+def validate_model(model):
+    """Laporan validasi dan statistik dictionary model Modul_B_3D."""
+    return analyze(*mesh_arrays(model))[0]
+
+
+def summarize(report):
+    """Ringkasan masalah dalam laporan untuk pesan konsol; string kosong jika tidak ada masalah."""
+    labels = [
+        ("faces_vertex_out_of_range", "face dengan indeks vertex di luar jangkauan"),
+        ("faces_normal_out_of_range", "face dengan indeks normal di luar jangkauan"),
+        ("degenerate_faces", "face degenerate"),
+        ("duplicate_faces", "face duplikat"),
+        ("non_manifold_edges", "edge non-manifold"),
+        ("unreferenced_vertices", "vertex tidak terpakai"),
+    ]
+    return ", ".join(f"{report[key]} {label}" for key, label in labels if report[key])
+
+
+# =============================================================================
+# 2. PEMBERSIHAN DAN PEMADATAN
+# =============================================================================
+
+def _remove_unused(rows, ids):
+    """Membuang baris `rows` yang tidak dirujuk `ids` dan memetakan ulang `ids` (-1 tetap -1)."""
+    if not len(rows) or not (ids >= 0).any():
+        # Mis. model tanpa normal: tidak ada baris yang dirujuk
+        return rows[:0], np.full(len(ids), -1, dtype=np.int64)
+    used = np.zeros(len(rows), dtype=bool)
+    used[ids[ids >= 0]] = True
+    remap = np.cumsum(used) - 1
+    return rows[used], np.where(ids >= 0, remap[np.maximum(ids, 0)], -1)
+
+
+def clean_model(model, compact=False, mask=None, arrays=None):
+    """Model baru tanpa face berindeks di luar jangkauan.
+
+    Dengan `compact=True`, face degenerate dan duplikat juga dibuang, lalu
+    vertex dan normal yang tidak lagi dirujuk dihapus dan indeks face
+    dipetakan ulang. `mask` dan `arrays` (hasil analyze dan mesh_arrays)
+    dapat diberikan agar mesh tidak diperiksa dua kali. Model hasilnya
+    belum dipusatkan. Koordinat tekstur dan material per face (jika ada)
+    ikut disaring dengan cara yang sama.
+    """
+    positions, _, sizes, corner_v, corner_n = arrays or mesh_arrays(model)
+    normals = np.asarray(model["normals"], dtype=np.float64).reshape(-1, 3)
+    if mask is None:
+        mask = analyze(positions, len(normals), sizes, corner_v, corner_n)[1]
+    drop = mask["invalid"] | (mask["degenerate"] | mask["duplicate"] if compact else False)
+    keep = np.repeat(~drop, sizes)
+    sizes, corner_v, corner_n = sizes[~drop], corner_v[keep], corner_n[keep]
+    if compact:
+        positions, corner_v = _remove_unused(positions, corner_v)
+        normals, corner_n = _remove_unused(normals, corner_n)
+    cleaned = {"vertices": ArrayRows(positions), "normals": ArrayRows(normals),
+               "faces": FaceRows(sizes, corner_v, corner_n)}
+    if "corner_t" in model:
+        texcoords, corner_t = model["texcoords"], model["corner_t"][keep]
+        corner_t = np.where(corner_t < len(texcoords), corner_t, -1)
+        if compact:
+            texcoords, corner_t = _remove_unused(texcoords, corner_t)
+        cleaned["texcoords"], cleaned["corner_t"] = texcoords, corner_t
+    if "face_materials" in model:
+        cleaned["face_materials"] = model["face_materials"][~drop]
+        cleaned["materials"] = model["materials"]
+    return cleaned
+
+
+# =============================================================================
+# 3. FUNGSI MAIN
+# =============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validasi dan statistik mesh .obj/.qmsh")
+    parser.add_argument("input", help="file .obj atau .qmsh")
+    parser.add_argument("--json", metavar="FILE", help="tulis laporan lengkap ke file JSON")
+    parser.add_argument("--compact", metavar="OUTPUT",
+                        help="tulis model yang sudah dipadatkan ke .obj/.qmsh")
+    args = parser.parse_args(argv)
+
+    # Parser dan exporter .obj milik aplikasi 3D dipakai agar hasilnya identik
+    import Modul_B_3D
+    Modul_B_3D.headless = True
+    try:
+        if args.input.lower().endswith(EXTENSION):
+            model = load_compact(args.input)
+        else:
+            model = Modul_B_3D.parse_obj(args.input)
+        arrays = mesh_arrays(model)
+        report, mask = analyze(*arrays)
+        if args.json:
+            with open(args.json, 'w') as f:
+                json.dump(report, f, indent=2)
+        if args.compact:
+            compacted = clean_model(model, compact=True, mask=mask, arrays=arrays)
+            compacted["center"] = model.get("center", (0.0, 0.0, 0.0))
+            if args.compact.lower().endswith(EXTENSION):
+                save_compact(compacted, args.compact)
+            else:
+                Modul_B_3D.export_obj(args.compact, compacted)
+    except (OSError, ValueError, IndexError) as e:
+        print(f"Error: Gagal memeriksa '{args.input}': {e}")
+        sys.exit(1)
+
+    print(f"{report['vertices']} vertices, {report['normals']} normals, {report['faces']} faces "
+          f"({report['triangles']} segitiga), ukuran face: {report['face_sizes']}")
+    print(f"{report['edges']} edge, {report['boundary_edges']} edge batas")
+    print(f"Masalah: {summarize(report) or 'tidak ada'}")
+    # Kode keluar 1 jika ada indeks di luar jangkauan (model tidak dapat digambar apa adanya)
+    if not report["valid"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,573 @@
+# -*- coding: utf-8 -*-
+"""
+Penyimpanan Objek 2D Berbasis Kolom (Struct-of-Arrays)
+
+Deskripsi:
+Objek scene 2D tidak disimpan sebagai dictionary per objek, tetapi sebagai
+kolom NumPy: kode tipe, warna, ketebalan, translate/rotate/scale, serta
+offset dan jumlah vertex setiap objek di satu buffer vertex float64 yang
+tumbuh otomatis. Operasi atas seluruh scene menjadi kernel array tanpa loop
+Python per objek:
+- refresh AABB (hanya baris yang berubah sejak terakhir dihitung),
+- klasifikasi "sepenuhnya di dalam clipping window",
+- seleksi marquee (irisan AABB dengan kotak),
+- translasi/rotasi/skala banyak objek sekaligus, masing-masing di sekitar
+  pusatnya sendiri atau sebagai satu grup di sekitar pivot bersama,
+- "bake": melipat transformasi ke data vertex untuk banyak objek sekaligus.
+
+Indeks store menghasilkan ObjectView, view mirip dictionary dengan kunci
+'type', 'vertices', 'color', 'thickness', dan 'transform' yang sama dengan
+format objek lama, sehingga kode yang membaca atau mengubah objek satu per
+satu tetap berjalan. Perubahan lewat view langsung ditulis ke kolom. View
+menunjuk ke indeks, jadi tidak boleh disimpan melewati penghapusan objek.
+
+Contoh:
+    store = ObjectStore()
+    store.append({'type': 'line', 'vertices': [(0, 0), (100, 50)], 'color': (0, 0, 0),
+                  'thickness': 1.0})
+    store.translate([0], 10, 0)
+    store[0]['transform']['rotate'] += 45
+    store.aabb()      # array (n, 4): xmin, ymin, xmax, ymax
+"""
+
+import sys
+from itertools import chain
+from collections.abc import MutableMapping, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: NumPy tidak terinstal.")
+    print("Silakan instal dengan perintah: pip install numpy")
+    sys.exit(1)
+
+TYPE_NAMES = ('point', 'line', 'rectangle', 'ellipse', 'freehand')
+TYPE_CODES = {name: code for code, name in enumerate(TYPE_NAMES)}
+ELLIPSE = TYPE_CODES['ellipse']
+RECTANGLE = TYPE_CODES['rectangle']
+# Tipe yang pusat transformasinya vertex pertama (lainnya: rata-rata vertex)
+FIRST_VERTEX_CENTER = (TYPE_CODES['point'], TYPE_CODES['ellipse'], TYPE_CODES['freehand'])
+
+# Kolom per objek: nama -> (dtype, bentuk per baris)
+COLUMNS = {
+    'type': (np.int8, ()),
+    'color': (np.float64, (3,)),
+    'thickness': (np.float64, ()),
+    'translate': (np.float64, (2,)),
+    'rotate': (np.float64, ()),
+    'scale': (np.float64, (2,)),
+    'offset': (np.int64, ()),   # awal vertex objek di buffer vertex
+    'count': (np.int64, ()),    # jumlah vertex objek
+    # Cache turunan, dihitung ulang oleh refresh() untuk baris yang 'dirty'
+    'center': (np.float64, (2,)),
+    'aabb': (np.float64, (4,)),
+    'bounds': (np.float64, (4,)),
+    'dirty': (np.bool_, ()),
+}
+
+MIN_CAPACITY = 64
+
+
+def stroke_margin(thickness):
+    """Jarak tambahan di sekitar geometri yang ikut tergambar (setengah ukuran titik + antialias)."""
+    return thickness * 2.5 + 1.0
+
+
+def _segments(offsets, counts):
+    """Indeks buffer semua vertex objek-objek (berurutan per objek) dan awal setiap objek di hasilnya."""
+    starts = np.cumsum(counts) - counts
+    return np.repeat(offsets - starts, counts) + np.arange(int(counts.sum())), starts
+
+
+# =============================================================================
+# 1. VIEW MIRIP DICTIONARY
+# =============================================================================
+
+class _PairView(Sequence):
+    """Kolom dua nilai satu objek (translate atau scale) yang dapat diubah per elemen."""
+
+    def __init__(self, store, name, index):
+        self._store, self._name, self._index = store, name, index
+
+    def __len__(self):
+        return 2
+
+    def __getitem__(self, i):
+        return float(self._store._columns[self._name][self._index][i])
+
+    def __setitem__(self, i, value):
+        self._store._columns[self._name][self._index, i] = value
+        self._store._columns['dirty'][self._index] = True
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+
+class TransformView(MutableMapping):
+    """Dictionary transformasi ('translate', 'rotate', 'scale') satu objek di store."""
+
+    KEYS = ('translate', 'rotate', 'scale')
+
+    def __init__(self, store, index):
+        self._store, self._index = store, index
+
+    def __getitem__(self, key):
+        if key == 'rotate':
+            return float(self._store._columns['rotate'][self._index])
+        if key in self.KEYS:
+            return _PairView(self._store, key, self._index)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        self._store._columns[key][self._index] = value
+        self._store._columns['dirty'][self._index] = True
+
+    def __delitem__(self, key):
+        raise TypeError("kunci transformasi tidak dapat dihapus")
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+
+class ObjectView(MutableMapping):
+    """Objek ke-`index` di store dengan antarmuka dictionary objek lama.
+
+    'vertices' dibaca sebagai list tuple baru (salinan); mengubah vertex
+    dilakukan dengan memberi nilai baru ke 'vertices' atau lewat
+    ObjectStore.append_vertex.
+    """
+
+    KEYS = ('type', 'vertices', 'color', 'thickness', 'transform')
+
+    def __init__(self, store, index):
+        self._store, self._index = store, index
+
+    @property
+    def index(self):
+        return self._index
+
+    def __getitem__(self, key):
+        store, i = self._store, self._index
+        if key == 'type':
+            return TYPE_NAMES[store._columns['type'][i]]
+        if key == 'vertices':
+            return list(map(tuple, store.vertices(i).tolist()))
+        if key == 'color':
+            return tuple(store._columns['color'][i].tolist())
+        if key == 'thickness':
+            return float(store._columns['thickness'][i])
+        if key == 'transform':
+            return TransformView(store, i)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        store, i = self._store, self._index
+        if key == 'type':
+            store._columns['type'][i] = TYPE_CODES[value]
+        elif key == 'vertices':
+            store.set_vertices(i, value)
+        elif key in ('color', 'thickness'):
+            store._columns[key][i] = value
+        elif key == 'transform':
+            for name in TransformView.KEYS:
+                store._columns[name][i] = value[name]
+        else:
+            raise KeyError(key)
+        store._columns['dirty'][i] = True
+
+    def __delitem__(self, key):
+        raise TypeError("kunci objek tidak dapat dihapus")
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+
+# =============================================================================
+# 2. STORE KOLOM
+# =============================================================================
+
+class ObjectStore:
+    """Daftar objek 2D yang disimpan per kolom; diindeks seperti list, menghasilkan ObjectView."""
+
+    def __init__(self):
+        self._count = 0
+        self._columns = {name: np.zeros((0,) + shape, dtype=dtype) for name, (dtype, shape) in COLUMNS.items()}
+        self._vertices = np.zeros((0, 2))
+        self._vertex_end = 0   # posisi akhir data di buffer vertex
+        self._garbage = 0      # vertex di buffer yang tidak lagi dipakai objek mana pun
+
+    # --- Protokol list ---
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [ObjectView(self, i) for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("indeks objek di luar jangkauan")
+        return ObjectView(self, index)
+
+    def __iter__(self):
+        return (ObjectView(self, i) for i in range(self._count))
+
+    def column(self, name):
+        """Kolom `name` untuk semua objek (view array NumPy; jangan diubah langsung)."""
+        return self._columns[name][:self._count]
+
+    # --- Kapasitas ---
+
+    def _reserve(self, count):
+        capacity = len(self._columns['type'])
+        if count <= capacity: return
+        capacity = max(count, capacity * 2, MIN_CAPACITY)
+        for name, column in self._columns.items():
+            grown = np.zeros((capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[:self._count] = column[:self._count]
+            self._columns[name] = grown
+
+    def _reserve_vertices(self, count):
+        if count <= len(self._vertices): return
+        grown = np.zeros((max(count, len(self._vertices) * 2, MIN_CAPACITY), 2))
+        grown[:self._vertex_end] = self._vertices[:self._vertex_end]
+        self._vertices = grown
+
+    def _write_vertices(self, vertices):
+        """Menulis vertex (k, 2) di akhir buffer; mengembalikan offset-nya."""
+        offset = self._vertex_end
+        self._reserve_vertices(offset + len(vertices))
+        self._vertices[offset:offset + len(vertices)] = vertices
+        self._vertex_end += len(vertices)
+        return offset
+
+    def _compact_vertices(self):
+        """Menyusun ulang buffer vertex sesuai urutan objek jika lebih dari separuhnya sampah."""
+        if self._garbage <= max(1024, self._vertex_end // 2): return
+        offsets, counts = self.column('offset'), self.column('count')
+        index, starts = _segments(offsets, counts)
+        self._vertices = self._vertices[index].copy()
+        self._vertex_end = len(self._vertices)
+        self._columns['offset'][:self._count] = starts
+        self._garbage = 0
+
+    # --- Menambah, mengubah, dan menghapus objek ---
+
+    def extend(self, objects):
+        """Menambahkan banyak objek berformat dictionary sekaligus.
+
+        Melempar ValueError jika ada objek yang tidak valid; dalam hal itu
+        tidak ada objek yang ditambahkan.
+        """
+        objects = list(objects)
+        if not objects: return
+        try:
+            codes = [TYPE_CODES[obj['type']] for obj in objects]
+            counts = np.fromiter((len(obj['vertices']) for obj in objects), dtype=np.int64, count=len(objects))
+            flat = chain.from_iterable(chain.from_iterable(obj['vertices'] for obj in objects))
+            vertices = np.fromiter(flat, dtype=np.float64, count=2 * int(counts.sum())).reshape(-1, 2)
+            transforms = [obj.get('transform') or {} for obj in objects]
+            rows = {
+                'type': codes,
+                'color': np.array([obj['color'] for obj in objects], dtype=np.float64),
+                'thickness': np.array([obj['thickness'] for obj in objects], dtype=np.float64),
+                'translate': np.array([tr.get('translate', (0.0, 0.0)) for tr in transforms], dtype=np.float64),
+                'rotate': np.array([tr.get('rotate', 0.0) for tr in transforms], dtype=np.float64),
+                'scale': np.array([tr.get('scale', (1.0, 1.0)) for tr in transforms], dtype=np.float64),
+            }
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"objek tidak valid: {e}")
+
+        first, last = self._count, self._count + len(objects)
+        self._reserve(last)
+        columns = self._columns
+        for name, values in rows.items():
+            columns[name][first:last] = values
+        columns['count'][first:last] = counts
+        columns['offset'][first:last] = self._write_vertices(vertices) + np.cumsum(counts) - counts
+        columns['dirty'][first:last] = True
+        self._count = last
+
+    def append(self, obj):
+        """Menambahkan satu objek berformat dictionary; mengembalikan indeksnya."""
+        self.extend([obj])
+        return self._count - 1
+
+    def vertices(self, index):
+        """Vertex lokal objek sebagai array (k, 2) (view ke buffer; jangan diubah langsung)."""
+        offset, count = self._columns['offset'][index], self._columns['count'][index]
+        return self._vertices[offset:offset + count]
+
+    def nth_vertices(self, indices, k):
+        """Vertex lokal ke-`k` dari setiap objek `indices` (semuanya harus punya lebih dari `k` vertex)."""
+        return self._vertices[self._columns['offset'][indices] + k]
+
+    def set_vertices(self, index, vertices):
+        """Mengganti seluruh vertex objek `index`."""
+        vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+        self._garbage += int(self._columns['count'][index])
+        self._columns['offset'][index] = self._write_vertices(vertices)
+        self._columns['count'][index] = len(vertices)
+        self._columns['dirty'][index] = True
+        self._compact_vertices()
+
+    def append_vertex(self, index, vertex):
+        """Menambahkan satu vertex ke objek (mis. goresan freehand)."""
+        offset, count = int(self._columns['offset'][index]), int(self._columns['count'][index])
+        if offset + count != self._vertex_end:
+            # Vertex objek bukan yang terakhir di buffer: pindahkan ke akhir lebih dulu
+            self._garbage += count
+            offset = self._write_vertices(self._vertices[offset:offset + count].copy())
+            self._columns['offset'][index] = offset
+        self._write_vertices(np.asarray([vertex], dtype=np.float64))
+        self._columns['count'][index] = count + 1
+        self._columns['dirty'][index] = True
+        self._compact_vertices()
+
+    def delete(self, indices):
+        """Menghapus objek `indices`; objek sesudahnya bergeser seperti pada list."""
+        keep = np.ones(self._count, dtype=bool)
+        keep[np.asarray(list(indices), dtype=np.int64)] = False
+        self._garbage += int(self.column('count')[~keep].sum())
+        remaining = int(keep.sum())
+        for column in self._columns.values():
+            column[:remaining] = column[:self._count][keep]
+        self._count = remaining
+        self._compact_vertices()
+
+    def clear(self):
+        self._count = 0
+        self._vertex_end = 0
+        self._garbage = 0
+
+    def to_dict(self, index):
+        """Salinan objek `index` sebagai dictionary biasa (untuk clipboard dan file scene)."""
+        columns = self._columns
+        return {
+            'type': TYPE_NAMES[columns['type'][index]],
+            'vertices': list(map(tuple, self.vertices(index).tolist())),
+            'color': tuple(columns['color'][index].tolist()),
+            'thickness': float(columns['thickness'][index]),
+            'transform': {'translate': columns['translate'][index].tolist(),
+                          'rotate': float(columns['rotate'][index]),
+                          'scale': columns['scale'][index].tolist()},
+        }
+
+    def to_dicts(self):
+        return [self.to_dict(i) for i in range(self._count)]
+
+    # --- Kernel seluruh scene ---
+
+    def refresh(self):
+        """Menghitung ulang pusat, AABB, dan bounds untuk objek yang berubah sejak refresh terakhir.
+
+        Semantiknya sama dengan get_object_center, get_object_aabb, dan
+        get_object_bounds di engine_2d, tetapi dihitung untuk semua baris
+        'dirty' sekaligus.
+        """
+        columns = self._columns
+        dirty = np.flatnonzero(columns['dirty'][:self._count])
+        if not len(dirty): return
+        columns['dirty'][dirty] = False
+        counts = columns['count'][dirty]
+        empty = dirty[counts == 0]
+        columns['center'][empty] = 0.0
+        columns['aabb'][empty] = np.nan
+        columns['bounds'][empty] = np.nan
+        rows = dirty[counts > 0]
+        if not len(rows): return
+
+        types, offsets, counts = columns['type'][rows], columns['offset'][rows], columns['count'][rows]
+        center = self._vertices[offsets].copy()
+        averaged = ~np.isin(types, FIRST_VERTEX_CENTER)
+        if averaged.any():
+            index, starts = _segments(offsets[averaged], counts[averaged])
+            center[averaged] = np.add.reduceat(self._vertices[index], starts, axis=0) / counts[averaged, None]
+        columns['center'][rows] = center
+
+        angle = np.radians(columns['rotate'][rows])
+        params = (center, columns['scale'][rows], np.cos(angle), np.sin(angle), columns['translate'][rows])
+        margin = stroke_margin(columns['thickness'][rows])[:, None]
+
+        # Elips dan persegi diwakili 4 titik; tipe lain memakai semua vertex-nya
+        boxed = (types == ELLIPSE) | (types == RECTANGLE)
+        general = np.flatnonzero(~boxed)
+        if len(general):
+            index, starts = _segments(offsets[general], counts[general])
+            points = _transform(self._vertices[index], np.repeat(general, counts[general]), params)
+            low = np.minimum.reduceat(points, starts, axis=0)
+            high = np.maximum.reduceat(points, starts, axis=0)
+            box = np.hstack([low, high])
+            columns['aabb'][rows[general]] = box
+            columns['bounds'][rows[general]] = box + margin[general] * [-1, -1, 1, 1]
+        boxed = np.flatnonzero(boxed)
+        if len(boxed):
+            first = self._vertices[offsets[boxed]]
+            second = self._vertices[offsets[boxed] + 1]
+            ellipse = (types[boxed] == ELLIPSE)[:, None, None]
+            # Elips: pusat dan jari-jari; AABB memakai 4 titik ekstrem, bounds 4 sudut persegi pembatasnya.
+            # Persegi: keempat sudut dari dua sudut diagonal untuk keduanya.
+            radius = np.abs(second - first)[:, None, :]
+            extreme = first[:, None, :] + radius * [(1, 0), (-1, 0), (0, 1), (0, -1)]
+            corner = first[:, None, :] + radius * [(-1, -1), (1, -1), (1, 1), (-1, 1)]
+            rectangle = np.stack([first, np.column_stack([second[:, 0], first[:, 1]]),
+                                  second, np.column_stack([first[:, 0], second[:, 1]])], axis=1)
+            owner = np.repeat(boxed, 4)
+            for column, points in (('aabb', extreme), ('bounds', corner)):
+                points = np.where(ellipse, points, rectangle).reshape(-1, 2)
+                points = _transform(points, owner, params).reshape(-1, 4, 2)
+                # Min/max 4 titik berpasangan; jauh lebih cepat daripada reduksi sumbu sepanjang 4
+                p0, p1, p2, p3 = points[:, 0], points[:, 1], points[:, 2], points[:, 3]
+                box = np.hstack([np.minimum(np.minimum(p0, p1), np.minimum(p2, p3)),
+                                 np.maximum(np.maximum(p0, p1), np.maximum(p2, p3))])
+                if column == 'bounds':
+                    box += margin[boxed] * [-1, -1, 1, 1]
+                columns[column][rows[boxed]] = box
+
+    def centers(self):
+        """Pusat transformasi lokal setiap objek, array (n, 2)."""
+        self.refresh()
+        return self.column('center')
+
+    def aabb(self):
+        """AABB dunia setiap objek, array (n, 4); NaN untuk objek tanpa vertex."""
+        self.refresh()
+        return self.column('aabb')
+
+    def bounds(self):
+        """AABB area piksel yang digambar setiap objek (termasuk ketebalan), array (n, 4)."""
+        self.refresh()
+        return self.column('bounds')
+
+    def inside_window(self, window):
+        """Mask objek yang AABB-nya sepenuhnya di dalam window {'xmin', 'ymin', 'xmax', 'ymax'}."""
+        box = self.aabb()
+        return ((window['xmin'] <= box[:, 0]) & (box[:, 2] <= window['xmax']) &
+                (window['ymin'] <= box[:, 1]) & (box[:, 3] <= window['ymax']))
+
+    def in_box(self, xmin, ymin, xmax, ymax, bounds=False, pad=0.0):
+        """Indeks objek yang AABB-nya (atau bounds-nya) beririsan dengan kotak.
+
+        `pad` (skalar atau array per objek) memperlebar kotak setiap objek.
+        """
+        box = self.bounds() if bounds else self.aabb()
+        hit = ~((xmax < box[:, 0] - pad) | (xmin > box[:, 2] + pad) |
+                (ymax < box[:, 1] - pad) | (ymin > box[:, 3] + pad))
+        return np.flatnonzero(hit & ~np.isnan(box[:, 0]))
+
+    def union_bounds(self, indices, bounds=True):
+        """Gabungan bounds (atau AABB jika `bounds` False) objek `indices` sebagai tuple, atau None jika kosong."""
+        box = (self.bounds() if bounds else self.aabb())[np.asarray(list(indices), dtype=np.int64)]
+        box = box[~np.isnan(box[:, 0])]
+        if not len(box): return None
+        return (float(box[:, 0].min()), float(box[:, 1].min()), float(box[:, 2].max()), float(box[:, 3].max()))
+
+    # Kernel transformasi: `indices` tidak boleh berisi indeks yang sama dua kali (seperti seleksi canvas)
+
+    def translate(self, indices, dx, dy):
+        """Menggeser objek `indices`; AABB dan bounds yang sudah dihitung ikut digeser tanpa refresh."""
+        indices = np.asarray(indices, dtype=np.int64)
+        columns = self._columns
+        columns['translate'][indices] += (dx, dy)
+        columns['aabb'][indices] += (dx, dy, dx, dy)
+        columns['bounds'][indices] += (dx, dy, dx, dy)
+
+    def rotate(self, indices, degrees):
+        indices = np.asarray(indices, dtype=np.int64)
+        self._columns['rotate'][indices] += degrees
+        self._columns['dirty'][indices] = True
+
+    def scale(self, indices, factor):
+        indices = np.asarray(indices, dtype=np.int64)
+        if factor > 0:
+            self._scale_boxes(indices, self.world_centers(indices), factor)
+        else:
+            self._columns['dirty'][indices] = True
+        self._columns['scale'][indices] *= factor
+
+    def _scale_boxes(self, indices, origin, factor):
+        """Menskalakan AABB dan bounds yang sudah dihitung di sekitar `origin` tanpa refresh.
+
+        Tepat untuk skala seragam positif: kotak hasil transformasi ikut
+        terskala, sedangkan margin ketebalan garis tetap.
+        """
+        columns = self._columns
+        origin = np.tile(origin, 2)
+        margin = stroke_margin(columns['thickness'][indices])[:, None] * [-1, -1, 1, 1]
+        columns['aabb'][indices] = (columns['aabb'][indices] - origin) * factor + origin
+        columns['bounds'][indices] = (columns['bounds'][indices] - margin - origin) * factor + origin + margin
+
+    def world_centers(self, indices):
+        """Pusat transformasi objek `indices` dalam koordinat dunia, array (k, 2)."""
+        indices = np.asarray(indices, dtype=np.int64)
+        return self.centers()[indices] + self.column('translate')[indices]
+
+    def transform_about(self, indices, pivot, degrees=0.0, factor=1.0):
+        """Memutar `degrees` dan menskalakan seragam `factor` objek `indices` sebagai satu grup di sekitar `pivot`.
+
+        Rotasi dan skala seragam grup sama dengan menambah rotasi dan
+        mengalikan skala setiap objek, lalu memindahkan pusat dunianya dengan
+        matriks grup: satu perkalian matriks 2x2 untuk semua objek.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        columns = self._columns
+        angle = np.radians(degrees)
+        matrix = factor * np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+        center = self.centers()[indices]
+        world = center + columns['translate'][indices]
+        columns['translate'][indices] = (world - pivot) @ matrix.T + pivot - center
+        if degrees or factor <= 0:
+            columns['dirty'][indices] = True
+        else:
+            self._scale_boxes(indices, pivot, factor)
+        columns['rotate'][indices] += degrees
+        columns['scale'][indices] *= factor
+
+    def bake(self, indices):
+        """Melipat transformasi objek `indices` ke vertex lokalnya; tampilan objek tidak berubah.
+
+        Titik, garis, dan freehand kembali ke transformasi identitas. Persegi
+        dan elips disimpan sebagai dua titik sejajar sumbu, sehingga hanya
+        skala dan translasinya yang dilipat; rotasinya tetap di kolom rotate.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        columns = self._columns
+        indices = indices[columns['count'][indices] > 0]
+        if not len(indices): return
+        center = self.centers()[indices]
+        offsets, counts = columns['offset'][indices], columns['count'][indices]
+        index, _ = _segments(offsets, counts)
+        owner = np.repeat(np.arange(len(indices)), counts)
+        types = columns['type'][indices]
+        boxed = (types == ELLIPSE) | (types == RECTANGLE)
+        # Objek persegi/elips dilipat dengan rotasi 0
+        angle = np.where(boxed, 0.0, np.radians(columns['rotate'][indices]))
+        params = (center, columns['scale'][indices], np.cos(angle), np.sin(angle), columns['translate'][indices])
+        self._vertices[index] = _transform(self._vertices[index], owner, params)
+        columns['translate'][indices] = 0.0
+        columns['scale'][indices] = 1.0
+        columns['rotate'][indices[~boxed]] = 0.0
+        columns['dirty'][indices] = True
+
+
+def _transform(points, owner, params):
+    """Menerapkan transformasi objek `owner` (skala, rotasi di sekitar pusat, translasi) ke titik lokal."""
+    center, scale, cos_a, sin_a, translate = params
+    c = center[owner]
+    vx = (points[:, 0] - c[:, 0]) * scale[owner, 0]
+    vy = (points[:, 1] - c[:, 1]) * scale[owner, 1]
+    x = vx * cos_a[owner] - vy * sin_a[owner] + c[:, 0] + translate[owner, 0]
+    y = vx * sin_a[owner] + vy * cos_a[owner] + c[:, 1] + translate[owner, 1]
+    return np.stack([x, y], axis=1)
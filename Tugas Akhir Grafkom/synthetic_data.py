@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+Generator Data Sintetis untuk Pengujian Skala Besar
+
+Deskripsi:
+Modul ini membuat data uji berukuran realistis untuk kedua aplikasi:
+- Scene 2D acak (campuran titik, garis, persegi, elips, dan freehand dengan
+  transformasi acak) dalam format scene .json Modul_A_2D.
+- Mesh .obj besar: bola hasil subdivisi kubus (cube-sphere) dan grid
+  permukaan. File ditulis per blok baris sehingga mesh dengan puluhan juta
+  face dapat dibuat tanpa menampung seluruh mesh di memori.
+
+Contoh:
+    python synthetic_data.py scene2d 100000 scene_besar.json
+    python synthetic_data.py sphere 1000 bola.obj      # 6 * 1000^2 face quad
+    python synthetic_data.py grid 3000 grid.obj --triangles
+"""
+
+import sys
+import json
+import random
+import argparse
+from math import pi
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: NumPy tidak terinstal.")
+    print("Silakan instal dengan perintah: pip install numpy")
+    sys.exit(1)
+
+# Tipe objek 2D dan bobot kemunculannya di scene acak
+OBJECT_TYPES = ['point', 'line', 'rectangle', 'ellipse', 'freehand']
+OBJECT_WEIGHTS = [2, 4, 3, 2, 1]
+
+# Jumlah baris grid yang ditulis per blok saat membuat file .obj
+ROWS_PER_BLOCK = 64
+
+
+# =============================================================================
+# 1. SCENE 2D
+# =============================================================================
+
+def generate_2d_scene(count, seed=0, width=1280, height=720, freehand_points=50):
+    """Membuat daftar objek 2D acak dengan format dictionary Modul_A_2D."""
+    rng = random.Random(seed)
+    objects = []
+    for _ in range(count):
+        obj_type = rng.choices(OBJECT_TYPES, OBJECT_WEIGHTS)[0]
+        x, y = rng.uniform(0, width), rng.uniform(0, height)
+        if obj_type == 'point':
+            vertices = [(x, y)]
+        elif obj_type == 'freehand':
+            vertices = [(x, y)]
+            for _ in range(freehand_points - 1):
+                x += rng.uniform(-8, 8); y += rng.uniform(-8, 8)
+                vertices.append((x, y))
+        else:
+            vertices = [(x, y), (x + rng.uniform(-150, 150), y + rng.uniform(-150, 150))]
+        objects.append({
+            'type': obj_type,
+            'vertices': vertices,
+            'color': (rng.random(), rng.random(), rng.random()),
+            'thickness': rng.choice([1.0, 1.5, 2.0, 3.0]),
+            'transform': {
+                'translate': [rng.uniform(-50, 50), rng.uniform(-50, 50)],
+                'rotate': rng.uniform(0, 360),
+                'scale': [rng.uniform(0.5, 2.0), rng.uniform(0.5, 2.0)],
+            },
+        })
+    return objects
+
+
+def write_2d_scene(filename, objects):
+    """Menyimpan objek ke file scene .json yang dapat dimuat Modul_A_2D."""
+    with open(filename, 'w') as f:
+        json.dump({'objects': objects}, f)
+
+
+# =============================================================================
+# 2. MESH 3D
+# =============================================================================
+
+def _write_block(f, prefix, values, fmt):
+    """Menulis blok array sebagai baris .obj dengan prefix (v, vn, f)."""
+    # Satu operasi format untuk seluruh blok jauh lebih cepat daripada per baris
+    if len(values):
+        f.write((f"{prefix} {fmt}\n" * len(values)) % tuple(values.ravel().tolist()))
+
+
+def write_sphere_obj(filename, n, radius=1.0):
+    """Menulis bola cube-sphere: 6 sisi kubus, masing-masing grid n x n quad.
+
+    Total 6 * n^2 face dan 6 * (n+1)^2 vertex (vertex di tepi sisi tidak
+    digabung). Normal vertex sama dengan posisinya yang dinormalisasi.
+    """
+    # Setiap sisi kubus: (sumbu tetap, tanda, sumbu u, sumbu v)
+    sides = [(0, 1, 1, 2), (0, -1, 2, 1), (1, 1, 2, 0), (1, -1, 0, 2), (2, 1, 0, 1), (2, -1, 1, 0)]
+    ticks = np.linspace(-1.0, 1.0, n + 1)
+    with open(filename, 'w') as f:
+        f.write(f"# Bola cube-sphere sintetis, n = {n}\n")
+        f.write(f"# Vertices: {6 * (n + 1) ** 2}\n# Faces: {6 * n * n}\n")
+        for axis, sign, u_axis, v_axis in sides:
+            for start in range(0, n + 1, ROWS_PER_BLOCK):
+                rows = ticks[start:start + ROWS_PER_BLOCK]
+                points = np.empty((len(rows), n + 1, 3))
+                points[..., axis] = sign
+                points[..., u_axis] = rows[:, None]
+                points[..., v_axis] = ticks[None, :]
+                points = points.reshape(-1, 3)
+                normals = points / np.linalg.norm(points, axis=1, keepdims=True)
+                _write_block(f, 'v', normals * radius, '%.6f %.6f %.6f')
+                _write_block(f, 'vn', normals, '%.6f %.6f %.6f')
+
+        for side in range(6):
+            base = side * (n + 1) ** 2 + 1
+            for start in range(0, n, ROWS_PER_BLOCK):
+                rows = np.arange(start, min(start + ROWS_PER_BLOCK, n))
+                a = (base + rows[:, None] * (n + 1) + np.arange(n)[None, :]).reshape(-1)
+                quads = np.stack([a, a + n + 1, a + n + 2, a + 1], axis=1)
+                _write_block(f, 'f', np.repeat(quads, 2, axis=1), ' '.join(['%d//%d'] * 4))
+
+
+def write_grid_obj(filename, n, triangles=False, amplitude=0.1):
+    """Menulis grid permukaan bergelombang n x n (quad atau 2 segitiga per sel)."""
+    ticks = np.linspace(-1.0, 1.0, n + 1)
+    with open(filename, 'w') as f:
+        faces = n * n * (2 if triangles else 1)
+        f.write(f"# Grid sintetis, n = {n}\n# Vertices: {(n + 1) ** 2}\n# Faces: {faces}\n")
+        for start in range(0, n + 1, ROWS_PER_BLOCK):
+            rows = ticks[start:start + ROWS_PER_BLOCK]
+            x, z = np.meshgrid(ticks, rows)
+            y = amplitude * np.sin(x * 2 * pi) * np.cos(z * 2 * pi)
+            _write_block(f, 'v', np.stack([x, y, z], axis=-1).reshape(-1, 3), '%.6f %.6f %.6f')
+
+        for start in range(0, n, ROWS_PER_BLOCK):
+            rows = np.arange(start, min(start + ROWS_PER_BLOCK, n))
+            a = (1 + rows[:, None] * (n + 1) + np.arange(n)[None, :]).reshape(-1)
+            if triangles:
+                tris = np.stack([a, a + n + 1, a + n + 2, a, a + n + 2, a + 1], axis=1).reshape(-1, 3)
+                _write_block(f, 'f', tris, '%d %d %d')
+            else:
+                _write_block(f, 'f', np.stack([a, a + n + 1, a + n + 2, a + 1], axis=1), '%d %d %d %d')
+
+
+def sphere_size_for_faces(faces):
+    """Nilai n cube-sphere terkecil yang menghasilkan setidaknya `faces` face."""
+    n = 1
+    while 6 * n * n < faces:
+        n += 1
+    return n
+
+
+# =============================================================================
+# 3. FUNGSI MAIN
+# =============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generator data sintetis untuk aplikasi grafika 2D/3D")
+    parser.add_argument("kind", choices=["scene2d", "sphere", "grid"], help="jenis data")
+    parser.add_argument("size", type=int, help="jumlah objek (scene2d) atau resolusi n (sphere/grid)")
+    parser.add_argument("output", help="file keluaran (.json atau .obj)")
+    parser.add_argument("--seed", type=int, default=0, help="seed acak untuk scene2d")
+    parser.add_argument("--triangles", action="store_true", help="grid dengan segitiga alih-alih quad")
+    args = parser.parse_args(argv)
+
+    if args.kind == "scene2d":
+        write_2d_scene(args.output, generate_2d_scene(args.size, args.seed))
+    elif args.kind == "sphere":
+        write_sphere_obj(args.output, args.size)
+    else:
+        write_grid_obj(args.output, args.size, args.triangles)
+    print(f"Data '{args.kind}' ukuran {args.size} ditulis ke '{args.output}'.")
+
+
+if __name__ == "__main__":
+    main()
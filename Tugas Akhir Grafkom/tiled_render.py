@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+Render Resolusi Tinggi Berbasis Tile untuk Aplikasi Grafika 2D dan 3D
+
+Deskripsi:
+Resolusi window dibatasi oleh layar, sedangkan poster bisa membutuhkan
+gambar selebar 16000 piksel atau lebih. Modul ini membagi gambar target
+menjadi tile seukuran framebuffer offscreen (FBO). Aplikasi menggambar
+setiap tile dengan proyeksi yang dipersempit ke area tile tersebut
+(gluOrtho2D untuk 2D, glFrustum bagian dari gluPerspective untuk 3D).
+
+Tile dibaca per baris tile dari atas ke bawah, digabung menjadi satu strip,
+lalu strip ditulis ke file PNG (atau PPM) oleh thread penulis sementara
+GPU menggambar baris tile berikutnya. Gambar utuh tidak pernah ada di
+memori; paling banyak dua strip yang tertahan.
+
+Contoh:
+    def render_tile(x0, y0, x1, y1, width, height):
+        ...  # atur proyeksi untuk area piksel [x0, x1) x [y0, y1), lalu gambar
+    render_tiled("poster.png", 16384, 9216, render_tile)
+"""
+
+import sys
+import zlib
+import struct
+import queue
+import threading
+from math import tan, radians
+
+import gl_loader
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: NumPy tidak terinstal.")
+    print("Silakan instal dengan perintah: pip install numpy")
+    sys.exit(1)
+
+# Nama GL diikat saat aplikasi memuat PyOpenGL (lihat gl_loader.py)
+gl_loader.bind(globals())
+
+# Ukuran tile default (dibatasi lagi oleh batas viewport/renderbuffer driver)
+DEFAULT_TILE_SIZE = 1024
+
+
+# =============================================================================
+# 1. PENULIS GAMBAR BERTAHAP
+# =============================================================================
+
+class PNGWriter:
+    """Menulis PNG RGB 8-bit baris demi baris; data dikompresi ke beberapa chunk IDAT."""
+
+    def __init__(self, filename, width, height):
+        self.file = open(filename, 'wb')
+        self.compressor = zlib.compressobj(6)
+        self.file.write(b'\x89PNG\r\n\x1a\n')
+        self._chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+
+    def _chunk(self, tag, data):
+        self.file.write(struct.pack('>I', len(data)) + tag + data)
+        self.file.write(struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff))
+
+    def write_rows(self, rows):
+        """Menulis array (n, width, 3) uint8, baris paling atas lebih dulu."""
+        # Setiap baris PNG diawali byte filter (0 = tanpa filter)
+        filtered = np.zeros((rows.shape[0], rows.shape[1] * 3 + 1), dtype=np.uint8)
+        filtered[:, 1:] = rows.reshape(rows.shape[0], -1)
+        data = self.compressor.compress(filtered.tobytes())
+        if data: self._chunk(b'IDAT', data)
+
+    def close(self):
+        self._chunk(b'IDAT', self.compressor.flush())
+        self._chunk(b'IEND', b'')
+        self.file.close()
+
+
+class PPMWriter:
+    """Menulis PPM biner (P6) baris demi baris, tanpa kompresi."""
+
+    def __init__(self, filename, width, height):
+        self.file = open(filename, 'wb')
+        self.file.write(f'P6\n{width} {height}\n255\n'.encode('ascii'))
+
+    def write_rows(self, rows):
+        self.file.write(rows.tobytes())
+
+    def close(self):
+        self.file.close()
+
+
+def open_image_writer(filename, width, height):
+    """Membuat penulis gambar sesuai ekstensi file (.png atau .ppm)."""
+    if filename.lower().endswith('.png'):
+        return PNGWriter(filename, width, height)
+    if filename.lower().endswith('.ppm'):
+        return PPMWriter(filename, width, height)
+    raise ValueError("ekstensi file harus .png atau .ppm")
+
+
+# =============================================================================
+# 2. PROYEKSI PER TILE
+# =============================================================================
+
+def tile_frustum(fovy, near, far, x0, y0, x1, y1, width, height):
+    """Memasang glFrustum untuk tile [x0, x1) x [y0, y1) dari gluPerspective(fovy, width/height, near, far)."""
+    top = near * tan(radians(fovy) / 2.0)
+    right = top * width / float(height)
+    glFrustum(-right + 2 * right * x0 / width, -right + 2 * right * x1 / width,
+              -top + 2 * top * y0 / height, -top + 2 * top * y1 / height, near, far)
+
+
+# =============================================================================
+# 3. RENDER TILE
+# =============================================================================
+
+def _writer_loop(writer, strips, errors):
+    """Thread penulis: menulis strip dari antrean sampai menerima None.
+
+    Error penulisan dicatat di `errors` dan strip berikutnya tetap diambil
+    agar thread render tidak tertahan di antrean.
+    """
+    while True:
+        strip = strips.get()
+        if strip is None: break
+        if not errors:
+            try:
+                writer.write_rows(strip)
+            except OSError as e:
+                errors.append(e)
+
+
+def render_tiled(filename, width, height, render_tile, tile_size=DEFAULT_TILE_SIZE, margin=0):
+    """Menggambar gambar width x height per tile dan menulisnya ke `filename`.
+
+    `render_tile(x0, y0, x1, y1, width, height)` dipanggil dengan viewport dan
+    FBO tile sudah terpasang; fungsi itu hanya perlu mengatur proyeksi untuk
+    area piksel tersebut (asal kiri bawah, seperti OpenGL) lalu menggambar.
+    Viewport dan framebuffer dikembalikan setelah selesai; proyeksi window
+    harus dipulihkan oleh pemanggil (mis. dengan memanggil reshape).
+
+    `margin` memperluas area setiap tile lalu memotongnya kembali, agar titik
+    besar yang pusatnya berada di tile tetangga tidak hilang di tepi tile.
+    """
+    max_w, max_h = glGetIntegerv(GL_MAX_VIEWPORT_DIMS)
+    limit = min(int(max_w), int(max_h), int(glGetIntegerv(GL_MAX_RENDERBUFFER_SIZE)))
+    margin = min(margin, (limit - 1) // 4)
+    tile_w = min(tile_size, width, limit - 2 * margin)
+    tile_h = min(tile_size, height, limit - 2 * margin)
+
+    writer = open_image_writer(filename, width, height)
+    color_rbo, depth_rbo = glGenRenderbuffers(2)
+    glBindRenderbuffer(GL_RENDERBUFFER, color_rbo)
+    glRenderbufferStorage(GL_RENDERBUFFER, GL_RGBA8, tile_w + 2 * margin, tile_h + 2 * margin)
+    glBindRenderbuffer(GL_RENDERBUFFER, depth_rbo)
+    glRenderbufferStorage(GL_RENDERBUFFER, GL_DEPTH_COMPONENT24, tile_w + 2 * margin, tile_h + 2 * margin)
+    fbo = glGenFramebuffers(1)
+    glBindFramebuffer(GL_FRAMEBUFFER, fbo)
+    glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_RENDERBUFFER, color_rbo)
+    glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_DEPTH_ATTACHMENT, GL_RENDERBUFFER, depth_rbo)
+    viewport = glGetIntegerv(GL_VIEWPORT)
+
+    strips = queue.Queue(maxsize=1)
+    errors = []
+    thread = threading.Thread(target=_writer_loop, args=(writer, strips, errors), daemon=True)
+    thread.start()
+    try:
+        if glCheckFramebufferStatus(GL_FRAMEBUFFER) != GL_FRAMEBUFFER_COMPLETE:
+            raise RuntimeError("framebuffer offscreen tidak didukung")
+        glPixelStorei(GL_PACK_ALIGNMENT, 1)
+        # Baris tile dari atas ke bawah karena PNG/PPM menyimpan baris teratas lebih dulu
+        for y1 in range(height, 0, -tile_h):
+            y0 = max(0, y1 - tile_h)
+            strip = np.empty((y1 - y0, width, 3), dtype=np.uint8)
+            for x0 in range(0, width, tile_w):
+                x1 = min(width, x0 + tile_w)
+                glViewport(0, 0, x1 - x0 + 2 * margin, y1 - y0 + 2 * margin)
+                render_tile(x0 - margin, y0 - margin, x1 + margin, y1 + margin, width, height)
+                pixels = glReadPixels(margin, margin, x1 - x0, y1 - y0, GL_RGB, GL_UNSIGNED_BYTE)
+                tile = np.frombuffer(pixels, dtype=np.uint8).reshape(y1 - y0, x1 - x0, 3)
+                strip[:, x0:x1] = tile[::-1]
+            strips.put(strip)
+    finally:
+        strips.put(None)
+        thread.join()
+        writer.close()
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        glDeleteFramebuffers(1, [fbo])
+        glDeleteRenderbuffers(2, [color_rbo, depth_rbo])
+        glViewport(*viewport)
+    if errors:
+        raise errors[0]
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+Export Vektor Scene 2D ke SVG dan PDF
+
+Deskripsi:
+Menulis objek Canvas (engine_2d) ke file SVG atau PDF dengan transformasi
+setiap objek sudah diterapkan ke koordinatnya, dan opsional dipotong oleh
+clipping window (Cohen-Sutherland per segmen). Hasilnya tidak bergantung
+pada resolusi window.
+
+File ditulis secara streaming: koordinat dihasilkan satu per satu oleh
+generator dan langsung ditulis (PDF dikompresi dengan zlib secara
+bertahap), sehingga scene dengan jutaan titik freehand tidak perlu
+ditampung sebagai teks di memori. Objek berurutan dengan gaya yang sama
+(warna dan ketebalan) digabung menjadi satu path, dan segmen yang
+bersambung tidak memulai subpath baru.
+
+Warna yang ditulis adalah warna asli objek; sorotan seleksi dan warna hijau
+"di dalam window" hanya penanda di editor.
+
+Contoh:
+    python vector_export.py gambar.json poster.svg
+    python vector_export.py gambar.json poster.pdf --clip --size 1920 1080
+"""
+
+import sys
+import zlib
+import argparse
+from math import sin, cos, pi, radians
+
+from engine_2d import Canvas, get_object_center, cohen_sutherland_clip
+
+# Jumlah segmen elips, sama dengan draw_ellipse di Modul_A_2D
+ELLIPSE_SEGMENTS = 100
+
+# Jumlah potongan teks yang dikumpulkan sebelum ditulis ke file
+FLUSH_EVERY = 4096
+
+
+# =============================================================================
+# 1. GEOMETRI OBJEK DALAM KOORDINAT DUNIA
+# =============================================================================
+
+def get_object_matrix(obj, vertices=None):
+    """Matriks affine (a, b, c, d, e, f) transformasi objek: x' = a*x + c*y + e, y' = b*x + d*y + f.
+
+    `vertices` (opsional) adalah obj['vertices'] yang sudah dibaca.
+    """
+    tr = obj['transform']
+    cx, cy = get_object_center(obj, vertices)
+    angle_rad = radians(tr['rotate'])
+    cos_a, sin_a = cos(angle_rad), sin(angle_rad)
+    a, b = cos_a * tr['scale'][0], sin_a * tr['scale'][0]
+    c, d = -sin_a * tr['scale'][1], cos_a * tr['scale'][1]
+    e = cx + tr['translate'][0] - (a * cx + c * cy)
+    f = cy + tr['translate'][1] - (b * cx + d * cy)
+    return a, b, c, d, e, f
+
+
+def get_object_outline(obj, vertices=None):
+    """Titik-titik lokal objek sebagai polyline (tertutup untuk persegi dan elips)."""
+    if vertices is None: vertices = obj['vertices']
+    if obj['type'] == 'rectangle':
+        (x1, y1), (x2, y2) = vertices[0], vertices[1]
+        return [(x1, y1), (x2, y1), (x2, y2), (x1, y2), (x1, y1)]
+    if obj['type'] == 'ellipse':
+        (center_x, center_y), (px, py) = vertices[0], vertices[1]
+        rx, ry = abs(px - center_x), abs(py - center_y)
+        return [(rx * cos(2.0 * pi * i / ELLIPSE_SEGMENTS) + center_x,
+                 ry * sin(2.0 * pi * i / ELLIPSE_SEGMENTS) + center_y) for i in range(ELLIPSE_SEGMENTS + 1)]
+    return vertices
+
+
+def iter_path_events(canvas, clip=False):
+    """Menghasilkan (gaya, op, x, y) untuk semua objek dalam koordinat dunia.
+
+    Gaya adalah ('stroke', warna, ketebalan) atau ('fill', warna, ukuran titik);
+    op adalah 'M' (mulai subpath), 'L' (garis ke titik), atau 'P' (titik).
+    """
+    window = canvas.clipping_window
+    clip = clip and window['active']
+    store = canvas.objects
+    for obj in store:
+        # Vertex objek disalin sekali dari buffer store dan dipakai untuk pusat dan outline-nya
+        vertices = store.vertices(obj.index).tolist()
+        if not vertices: continue
+        a, b, c, d, e, f = get_object_matrix(obj, vertices)
+        if obj['type'] == 'point':
+            x, y = vertices[0]
+            x, y = a * x + c * y + e, b * x + d * y + f
+            if not clip or canvas.point_in_window(x, y):
+                yield ('fill', tuple(obj['color']), obj['thickness'] * 5), 'P', x, y
+            continue
+
+        style = ('stroke', tuple(obj['color']), obj['thickness'])
+        prev = None
+        pen_at = None  # ujung subpath yang sedang ditulis; None jika pena terangkat
+        for vx, vy in get_object_outline(obj, vertices):
+            x, y = a * vx + c * vy + e, b * vx + d * vy + f
+            if prev is None:
+                prev = (x, y)
+                continue
+            x1, y1 = prev
+            prev = (x, y)
+            if clip:
+                visible, x1, y1, x2, y2 = cohen_sutherland_clip(x1, y1, x, y, window)
+                if not visible:
+                    pen_at = None
+                    continue
+            else:
+                x2, y2 = x, y
+            if pen_at != (x1, y1):
+                yield style, 'M', x1, y1
+            yield style, 'L', x2, y2
+            pen_at = (x2, y2)
+
+
+# =============================================================================
+# 2. PENULIS SVG DAN PDF
+# =============================================================================
+
+def _hex_color(color):
+    return '#%02x%02x%02x' % tuple(max(0, min(255, int(round(v * 255)))) for v in color)
+
+
+def _write_svg(out, canvas, width, height, clip):
+    """Menulis dokumen SVG ke stream teks `out`. Sumbu y dibalik (asal kiri atas)."""
+    out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    out.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+              f'viewBox="0 0 {width} {height}">\n')
+    out.write(f'<rect width="{width}" height="{height}" fill="#ffffff"/>\n')
+    chunks = []
+    current = None
+    last = None
+    for style, op, x, y in iter_path_events(canvas, clip):
+        if style != current:
+            if current is not None: chunks.append('"/>\n')
+            kind, color, size = style
+            if kind == 'fill':
+                chunks.append(f'<path fill="{_hex_color(color)}" d="')
+            else:
+                chunks.append(f'<path fill="none" stroke="{_hex_color(color)}" stroke-width="{size:g}" '
+                              f'stroke-linecap="round" stroke-linejoin="round" d="')
+            current, last = style, None
+        y = height - y
+        if op == 'P':
+            half = style[2] / 2
+            chunks.append(f'M{x - half:.2f} {y - half:.2f}h{style[2]:g}v{style[2]:g}h{-style[2]:g}z')
+        elif op == 'L':
+            chunks.append(f'L{x:.2f} {y:.2f}')
+        elif (x, y) != last:
+            chunks.append(f'M{x:.2f} {y:.2f}')
+        last = (x, y)
+        if len(chunks) >= FLUSH_EVERY:
+            out.write(''.join(chunks)); chunks.clear()
+    if current is not None: chunks.append('"/>\n')
+    chunks.append('</svg>\n')
+    out.write(''.join(chunks))
+
+
+def _pdf_content(canvas, width, height, clip):
+    """Menghasilkan potongan bytes content stream PDF (asal kiri bawah, sama seperti OpenGL)."""
+    chunks = [f'1 1 1 rg 0 0 {width} {height} re f 1 J 1 j\n']
+    current = None
+    last = None
+    for style, op, x, y in iter_path_events(canvas, clip):
+        if style != current:
+            if current is not None: chunks.append('f\n' if current[0] == 'fill' else 'S\n')
+            kind, (r, g, b), size = style
+            if kind == 'fill':
+                chunks.append(f'{r:.3f} {g:.3f} {b:.3f} rg\n')
+            else:
+                chunks.append(f'{r:.3f} {g:.3f} {b:.3f} RG {size:g} w\n')
+            current, last = style, None
+        if op == 'P':
+            half = style[2] / 2
+            chunks.append(f'{x - half:.2f} {y - half:.2f} {style[2]:g} {style[2]:g} re\n')
+        elif op == 'L':
+            chunks.append(f'{x:.2f} {y:.2f} l\n')
+        elif (x, y) != last:
+            chunks.append(f'{x:.2f} {y:.2f} m\n')
+        last = (x, y)
+        if len(chunks) >= FLUSH_EVERY:
+            yield ''.join(chunks).encode('ascii'); chunks.clear()
+    if current is not None: chunks.append('f\n' if current[0] == 'fill' else 'S\n')
+    yield ''.join(chunks).encode('ascii')
+
+
+def _write_pdf(out, canvas, width, height, clip):
+    """Menulis dokumen PDF satu halaman ke stream biner `out`.
+
+    Panjang content stream baru diketahui setelah streaming selesai, sehingga
+    ditulis sebagai objek tidak langsung (5 0 R) setelah stream.
+    """
+    offsets = []
+
+    def begin_object(number):
+        offsets.append(out.tell())
+        out.write(f'{number} 0 obj\n'.encode('ascii'))
+
+    out.write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+    begin_object(1); out.write(b'<< /Type /Catalog /Pages 2 0 R >>\nendobj\n')
+    begin_object(2); out.write(b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>\nendobj\n')
+    begin_object(3)
+    out.write(f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {width} {height}] '
+              f'/Resources << >> /Contents 4 0 R >>\nendobj\n'.encode('ascii'))
+    begin_object(4)
+    out.write(b'<< /Length 5 0 R /Filter /FlateDecode >>\nstream\n')
+    start = out.tell()
+    compressor = zlib.compressobj()
+    for chunk in _pdf_content(canvas, width, height, clip):
+        out.write(compressor.compress(chunk))
+    out.write(compressor.flush())
+    length = out.tell() - start
+    out.write(b'\nendstream\nendobj\n')
+    begin_object(5); out.write(f'{length}\nendobj\n'.encode('ascii'))
+
+    xref = out.tell()
+    out.write(f'xref\n0 {len(offsets) + 1}\n0000000000 65535 f \n'.encode('ascii'))
+    for offset in offsets:
+        out.write(f'{offset:010d} 00000 n \n'.encode('ascii'))
+    out.write(f'trailer\n<< /Size {len(offsets) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode('ascii'))
+
+
+def export_vector(canvas, filename, width=1280, height=720, clip=False):
+    """Mengekspor canvas ke .svg atau .pdf (ditentukan dari ekstensi file)."""
+    if filename.lower().endswith('.pdf'):
+        with open(filename, 'wb') as f:
+            _write_pdf(f, canvas, width, height, clip)
+    elif filename.lower().endswith('.svg'):
+        with open(filename, 'w', encoding='utf-8') as f:
+            _write_svg(f, canvas, width, height, clip)
+    else:
+        raise ValueError("ekstensi file harus .svg atau .pdf")
+
+
+# =============================================================================
+# 3. FUNGSI MAIN
+# =============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export scene 2D (.json) ke SVG atau PDF")
+    parser.add_argument("scene", help="file scene .json dari Modul_A_2D")
+    parser.add_argument("output", help="file keluaran (.svg atau .pdf)")
+    parser.add_argument("--clip", action="store_true", help="potong objek dengan clipping window scene")
+    parser.add_argument("--size", nargs=2, type=int, default=[1280, 720], metavar=("W", "H"),
+                        help="ukuran halaman dalam piksel (default 1280 720)")
+    args = parser.parse_args(argv)
+
+    canvas = Canvas()
+    try:
+        canvas.load_scene(args.scene)
+        export_vector(canvas, args.output, args.size[0], args.size[1], args.clip)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    print(f"{len(canvas.objects)} objek diekspor ke '{args.output}'.")
+
+
+if __name__ == "__main__":
+    main()